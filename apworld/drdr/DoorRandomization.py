@@ -5,27 +5,14 @@ Door Randomization Logic for Dead Rising Deluxe Remaster Archipelago
 Ensures all areas remain reachable, no softlocks, and the game stays completable.
 """
 
-from typing import Dict, List, Set, Tuple, Optional
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Set, Tuple, Optional
 import random
 
-
-@dataclass
-class DoorEndpoint:
-    door_id: str
-    from_area: str
-    to_area: str
-    position: Tuple[float, float, float]
-    angle: Tuple[float, float, float]
-    door_no: int = 0
-
-
-@dataclass
-class AreaInfo:
-    code: str
-    name: str
-    outgoing_doors: List[str]
-    incoming_doors: List[str]
+try:
+    from .shared_data import DOORS
+except ImportError:  # run as a script (python DoorRandomization.py / DoorVisualizer.py)
+    from shared_data import DOORS
 
 
 AREA_NAMES = {
@@ -96,12 +83,160 @@ SR_EP_EDGES: Set[Tuple[str, str]] = {
 
 START_AREA = "s136"
 
+# Placeholder geometry for the Seon's Food and Stuff connections, for door
+# tables that lack them (see DoorRandomizer.add_missing_doors).
+MISSING_DOOR_DATA = {
+    "SCN_s400|s500|door0": {"from_area_code": "s400", "to_area_code": "s500", "door_no": 0,
+                            "position": {"x": 0, "y": 5, "z": -180}, "angle": {"x": 0, "y": 1.5, "z": 0}},
+    "SCN_s500|s400|door0": {"from_area_code": "s500", "to_area_code": "s400", "door_no": 0,
+                            "position": {"x": 0, "y": 0, "z": 0}, "angle": {"x": 0, "y": -1.5, "z": 0}},
+    "SCN_s500|s600|door0": {"from_area_code": "s500", "to_area_code": "s600", "door_no": 0,
+                            "position": {"x": 0, "y": 0, "z": 50}, "angle": {"x": 0, "y": 0, "z": 0}},
+    "SCN_s600|s500|door0": {"from_area_code": "s600", "to_area_code": "s500", "door_no": 0,
+                            "position": {"x": -100, "y": 0, "z": 0}, "angle": {"x": 0, "y": 3.14, "z": 0}},
+}
+
+
+class CompiledDoor(NamedTuple):
+    """One door of a DoorTable. from_area/to_area are scene codes; the
+    *_index fields are the same areas as DoorTable area indices."""
+    index: int
+    door_id: str
+    from_area: str
+    to_area: str
+    from_index: int
+    to_index: int
+    door_no: int
+    position: Tuple[float, float, float]
+    angle: Tuple[float, float, float]
+    # Index of the to_area -> from_area door with the same door_no, or -1.
+    reverse: int
+
+
+class CompiledArea(NamedTuple):
+    index: int
+    code: str
+    name: str
+    outgoing_doors: Tuple[str, ...]
+    incoming_doors: Tuple[str, ...]
+    # outgoing_doors as door indices.
+    exits: Tuple[int, ...]
+
+
+class DoorTable:
+    """A door set compiled once into integer-indexed, read-only records.
+
+    Doors are numbered in table order and areas in AREA_NAMES order (codes
+    AREA_NAMES doesn't know go last), counting only areas some door touches.
+    With at most a few dozen areas, a set of areas fits in one int bitmask
+    (bit i = area i), which is what the randomizer's reachability checks use.
+    """
+    __slots__ = ("data", "doors", "by_id", "areas", "area_codes", "area_index", "all_areas")
+
+    def __init__(self, door_data: Mapping[str, dict]):
+        self.data: Mapping[str, dict] = MappingProxyType(dict(door_data))
+
+        codes: List[str] = []
+        for info in self.data.values():
+            for code in (info.get("from_area_code", ""), info.get("to_area_code", "")):
+                if code not in codes:
+                    codes.append(code)
+        order = {code: i for i, code in enumerate(AREA_NAMES)}
+        codes.sort(key=lambda code: order.get(code, len(order)))
+        self.area_codes: Tuple[str, ...] = tuple(codes)
+        self.area_index: Mapping[str, int] = MappingProxyType({code: i for i, code in enumerate(codes)})
+        self.all_areas: int = (1 << len(codes)) - 1
+
+        index_of = {door_id: i for i, door_id in enumerate(self.data)}
+        doors = []
+        for i, (door_id, info) in enumerate(self.data.items()):
+            from_area = info.get("from_area_code", "")
+            to_area = info.get("to_area_code", "")
+            door_no = info.get("door_no", 0)
+            pos = info.get("position", {})
+            angle = info.get("angle", {})
+            doors.append(CompiledDoor(
+                index=i,
+                door_id=door_id,
+                from_area=from_area,
+                to_area=to_area,
+                from_index=self.area_index[from_area],
+                to_index=self.area_index[to_area],
+                door_no=door_no,
+                position=(pos.get("x", 0), pos.get("y", 0), pos.get("z", 0)),
+                angle=(angle.get("x", 0), angle.get("y", 0), angle.get("z", 0)),
+                reverse=index_of.get(f"SCN_{to_area}|{from_area}|door{door_no}", -1),
+            ))
+        self.doors: Tuple[CompiledDoor, ...] = tuple(doors)
+        self.by_id: Mapping[str, CompiledDoor] = MappingProxyType({door.door_id: door for door in doors})
+
+        self.areas: Mapping[str, CompiledArea] = MappingProxyType({
+            code: CompiledArea(
+                index=i,
+                code=code,
+                name=AREA_NAMES.get(code, code),
+                outgoing_doors=tuple(door.door_id for door in doors if door.from_index == i),
+                incoming_doors=tuple(door.door_id for door in doors if door.to_index == i),
+                exits=tuple(door.index for door in doors if door.from_index == i),
+            )
+            for i, code in enumerate(codes)
+        })
+
+    def mask_of(self, codes) -> int:
+        """Bitmask of the given area codes (codes not in the table are ignored)."""
+        mask = 0
+        for code in codes:
+            if code in self.area_index:
+                mask |= 1 << self.area_index[code]
+        return mask
+
+    def codes_in(self, mask: int) -> List[str]:
+        return [self.area_codes[i] for i in _bits(mask)]
+
+    def edge_indices(self, edges) -> Set[Tuple[int, int]]:
+        """(from_area, to_area) code pairs as area index pairs."""
+        return {(self.area_index[a], self.area_index[b]) for a, b in edges
+                if a in self.area_index and b in self.area_index}
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Indices of the set bits of mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _reach(adjacency: List[int], start: int) -> int:
+    """Bitmask of the areas reachable from the areas in start, where
+    adjacency[i] is the bitmask of the areas area i leads to."""
+    reached = start
+    frontier = start
+    while frontier:
+        low = frontier & -frontier
+        frontier ^= low
+        new = adjacency[low.bit_length() - 1] & ~reached
+        reached |= new
+        frontier |= new
+    return reached
+
+
+def _find(parent: List[int], area: int) -> int:
+    """Union-find root of area, halving the path on the way."""
+    while parent[area] != area:
+        parent[area] = parent[parent[area]]
+        area = parent[area]
+    return area
+
+
+def _union(parent: List[int], a: int, b: int) -> None:
+    parent[_find(parent, a)] = _find(parent, b)
+
 
 class DoorRandomizer:
-    def __init__(self, seed: Optional[int] = None):
+    def __init__(self, seed: Optional[int] = None, table: Optional[DoorTable] = None):
         self.rng = random.Random(seed)
-        self.doors: Dict[str, DoorEndpoint] = {}
-        self.areas: Dict[str, AreaInfo] = {}
+        self.table: DoorTable = table if table is not None else DoorTable({})
         self.redirects: Dict[str, str] = {}
         # Ordered pairs (from_area, to_area) of directed edges that should NOT
         # be randomized — they keep their vanilla destinations. Both directions
@@ -112,6 +247,18 @@ class DoorRandomizer:
         # populates this with SR_EP_EDGES so the player's now-walkable
         # Security Room <-> Entrance Plaza path joins the door pool.
         self.scoop_sanity_unlocked_edges: Set[Tuple[str, str]] = set()
+        # Layouts tried and reseeds taken by the randomize_* calls so far
+        # (reported by tools/bench_doors.py).
+        self.attempts = 0
+        self.reseeds = 0
+
+    @property
+    def doors(self) -> Mapping[str, CompiledDoor]:
+        return self.table.by_id
+
+    @property
+    def areas(self) -> Mapping[str, CompiledArea]:
+        return self.table.areas
 
     def set_excluded_edges(self, edges: Set[Tuple[str, str]]) -> None:
         self.excluded_edges = set(edges)
@@ -124,81 +271,33 @@ class DoorRandomizer:
 
     def load_doors_from_json(self, door_data: dict) -> None:
         doors_dict = door_data.get("doors", door_data)
-
-        for door_id, door_info in doors_dict.items():
-            from_area = door_info.get("from_area_code", "")
-            to_area = door_info.get("to_area_code", "")
-            pos = door_info.get("position", {})
-            angle = door_info.get("angle", {})
-
-            endpoint = DoorEndpoint(
-                door_id=door_id,
-                from_area=from_area,
-                to_area=to_area,
-                position=(pos.get("x", 0), pos.get("y", 0), pos.get("z", 0)),
-                angle=(angle.get("x", 0), angle.get("y", 0), angle.get("z", 0)),
-                door_no=door_info.get("door_no", 0)
-            )
-
-            self.doors[door_id] = endpoint
-
-            if from_area not in self.areas:
-                self.areas[from_area] = AreaInfo(
-                    code=from_area, name=AREA_NAMES.get(from_area, from_area),
-                    outgoing_doors=[], incoming_doors=[]
-                )
-            if to_area not in self.areas:
-                self.areas[to_area] = AreaInfo(
-                    code=to_area, name=AREA_NAMES.get(to_area, to_area),
-                    outgoing_doors=[], incoming_doors=[]
-                )
-
-            self.areas[from_area].outgoing_doors.append(door_id)
-            self.areas[to_area].incoming_doors.append(door_id)
+        if doors_dict is EMBEDDED_DOOR_DATA and not self.table.doors:
+            self.table = DOOR_TABLE
+        else:
+            self.table = DoorTable({**self.table.data, **doors_dict})
 
     def add_missing_doors(self) -> None:
         """Add placeholder data for missing doors (Seon's Food and Stuff connections)."""
-        missing_doors = [
-            DoorEndpoint("SCN_s400|s500|door0", "s400", "s500", (0, 5, -180), (0, 1.5, 0), 0),
-            DoorEndpoint("SCN_s500|s400|door0", "s500", "s400", (0, 0, 0), (0, -1.5, 0), 0),
-            DoorEndpoint("SCN_s500|s600|door0", "s500", "s600", (0, 0, 50), (0, 0, 0), 0),
-            DoorEndpoint("SCN_s600|s500|door0", "s600", "s500", (-100, 0, 0), (0, 3.14, 0), 0),
-        ]
-
-        for door in missing_doors:
-            if door.door_id not in self.doors:
-                self.doors[door.door_id] = door
-
-                if door.from_area not in self.areas:
-                    self.areas[door.from_area] = AreaInfo(
-                        code=door.from_area, name=AREA_NAMES.get(door.from_area, door.from_area),
-                        outgoing_doors=[], incoming_doors=[]
-                    )
-                if door.to_area not in self.areas:
-                    self.areas[door.to_area] = AreaInfo(
-                        code=door.to_area, name=AREA_NAMES.get(door.to_area, door.to_area),
-                        outgoing_doors=[], incoming_doors=[]
-                    )
-
-                self.areas[door.from_area].outgoing_doors.append(door.door_id)
-                self.areas[door.to_area].incoming_doors.append(door.door_id)
+        missing = {door_id: info for door_id, info in MISSING_DOOR_DATA.items()
+                   if door_id not in self.table.by_id}
+        if missing:
+            self.table = DoorTable({**self.table.data, **missing})
 
     def get_door_pairs(self) -> List[Tuple[str, str]]:
         """Find bidirectional door pairs (A->B and B->A)."""
         pairs = []
         seen = set()
 
-        for door_id, door in self.doors.items():
-            if door_id in seen:
+        for door in self.table.doors:
+            if door.index in seen:
                 continue
-            reverse_pattern = f"SCN_{door.to_area}|{door.from_area}|door{door.door_no}"
-            if reverse_pattern in self.doors:
-                pairs.append((door_id, reverse_pattern))
-                seen.add(door_id)
-                seen.add(reverse_pattern)
+            if door.reverse >= 0:
+                pairs.append((door.door_id, self.table.doors[door.reverse].door_id))
+                seen.add(door.index)
+                seen.add(door.reverse)
             else:
-                pairs.append((door_id, None))
-                seen.add(door_id)
+                pairs.append((door.door_id, None))
+                seen.add(door.index)
 
         return pairs
 
@@ -209,19 +308,66 @@ class DoorRandomizer:
         Edges in `scoop_sanity_unlocked_edges` bypass the PROTECTED_AREAS
         check — they're explicitly opted in by the caller (currently used for
         SR <-> EP under ScoopSanity)."""
+        return [self.table.doors[i].door_id for i in self._randomizable()]
+
+    def _randomizable(self) -> List[int]:
+        """get_randomizable_doors as door indices."""
         out = []
-        for door_id, door in self.doors.items():
+        for door in self.table.doors:
             edge = (door.from_area, door.to_area)
             if edge in self.excluded_edges:
                 continue
             if edge in self.scoop_sanity_unlocked_edges:
-                out.append(door_id)
+                out.append(door.index)
                 continue
             if door.from_area in PROTECTED_AREAS or door.to_area in PROTECTED_AREAS:
                 continue
-            out.append(door_id)
+            out.append(door.index)
         return out
 
+    def _blocked_edges(self) -> Set[Tuple[int, int]]:
+        """NARRATIVE_ONLY_EDGES not unlocked by scoop_sanity_unlocked_edges,
+        as area index pairs."""
+        return self.table.edge_indices(NARRATIVE_ONLY_EDGES - self.scoop_sanity_unlocked_edges)
+
+    def _adjacency(self, redirects: Dict[int, int]) -> List[int]:
+        """Walkable area graph as one bitmask of destinations per area, with
+        door i leading where door redirects[i] does."""
+        doors = self.table.doors
+        blocked = self._blocked_edges()
+        adjacency = [0] * len(self.table.area_codes)
+        for door in doors:
+            to_index = doors[redirects[door.index]].to_index if door.index in redirects else door.to_index
+            if (door.from_index, to_index) in blocked:
+                continue
+            adjacency[door.from_index] |= 1 << to_index
+        return adjacency
+
+    def _is_valid(self, adjacency: List[int], paired: bool = False) -> bool:
+        """is_fully_connected and can_escape_all_areas (and, when paired,
+        is_bidirectional) on a bitmask graph from _adjacency."""
+        table = self.table
+        if START_AREA not in table.area_index:
+            return False
+        if _reach(adjacency, 1 << table.area_index[START_AREA]) != table.all_areas:
+            return False
+        protected = table.mask_of(PROTECTED_AREAS)
+        for area in _bits(table.all_areas & ~protected):
+            if not adjacency[area]:
+                return False
+            if paired:
+                bit = 1 << area
+                for to_area in _bits(adjacency[area] & ~protected):
+                    if not adjacency[to_area] & bit:
+                        return False
+        return True
+
+    def _set_redirects(self, redirects: Dict[int, int]) -> Dict[str, str]:
+        doors = self.table.doors
+        self.redirects = {doors[source].door_id: doors[target].door_id
+                          for source, target in redirects.items()}
+        return self.redirects
+
     def build_adjacency_graph(self, use_redirects: bool = False) -> Dict[str, Set[str]]:
         """Build area connection graph, optionally following redirects.
 
@@ -231,37 +377,22 @@ class DoorRandomizer:
         `scoop_sanity_unlocked_edges` are walkable and counted normally,
         even if they're also listed in NARRATIVE_ONLY_EDGES.
         """
-        graph: Dict[str, Set[str]] = {area: set() for area in self.areas}
-
-        for door_id, door in self.doors.items():
-            if use_redirects and door_id in self.redirects:
-                target_door = self.doors[self.redirects[door_id]]
-                edge = (door.from_area, target_door.to_area)
-            else:
-                edge = (door.from_area, door.to_area)
-            if edge in NARRATIVE_ONLY_EDGES and edge not in self.scoop_sanity_unlocked_edges:
-                continue
-            graph[edge[0]].add(edge[1])
-
-        return graph
+        redirects: Dict[int, int] = {}
+        if use_redirects:
+            by_id = self.table.by_id
+            redirects = {by_id[source].index: by_id[target].index
+                         for source, target in self.redirects.items()}
+        adjacency = self._adjacency(redirects)
+        return {code: set(self.table.codes_in(adjacency[i]))
+                for i, code in enumerate(self.table.area_codes)}
 
     def is_fully_connected(self, graph: Dict[str, Set[str]], start: str = START_AREA) -> bool:
-        """BFS check that all areas are reachable from start."""
-        if start not in graph:
+        """Check that all areas are reachable from start."""
+        table = self.table
+        if start not in graph or start not in table.area_index:
             return False
-
-        visited = set()
-        queue = [start]
-        while queue:
-            current = queue.pop(0)
-            if current in visited:
-                continue
-            visited.add(current)
-            for neighbor in graph.get(current, set()):
-                if neighbor not in visited:
-                    queue.append(neighbor)
-
-        return visited >= set(self.areas.keys())
+        adjacency = [table.mask_of(graph.get(code, ())) for code in table.area_codes]
+        return _reach(adjacency, 1 << table.area_index[start]) == table.all_areas
 
     def can_escape_all_areas(self, graph: Dict[str, Set[str]]) -> bool:
         """Check every non-protected area has at least one exit."""
@@ -272,6 +403,18 @@ class DoorRandomizer:
                 return False
         return True
 
+    def is_bidirectional(self, graph: Dict[str, Set[str]]) -> bool:
+        """Check every edge between non-protected areas has its reverse."""
+        for from_area, to_areas in graph.items():
+            if from_area in PROTECTED_AREAS:
+                continue
+            for to_area in to_areas:
+                if to_area in PROTECTED_AREAS:
+                    continue
+                if from_area not in graph.get(to_area, set()):
+                    return False
+        return True
+
     def generate_spanning_tree_redirects(self) -> Dict[str, str]:
         """Generate redirects forming a spanning tree to ensure connectivity."""
         connected = {START_AREA}
@@ -305,129 +448,88 @@ class DoorRandomizer:
         Randomize doors in bidirectional paired mode using 4-door swaps.
         If A->B and C->D swap, return paths D->A and B->C are also created.
         """
-        randomizable_doors = list(self.get_randomizable_doors())
-
-        door_info = {}
-        doors_from_area = {}
-        for door_id in randomizable_doors:
-            door = self.doors[door_id]
-            door_info[door_id] = (door.from_area, door.to_area)
-            if door.from_area not in doors_from_area:
-                doors_from_area[door.from_area] = []
-            doors_from_area[door.from_area].append(door_id)
-
-        templates: Dict[str, Dict[str, str]] = {}
-        for door_id, door in self.doors.items():
-            if door.from_area not in templates:
-                templates[door.from_area] = {}
-            if door.to_area not in templates[door.from_area]:
-                templates[door.from_area][door.to_area] = door_id
+        doors = self.table.doors
+        randomizable_doors = self._randomizable()
+
+        doors_from_area: Dict[int, List[int]] = {}
+        for door in randomizable_doors:
+            doors_from_area.setdefault(doors[door].from_index, []).append(door)
 
         for attempt in range(max_attempts):
-            self.redirects = {}
+            self.attempts += 1
+            redirects: Dict[int, int] = {}
 
             shuffled_doors = randomizable_doors.copy()
             self.rng.shuffle(shuffled_doors)
 
             shuffled_doors_from_area = {}
-            for area, doors in doors_from_area.items():
-                shuffled_list = doors.copy()
+            for area, area_doors in doors_from_area.items():
+                shuffled_list = area_doors.copy()
                 self.rng.shuffle(shuffled_list)
                 shuffled_doors_from_area[area] = shuffled_list
 
             used_doors = set()
             swap_count = 0
 
-            for i, door1_id in enumerate(shuffled_doors):
-                if door1_id in used_doors:
+            for i, door1 in enumerate(shuffled_doors):
+                if door1 in used_doors:
                     continue
 
-                from_a, to_b = door_info[door1_id]
+                from_a, to_b = doors[door1].from_index, doors[door1].to_index
 
                 search_order = list(range(i + 1, len(shuffled_doors)))
                 self.rng.shuffle(search_order)
 
                 for j in search_order:
-                    door2_id = shuffled_doors[j]
-                    if door2_id in used_doors:
+                    door2 = shuffled_doors[j]
+                    if door2 in used_doors:
                         continue
 
-                    from_c, to_d = door_info[door2_id]
+                    from_c, to_d = doors[door2].from_index, doors[door2].to_index
 
                     if len({from_a, to_b, from_c, to_d}) < 4:
                         continue
 
                     # Find return path doors
-                    door3_id = None
-                    for d_id in shuffled_doors_from_area.get(to_d, []):
-                        if d_id not in used_doors and d_id != door2_id:
-                            door3_id = d_id
+                    door3 = None
+                    for d in shuffled_doors_from_area.get(to_d, []):
+                        if d not in used_doors and d != door2:
+                            door3 = d
                             break
-                    if not door3_id:
+                    if door3 is None:
                         continue
 
-                    door4_id = None
-                    for d_id in shuffled_doors_from_area.get(to_b, []):
-                        if d_id not in used_doors and d_id != door1_id:
-                            door4_id = d_id
+                    door4 = None
+                    for d in shuffled_doors_from_area.get(to_b, []):
+                        if d not in used_doors and d != door1:
+                            door4 = d
                             break
-                    if not door4_id:
+                    if door4 is None:
                         continue
 
-                    _, to_e = door_info[door3_id]
-                    _, to_f = door_info[door4_id]
-
-                    door1_num = door1_id.split("|")[-1]
-                    door2_num = door2_id.split("|")[-1]
-                    door3_num = door3_id.split("|")[-1]
-                    door4_num = door4_id.split("|")[-1]
-
-                    # Build reverse door IDs for proper spawn positions
-                    reverse3_id = f"SCN_{to_e}|{to_d}|{door3_num}"
-                    reverse1_id = f"SCN_{to_b}|{from_a}|{door1_num}"
-                    reverse4_id = f"SCN_{to_f}|{to_b}|{door4_num}"
-                    reverse2_id = f"SCN_{to_d}|{from_c}|{door2_num}"
-
-                    if not all(r in self.doors for r in [reverse3_id, reverse1_id, reverse4_id, reverse2_id]):
+                    # Reverse doors give the spawn positions
+                    reverse1, reverse2 = doors[door1].reverse, doors[door2].reverse
+                    reverse3, reverse4 = doors[door3].reverse, doors[door4].reverse
+                    if min(reverse1, reverse2, reverse3, reverse4) < 0:
                         continue
 
-                    used_doors.update({door1_id, door2_id, door3_id, door4_id})
+                    used_doors.update({door1, door2, door3, door4})
                     swap_count += 1
 
                     # Apply redirects using reverse door positions for correct spawning
-                    if reverse3_id != door1_id:
-                        self.redirects[door1_id] = reverse3_id
-                    if reverse4_id != door2_id:
-                        self.redirects[door2_id] = reverse4_id
-                    if reverse1_id != door3_id:
-                        self.redirects[door3_id] = reverse1_id
-                    if reverse2_id != door4_id:
-                        self.redirects[door4_id] = reverse2_id
-
-                    break
+                    if reverse3 != door1:
+                        redirects[door1] = reverse3
+                    if reverse4 != door2:
+                        redirects[door2] = reverse4
+                    if reverse1 != door3:
+                        redirects[door3] = reverse1
+                    if reverse2 != door4:
+                        redirects[door4] = reverse2
 
-            graph = self.build_adjacency_graph(use_redirects=True)
-
-            if not self.is_fully_connected(graph):
-                continue
-            if not self.can_escape_all_areas(graph):
-                continue
-
-            # Verify bidirectionality
-            is_bidirectional = True
-            for from_area, to_areas in graph.items():
-                if from_area in PROTECTED_AREAS:
-                    continue
-                for to_area in to_areas:
-                    if to_area in PROTECTED_AREAS:
-                        continue
-                    if from_area not in graph.get(to_area, set()):
-                        is_bidirectional = False
-                        break
-                if not is_bidirectional:
                     break
 
-            if is_bidirectional:
+            if self._is_valid(self._adjacency(redirects), paired=True):
+                self._set_redirects(redirects)
                 print(f"Found valid paired randomization on attempt {attempt + 1} "
                       f"({swap_count} 4-door swaps, {len(self.redirects)} redirects)")
                 return self.redirects
@@ -438,10 +540,130 @@ class DoorRandomizer:
         self.redirects = {}
         return None
 
+    def randomize_paired_constructive(self) -> Dict[str, str]:
+        """
+        Paired mode built valid in one pass, with no rejection sampling.
+
+        Every randomizable door whose reverse is also randomizable is a
+        "portal" on its from-area's side. A layout is a perfect matching of
+        portals: matching p (in A) with q (in D) sends p to D, arriving at q
+        (template = reverse of q), and q to A, arriving at p. Matching a
+        portal with its own reverse leaves both doors vanilla.
+
+        1. Areas joined by doors that stay vanilla (walkable both ways) are
+           merged into components. A vanilla one-way door X -> Y first gets
+           a random X <-> Y portal pair, so the result stays bidirectional.
+        2. The remaining components are attached to the start component in
+           random order, each by matching one random open portal already
+           attached with one random portal of the new component. Dead ends
+           (one portal) are only attached while two or more portals are
+           open, so the open set never runs dry. This is a random spanning
+           tree over components, so every area is reachable from START_AREA.
+        3. The leftover open portals are matched uniformly at random, and
+           pairs inside one area are swapped with another pair.
+
+        Runtime is linear in the door count, up to the swap repair. The
+        distribution differs from randomize_paired: spanning-tree edges are
+        drawn before the rest, so layouts with more portal pairs between
+        distant components are somewhat likelier. An impossible door table
+        raises instead of falling back to vanilla.
+        """
+        self.attempts += 1
+        table = self.table
+        doors = table.doors
+        codes = table.area_codes
+        randomizable = set(self._randomizable())
+        # Doors and areas are taken in id/code order, which fixes the RNG
+        # draws (and so the layout) for a seed.
+        portals = sorted((door for door in randomizable if doors[door].reverse in randomizable),
+                         key=lambda door: doors[door].door_id)
+        portal_set = set(portals)
+        blocked = self._blocked_edges()
+
+        parent = list(range(len(table.area_codes)))
+        open_by_component: Dict[int, List[int]] = {}
+        matches: List[Tuple[int, int]] = []
+
+        # Step 1: vanilla components, and a portal pair for each one-way door.
+        vanilla_edges = {(door.from_index, door.to_index) for door in doors
+                         if door.index not in portal_set and (door.from_index, door.to_index) not in blocked}
+        edge_order = sorted(vanilla_edges, key=lambda edge: (codes[edge[0]], codes[edge[1]]))
+        for from_area, to_area in edge_order:
+            if (to_area, from_area) in vanilla_edges:
+                _union(parent, from_area, to_area)
+
+        free: Dict[int, List[int]] = {}
+        for door in portals:
+            free.setdefault(doors[door].from_index, []).append(door)
+        for door_list in free.values():
+            self.rng.shuffle(door_list)
+
+        for from_area, to_area in edge_order:
+            if (to_area, from_area) in vanilla_edges or _find(parent, from_area) == _find(parent, to_area):
+                continue
+            if not free.get(from_area) or not free.get(to_area):
+                raise RuntimeError(f"Paired door randomization: one-way door {codes[from_area]} -> "
+                                   f"{codes[to_area]} has no portals to pair it back")
+            matches.append((free[to_area].pop(), free[from_area].pop()))
+            _union(parent, from_area, to_area)
+
+        for area, door_list in free.items():
+            open_by_component.setdefault(_find(parent, area), []).extend(door_list)
+        for area in range(len(parent)):
+            open_by_component.setdefault(_find(parent, area), [])
+
+        # Step 2: random spanning tree over the components.
+        start = _find(parent, table.area_index[START_AREA])
+        open_portals = open_by_component.pop(start)
+        pending = sorted(open_by_component, key=lambda component: codes[component])
+        self.rng.shuffle(pending)
+        while pending:
+            dead_ends_allowed = len(open_portals) >= 2 or len(pending) == 1
+            choices = [i for i, component in enumerate(pending)
+                       if len(open_by_component[component]) >= 2
+                       or (dead_ends_allowed and open_by_component[component])]
+            if not choices or not open_portals:
+                raise RuntimeError("Paired door randomization: cannot connect areas "
+                                   + ", ".join(sorted(code for area, code in enumerate(codes)
+                                                      if _find(parent, area) in pending)))
+            component = pending.pop(self.rng.choice(choices))
+            new_portals = open_by_component.pop(component)
+            attach = open_portals.pop(self.rng.randrange(len(open_portals)))
+            entry = new_portals.pop(self.rng.randrange(len(new_portals)))
+            matches.append((attach, entry))
+            open_portals.extend(new_portals)
+
+        # Step 3: match what's left, splitting up same-area pairs.
+        self.rng.shuffle(open_portals)
+        rest = [(open_portals[i], open_portals[i + 1]) for i in range(0, len(open_portals) - 1, 2)]
+        for i, (a, b) in enumerate(rest):
+            if doors[a].from_index != doors[b].from_index:
+                continue
+            for j, (c, d) in enumerate(rest):
+                if doors[a].from_index != doors[c].from_index and doors[b].from_index != doors[d].from_index:
+                    rest[i], rest[j] = (a, c), (b, d)
+                    break
+            else:
+                raise RuntimeError(f"Paired door randomization: area {doors[a].from_area} can only pair with itself")
+        matches.extend(rest)
+
+        redirects: Dict[int, int] = {}
+        for p, q in matches:
+            if doors[p].reverse != q:
+                redirects[p] = doors[q].reverse
+                redirects[q] = doors[p].reverse
+
+        if not self._is_valid(self._adjacency(redirects), paired=True):
+            raise RuntimeError("Paired door randomization built an invalid layout")
+        self._set_redirects(redirects)
+        print(f"Built paired randomization ({len(matches)} door pairs, {len(self.redirects)} redirects)")
+        return self.redirects
+
     def randomize_paired_with_retry(self, max_attempts_per_seed: int = 500, max_reseeds: int = 100) -> Dict[str, str]:
         """Attempts paired mode randomization, reseeding if necessary."""
         for reseed_attempt in range(max_reseeds):
             if reseed_attempt > 0:
+                self.reseeds += 1
                 new_seed = self.rng.randint(0, 2 ** 31 - 1)
                 self.rng = random.Random(new_seed)
                 print(f"Reseeding (attempt {reseed_attempt + 1}/{max_reseeds}) with seed {new_seed}")
@@ -459,20 +681,16 @@ class DoorRandomizer:
 
     def randomize_with_validation(self, max_attempts: int = 100) -> Dict[str, str]:
         """Chaos mode: shuffle all randomizable doors, validate connectivity."""
-        randomizable = self.get_randomizable_doors()
+        randomizable = self._randomizable()
 
         for attempt in range(max_attempts):
-            self.redirects = {}
-
+            self.attempts += 1
             destinations = randomizable.copy()
             self.rng.shuffle(destinations)
 
-            for source, dest in zip(randomizable, destinations):
-                if source != dest:
-                    self.redirects[source] = dest
-
-            graph = self.build_adjacency_graph(use_redirects=True)
-            if self.is_fully_connected(graph) and self.can_escape_all_areas(graph):
+            redirects = {source: dest for source, dest in zip(randomizable, destinations) if source != dest}
+            if self._is_valid(self._adjacency(redirects)):
+                self._set_redirects(redirects)
                 print(f"Found valid randomization on attempt {attempt + 1}")
                 return self.redirects
 
@@ -480,22 +698,94 @@ class DoorRandomizer:
         self.redirects = {}
         return self.redirects
 
+    def randomize_incremental(self) -> Dict[str, str]:
+        """
+        Chaos mode built one door at a time, with no rejection sampling.
+
+        Keeps the set of areas reached from START_AREA (through vanilla doors
+        and doors assigned so far) and the reached doors still unassigned,
+        its open exits. Each step takes a random open exit and gives it a
+        destination drawn uniformly from the unused ones. A draw into an
+        already-reached area is redrawn when it would close the last open
+        exit while areas are still unreached; a destination into an
+        unreached area is always left at that point, so no step ever backs
+        out. Once every area is reached, the remaining doors take the
+        remaining destinations in random order.
+
+        Every layout is accepted. Destinations stay one-to-one as in
+        randomize_with_validation, but layouts aren't uniform over the valid
+        ones: because sources are taken in reachability order and only the
+        closing draw is redrawn, early exits lead to new areas somewhat more
+        often than under rejection sampling.
+        """
+        self.attempts += 1
+        table = self.table
+        doors = table.doors
+        randomizable = self._randomizable()
+        randomizable_set = set(randomizable)
+        blocked = self._blocked_edges()
+
+        vanilla = [0] * len(table.area_codes)
+        sources_in: List[List[int]] = [[] for _ in table.area_codes]
+        for door in doors:
+            if door.index in randomizable_set:
+                sources_in[door.from_index].append(door.index)
+            elif (door.from_index, door.to_index) not in blocked:
+                vanilla[door.from_index] |= 1 << door.to_index
+
+        reached = 0
+        open_exits: List[int] = []
+
+        def reach(area: int) -> None:
+            nonlocal reached
+            new = _reach(vanilla, 1 << area) & ~reached
+            reached |= new
+            for new_area in _bits(new):
+                open_exits.extend(sources_in[new_area])
+
+        reach(table.area_index[START_AREA])
+        destinations = randomizable.copy()
+        self.rng.shuffle(destinations)
+        redirects: Dict[int, int] = {}
+
+        while reached != table.all_areas:
+            if not open_exits:
+                raise RuntimeError("Chaos door randomization: cannot reach "
+                                   + ", ".join(sorted(table.codes_in(table.all_areas & ~reached))))
+            source = open_exits.pop(self.rng.randrange(len(open_exits)))
+            index = self.rng.randrange(len(destinations))
+            if not open_exits and reached >> doors[destinations[index]].to_index & 1:
+                onward = [i for i, dest in enumerate(destinations)
+                          if not reached >> doors[dest].to_index & 1]
+                if not onward:
+                    raise RuntimeError("Chaos door randomization: cannot reach "
+                                       + ", ".join(sorted(table.codes_in(table.all_areas & ~reached))))
+                index = self.rng.choice(onward)
+            dest = destinations.pop(index)
+            if source != dest:
+                redirects[source] = dest
+            reach(doors[dest].to_index)
+
+        # Everything is reached: the rest is a plain shuffle.
+        self.rng.shuffle(destinations)
+        for source, dest in zip(open_exits, destinations):
+            if source != dest:
+                redirects[source] = dest
+
+        if not self._is_valid(self._adjacency(redirects)):
+            raise RuntimeError("Chaos door randomization built an invalid layout")
+        self._set_redirects(redirects)
+        print(f"Built randomization ({len(self.redirects)} redirects)")
+        return self.redirects
+
     def export_redirects_for_lua(self) -> Dict[str, dict]:
         """Export redirects in Lua-compatible format."""
         lua_redirects = {}
         for source_id, target_id in self.redirects.items():
-            source_door = self.doors.get(source_id)
             target_door = self.doors.get(target_id)
-            if not source_door or not target_door:
+            if source_id not in self.doors or not target_door:
                 continue
-
-            lua_redirects[source_id] = {
-                "target_area": target_door.to_area,
-                "target_area_name": AREA_NAMES.get(target_door.to_area, target_door.to_area),
-                "template_door_id": target_id,
-                "position": {"x": target_door.position[0], "y": target_door.position[1], "z": target_door.position[2]},
-                "angle": {"x": target_door.angle[0], "y": target_door.angle[1], "z": target_door.angle[2]},
-            }
+            lua_redirects[source_id] = _redirect_entry(target_door)
         return lua_redirects
 
     def print_summary(self) -> None:
@@ -525,156 +815,51 @@ def generate_door_randomization(door_json: dict, seed: int) -> Dict[str, dict]:
     randomizer.print_summary()
     return randomizer.export_redirects_for_lua()
 
+# Door geometry lives in the "doors" table of drdr_shared.json, which the Lua
+# DoorRandomizer loads too. A door's position in that table is its door
+# index; slot_data's door_redirects carries only index pairs (see
+# encode_door_redirects).
 EMBEDDED_DOOR_DATA = {
-    "SCN_s100|s136|door0": {"from_area_code": "s100", "to_area_code": "s136",
-                            "position": {"x": 131.51, "y": 8.0, "z": 251.65}, "angle": {"x": 0.0, "y": 1.48, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s100|s200|door0": {"from_area_code": "s100", "to_area_code": "s200",
-                            "position": {"x": 145.53, "y": 0.0, "z": 84.66}, "angle": {"x": 0.0, "y": 2.42, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s100|s900|door0": {"from_area_code": "s100", "to_area_code": "s900",
-                            "position": {"x": 49.84, "y": 0.0, "z": 119.72}, "angle": {"x": 0.0, "y": -1.52, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s135|s136|door0": {"from_area_code": "s135", "to_area_code": "s136",
-                            "position": {"x": 145.98, "y": 14.0, "z": 249.69}, "angle": {"x": 0.0, "y": -4.0, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s136|s100|door0": {"from_area_code": "s136", "to_area_code": "s100",
-                            "position": {"x": 127.86, "y": 8.0, "z": 252.53}, "angle": {"x": 0.0, "y": -2.76, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s136|s135|door0": {"from_area_code": "s136", "to_area_code": "s135",
-                            "position": {"x": 142.5, "y": 14.0, "z": 250.5}, "angle": {"x": 0.0, "y": -3.0, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s136|s231|door0": {"from_area_code": "s136", "to_area_code": "s231",
-                            "position": {"x": 171.8, "y": 9.5, "z": 110.9}, "angle": {"x": 0.0, "y": 2.3, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s200|s100|door0": {"from_area_code": "s200", "to_area_code": "s100",
-                            "position": {"x": 137.3, "y": 0.0, "z": 92.67}, "angle": {"x": 0.0, "y": -0.66, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s200|s230|door0": {"from_area_code": "s200", "to_area_code": "s230",
-                            "position": {"x": 170.94, "y": 0.0, "z": 64.85}, "angle": {"x": 0.0, "y": 1.54, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s200|s503|door0": {"from_area_code": "s200", "to_area_code": "s503",
-                            "position": {"x": 103.58, "y": -1.69, "z": -86.12},
-                            "angle": {"x": 0.0, "y": 3.12, "z": 0.0}, "door_no": 0},
-    "SCN_s200|s600|door0": {"from_area_code": "s200", "to_area_code": "s600",
-                            "position": {"x": 199.1, "y": 0.0, "z": -28.2}, "angle": {"x": 0.0, "y": 3.14, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s200|s700|door0": {"from_area_code": "s200", "to_area_code": "s700",
-                            "position": {"x": 111.39, "y": 0.0, "z": -26.82}, "angle": {"x": 0.0, "y": -1.01, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s230|s200|door0": {"from_area_code": "s230", "to_area_code": "s200",
-                            "position": {"x": 163.49, "y": 0.0, "z": 64.39}, "angle": {"x": 0.0, "y": -1.58, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s230|s231|door0": {"from_area_code": "s230", "to_area_code": "s231",
-                            "position": {"x": 196.75, "y": 8.05, "z": 65.24}, "angle": {"x": 0.0, "y": -0.98, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s230|s231|door1": {"from_area_code": "s230", "to_area_code": "s231",
-                            "position": {"x": 195.0, "y": 8.0, "z": 100.0}, "angle": {"x": 0.0, "y": -1.0, "z": 0.0},
-                            "door_no": 1},
-    "SCN_s231|s136|door0": {"from_area_code": "s231", "to_area_code": "s136",
-                            "position": {"x": 153.19, "y": 9.32, "z": 216.92}, "angle": {"x": 0.0, "y": 0.93, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s231|s230|door0": {"from_area_code": "s231", "to_area_code": "s230",
-                            "position": {"x": 197.0, "y": 8.05, "z": 67.8}, "angle": {"x": 0.0, "y": 0.8, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s231|s230|door1": {"from_area_code": "s231", "to_area_code": "s230",
-                            "position": {"x": 193.8, "y": 0.0, "z": 99.7}, "angle": {"x": 0.0, "y": -2.5, "z": 0.0},
-                            "door_no": 1},
-    "SCN_s300|s400|door0": {"from_area_code": "s300", "to_area_code": "s400",
-                            "position": {"x": -180.49, "y": 5.0, "z": -107.92},
-                            "angle": {"x": 0.0, "y": -3.0, "z": 0.0}, "door_no": 0},
-    "SCN_s300|s400|door1": {"from_area_code": "s300", "to_area_code": "s400",
-                            "position": {"x": -85.04, "y": 5.0, "z": -84.02}, "angle": {"x": 0.0, "y": 3.0, "z": 0.0},
-                            "door_no": 1},
-    "SCN_s300|sa00|door0": {"from_area_code": "s300", "to_area_code": "sa00",
-                            "position": {"x": -130.65, "y": 0.0, "z": 107.06}, "angle": {"x": 0.0, "y": 0.19, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s400|s300|door0": {"from_area_code": "s400", "to_area_code": "s300",
-                            "position": {"x": -175.12, "y": 5.0, "z": -101.03},
-                            "angle": {"x": 0.0, "y": 0.87, "z": 0.0}, "door_no": 0},
-    "SCN_s400|s300|door1": {"from_area_code": "s400", "to_area_code": "s300",
-                            "position": {"x": -85.16, "y": 5.0, "z": -75.27}, "angle": {"x": 0.0, "y": 0.0, "z": 0.0},
-                            "door_no": 1},
-    "SCN_s400|s401|door0": {"from_area_code": "s400", "to_area_code": "s401",
-                            "position": {"x": -9.4, "y": 9.7, "z": -203.2}, "angle": {"x": 0.0, "y": 1.5, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s400|s501|door0": {"from_area_code": "s400", "to_area_code": "s501",
-                            "position": {"x": 45.0, "y": 5.0, "z": -165.0}, "angle": {"x": 0.0, "y": 1.27, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s400|s700|door0": {"from_area_code": "s400", "to_area_code": "s700",
-                            "position": {"x": 20.01, "y": 5.0, "z": -142.11}, "angle": {"x": 0.0, "y": -0.15, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s401|s400|door0": {"from_area_code": "s401", "to_area_code": "s400",
-                            "position": {"x": -8.5, "y": 7.0, "z": -204.8}, "angle": {"x": 0.0, "y": -0.2, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s501|s400|door0": {"from_area_code": "s501", "to_area_code": "s400",
-                            "position": {"x": 37.0, "y": 5.0, "z": -165.0}, "angle": {"x": 0.0, "y": -1.45, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s503|s200|door0": {"from_area_code": "s503", "to_area_code": "s200",
-                            "position": {"x": 106.1, "y": 0.0, "z": -66.28}, "angle": {"x": 0.0, "y": 0.07, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s600|s200|door0": {"from_area_code": "s600", "to_area_code": "s200",
-                            "position": {"x": 198.7, "y": 0.0, "z": -24.3}, "angle": {"x": 0.0, "y": 0.0, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s600|s601|door0": {"from_area_code": "s600", "to_area_code": "s601",
-                            "position": {"x": -243.06, "y": -3.0, "z": -262.9},
-                            "angle": {"x": 0.0, "y": -2.74, "z": 0.0}, "door_no": 0},
-    "SCN_s600|s700|door0": {"from_area_code": "s600", "to_area_code": "s700",
-                            "position": {"x": -195.38, "y": 0.1, "z": -147.9},
-                            "angle": {"x": 0.0, "y": -1.57, "z": 0.0}, "door_no": 0},
-    "SCN_s600|s900|door0": {"from_area_code": "s600", "to_area_code": "s900",
-                            "position": {"x": -21.3, "y": 0.0, "z": 167.2}, "angle": {"x": 0.0, "y": -3.1, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s600|sa00|door0": {"from_area_code": "s600", "to_area_code": "sa00",
-                            "position": {"x": -133.5, "y": 0.0, "z": 115.4}, "angle": {"x": 0.0, "y": 1.4, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s601|s600|door0": {"from_area_code": "s601", "to_area_code": "s600",
-                            "position": {"x": -244.16, "y": -2.99, "z": -257.16},
-                            "angle": {"x": 0.0, "y": 1.25, "z": 0.0}, "door_no": 0},
-    "SCN_s700|s200|door0": {"from_area_code": "s700", "to_area_code": "s200",
-                            "position": {"x": 116.8, "y": 0.0, "z": -33.7}, "angle": {"x": 0.0, "y": 1.33, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s700|s400|door0": {"from_area_code": "s700", "to_area_code": "s400",
-                            "position": {"x": 20.0, "y": 5.03, "z": -150.0}, "angle": {"x": 0.0, "y": -3.08, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s700|s600|door0": {"from_area_code": "s700", "to_area_code": "s600",
-                            "position": {"x": -169.35, "y": -2.25, "z": -147.5},
-                            "angle": {"x": 0.0, "y": 1.53, "z": 0.0}, "door_no": 0},
-    "SCN_s700|sa00|door0": {"from_area_code": "s700", "to_area_code": "sa00",
-                            "position": {"x": -96.0, "y": 0.0, "z": 127.5}, "angle": {"x": 0.0, "y": -0.85, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s900|s100|door0": {"from_area_code": "s900", "to_area_code": "s100",
-                            "position": {"x": 57.22, "y": 0.0, "z": 120.1}, "angle": {"x": 0.0, "y": 1.66, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s900|s600|door0": {"from_area_code": "s900", "to_area_code": "s600",
-                            "position": {"x": -21.5, "y": 0.0, "z": 171.2}, "angle": {"x": 0.0, "y": 0.0, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s900|sa00|door0": {"from_area_code": "s900", "to_area_code": "sa00",
-                            "position": {"x": -73.0, "y": 0.0, "z": 162.0}, "angle": {"x": 0.0, "y": -1.68, "z": 0.0},
-                            "door_no": 0},
-    "SCN_sa00|s300|door0": {"from_area_code": "sa00", "to_area_code": "s300",
-                            "position": {"x": -129.81, "y": 0.0, "z": 92.01}, "angle": {"x": 0.0, "y": -3.0, "z": 0.0},
-                            "door_no": 0},
-    "SCN_sa00|s600|door0": {"from_area_code": "sa00", "to_area_code": "s600",
-                            "position": {"x": -137.5, "y": 0.0, "z": 115.55}, "angle": {"x": 0.0, "y": -1.5, "z": 0.0},
-                            "door_no": 0},
-    "SCN_sa00|s700|door0": {"from_area_code": "sa00", "to_area_code": "s700",
-                            "position": {"x": -89.24, "y": 0.0, "z": 119.28}, "angle": {"x": 0.0, "y": 2.41, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s400|s500|door0": {"from_area_code": "s400", "to_area_code": "s500",
-                            "position": {"x": -182.5, "y": 5.0, "z": -213.0}, "angle": {"x": 0.0, "y": -2.98, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s500|s400|door0": {"from_area_code": "s500", "to_area_code": "s400",
-                            "position": {"x": -182.5, "y": 5.0, "z": -207.0}, "angle": {"x": 0.0, "y": 0.1, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s500|s600|door0": {"from_area_code": "s500", "to_area_code": "s600",
-                            "position": {"x": -230.5, "y": 5.0, "z": -249.0}, "angle": {"x": 0.0, "y": 3.14, "z": 0.0},
-                            "door_no": 0},
-    "SCN_s600|s500|door0": {"from_area_code": "s600", "to_area_code": "s500",
-                            "position": {"x": -230.23, "y": 5.0, "z": -244.97},
-                            "angle": {"x": 0.0, "y": -0.17, "z": 0.0},
-                            "door_no": 0},
+    row["id"]: {key: value for key, value in row.items() if key != "id"}
+    for row in DOORS
 }
+# Compiled once at import and shared by every DoorRandomizer that loads
+# EMBEDDED_DOOR_DATA, the visualizer and DRWorld's door overlay.
+DOOR_TABLE = DoorTable(EMBEDDED_DOOR_DATA)
+
+
+def encode_door_redirects(redirects: Dict[str, dict]) -> List[int]:
+    """Flat [source_index, target_index, ...] pairs for a layout from
+    generate_door_layout, in the layout's order. The target is the door whose
+    destination and spawn point the source door now uses.
+    """
+    by_id = DOOR_TABLE.by_id
+    pairs: List[int] = []
+    for source_id, redirect in redirects.items():
+        pairs += (by_id[source_id].index, by_id[redirect["template_door_id"]].index)
+    return pairs
+
+
+def decode_door_redirects(pairs: List[int]) -> Dict[str, dict]:
+    """Inverse of encode_door_redirects: the layout in the
+    export_redirects_for_lua format, rebuilt from the door table."""
+    doors = DOOR_TABLE.doors
+    redirects: Dict[str, dict] = {}
+    for i in range(0, len(pairs) - 1, 2):
+        redirects[doors[pairs[i]].door_id] = _redirect_entry(doors[pairs[i + 1]])
+    return redirects
+
+
+def _redirect_entry(target_door: CompiledDoor) -> dict:
+    x, y, z = target_door.position
+    ax, ay, az = target_door.angle
+    return {
+        "target_area": target_door.to_area,
+        "target_area_name": AREA_NAMES.get(target_door.to_area, target_door.to_area),
+        "template_door_id": target_door.door_id,
+        "position": {"x": x, "y": y, "z": z},
+        "angle": {"x": ax, "y": ay, "z": az},
+    }
 
 DOOR_MODE_CHAOS = 0
 DOOR_MODE_PAIRED = 1
@@ -707,7 +892,24 @@ def generate_door_randomization_for_ap(
     that door fires after the player meets Jessie and the door stays open
     for the rest of the run, so it's no longer narrative-only.
     """
-    randomizer = DoorRandomizer(seed=random_source.randint(0, 2 ** 31))
+    return generate_door_layout(
+        random_source.randint(0, 2 ** 31),
+        mode=mode,
+        randomize_rooftop_service_hallway=randomize_rooftop_service_hallway,
+        scoop_sanity=scoop_sanity,
+        use_embedded=use_embedded,
+    )
+
+
+def make_door_randomizer(
+    seed: int,
+    randomize_rooftop_service_hallway: bool = False,
+    scoop_sanity: bool = False,
+    use_embedded: bool = True,
+) -> DoorRandomizer:
+    """A DoorRandomizer loaded and configured as generate_door_layout uses
+    it, before any randomize_* call."""
+    randomizer = DoorRandomizer(seed=seed)
 
     if use_embedded:
         randomizer.load_doors_from_json({"doors": EMBEDDED_DOOR_DATA})
@@ -720,10 +922,29 @@ def generate_door_randomization_for_ap(
     if scoop_sanity:
         randomizer.set_scoop_sanity_unlocked_edges(SR_EP_EDGES)
 
+    return randomizer
+
+
+def generate_door_layout(
+    seed: int,
+    mode: int = DOOR_MODE_CHAOS,
+    randomize_rooftop_service_hallway: bool = False,
+    scoop_sanity: bool = False,
+    use_embedded: bool = True,
+) -> Dict[str, dict]:
+    """generate_door_randomization_for_ap with the seed already drawn.
+    DRWorld.generate_early draws the seed from the player's own random."""
+    randomizer = make_door_randomizer(
+        seed,
+        randomize_rooftop_service_hallway=randomize_rooftop_service_hallway,
+        scoop_sanity=scoop_sanity,
+        use_embedded=use_embedded,
+    )
+
     if mode == DOOR_MODE_PAIRED:
-        randomizer.randomize_paired_with_retry(max_attempts_per_seed=500, max_reseeds=100)
+        randomizer.randomize_paired_constructive()
     else:
-        randomizer.randomize_with_validation(max_attempts=100)
+        randomizer.randomize_incremental()
 
     return randomizer.export_redirects_for_lua()
 
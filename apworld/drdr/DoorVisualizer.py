@@ -12,7 +12,7 @@ Outputs:
 
 import json
 import sys
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 
 from DoorRandomization import (
     DoorRandomizer,
@@ -391,6 +391,15 @@ def generate_map_visualization(randomizer: DoorRandomizer, title: str = "Door Ra
     # (following redirects) and find the map position of the matching reverse
     # door at the destination so we can draw an arrow to it.
     connections = []  # list of dicts consumed by the JS side
+    table = randomizer.table
+
+    def positioned_exit(from_area: str, to_area: Optional[str], door_no: Optional[int] = None) -> Optional[str]:
+        """First door from_area -> to_area with a map position, preferring
+        the one numbered door_no."""
+        candidates = [other_id for other_id in table.areas[from_area].outgoing_doors
+                      if other_id in DOOR_MAP_POSITIONS and (to_area is None or table.by_id[other_id].to_area == to_area)]
+        preferred = [other_id for other_id in candidates if table.by_id[other_id].door_no == door_no]
+        return (preferred or candidates or [None])[0]
 
     for door_id, door in randomizer.doors.items():
         src_pos = DOOR_MAP_POSITIONS.get(door_id)
@@ -408,17 +417,11 @@ def generate_map_visualization(randomizer: DoorRandomizer, title: str = "Door Ra
         dest_pos = None
 
         if is_redirected:
-            reverse_target = f"SCN_{target_door.to_area}|{target_door.from_area}|door{target_door.door_no}"
-            if reverse_target in DOOR_MAP_POSITIONS:
-                dest_pos = DOOR_MAP_POSITIONS[reverse_target]
-            else:
-                # Fallback: any door from target's to_area back to target's from_area
-                for other_id, other_door in randomizer.doors.items():
-                    if (other_door.from_area == target_door.to_area and
-                            other_door.to_area == target_door.from_area and
-                            other_id in DOOR_MAP_POSITIONS):
-                        dest_pos = DOOR_MAP_POSITIONS[other_id]
-                        break
+            # The target's reverse door, else any door from target's to_area
+            # back to target's from_area
+            reverse_id = positioned_exit(target_door.to_area, target_door.from_area, target_door.door_no)
+            if reverse_id is not None:
+                dest_pos = DOOR_MAP_POSITIONS[reverse_id]
             # If no reverse found, fall back to the target door's own position
             # (better than nothing — at least it's unique per redirect)
             if dest_pos is None:
@@ -428,24 +431,16 @@ def generate_map_visualization(randomizer: DoorRandomizer, title: str = "Door Ra
             # For non-redirected doors (or if all redirected lookups failed),
             # look for the reverse door at the destination: a door that goes
             # FROM the destination area BACK to the source area.
-            ideal_reverse = f"SCN_{effective_to_area}|{door.from_area}|door{door.door_no}"
-            if ideal_reverse in DOOR_MAP_POSITIONS:
-                dest_pos = DOOR_MAP_POSITIONS[ideal_reverse]
-            else:
-                # Fallback: any reverse door from dest back to source area
-                for other_id, other_door in randomizer.doors.items():
-                    if other_door.from_area == effective_to_area and other_door.to_area == door.from_area:
-                        if other_id in DOOR_MAP_POSITIONS:
-                            dest_pos = DOOR_MAP_POSITIONS[other_id]
-                            break
+            reverse_id = positioned_exit(effective_to_area, door.from_area, door.door_no)
+            if reverse_id is not None:
+                dest_pos = DOOR_MAP_POSITIONS[reverse_id]
 
         # If we still have no dest position, try any door whose from_area is
         # the destination (just so the arrow points into the right zone).
         if dest_pos is None:
-            for other_id, other_door in randomizer.doors.items():
-                if other_door.from_area == effective_to_area and other_id in DOOR_MAP_POSITIONS:
-                    dest_pos = DOOR_MAP_POSITIONS[other_id]
-                    break
+            other_id = positioned_exit(effective_to_area, None)
+            if other_id is not None:
+                dest_pos = DOOR_MAP_POSITIONS[other_id]
 
         if dest_pos is None:
             continue  # can't draw this connection
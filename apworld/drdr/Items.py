@@ -1,5 +1,5 @@
 from enum import IntEnum
-from typing import NamedTuple
+from typing import Dict, NamedTuple
 from BaseClasses import Item
 from Options import OptionError
 
@@ -456,86 +456,85 @@ progression_skills = {
 }
 
 
-def BuildItemPool(multiworld, count, options, excluded_scoop_names=()):
-    """Build the item pool for this world.
+# Pool buckets by category, built once at import.
+_items_by_category = {category: [item for item in _all_items if item.category == category]
+                      for category in DRItemCategory}
+
+# Area keys to skip when door randomizer is enabled
+_area_key_names = {
+    "Rooftop key", "Warehouse key", "Paradise Plaza key",
+    "Colby's Movieland key", "Leisure Park key", "North Plaza key",
+    "Crislip's Home Saloon key", "Food Court key", "Wonderland Plaza key",
+    "Al Fresca Plaza key", "Entrance Plaza key", "Seon's Food and Stuff key",
+    "Maintenance Tunnel key", "Carlito's Hideout key", "Maintenance Tunnel Access Key"
+}
+
+# Time keys to skip when scoop sanity is enabled
+_time_key_names = {
+    "DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM", "DAY3_11_AM", "DAY4_12_PM"
+}
+
+# Progressive stat upgrades per stat: (base_when_replace, extras_addition_if_enabled)
+UPGRADE_COUNTS = {
+    "Progressive Health Upgrade":    (8, 4),
+    "Progressive Attack Upgrade":    (6, 10),
+    "Progressive Throw Upgrade":     (4, 8),
+    "Progressive Item Slot Upgrade": (8, 3),
+    "Progressive Run Level Upgrade": (2, 0),
+    "Progressive Speed Upgrade":     (0, 10),    # extras-only category
+}
+
+
+def _spread(pool: Dict[str, int], items, slots: int, random) -> None:
+    """Adds `slots` copies spread evenly over `items`: every item the same
+    number of times, and the remainder on distinct random items. That is
+    what cycling through a reshuffled list produces, without materializing
+    it."""
+    if slots <= 0 or not items:
+        return
+    rounds, extra = divmod(slots, len(items))
+    if rounds:
+        for item in items:
+            pool[item.name] = pool.get(item.name, 0) + rounds
+    for item in random.sample(items, extra):
+        pool[item.name] = pool.get(item.name, 0) + 1
+
+
+def BuildItemPool(random, count, options, excluded_scoop_names=()) -> Dict[str, int]:
+    """Build the item pool for this world as {item name: copies}, `count`
+    items in total unless the fixed buckets alone exceed it.
+
+    random: the slot's own World.random. Filler draws come only from it, so
+    a slot's pool does not depend on any other slot.
 
     excluded_scoop_names: iterable of scoop item names to omit from the pool
     even when ScoopSanity is enabled. Used by the Savior goal to drop main
     scoops (they would advance story state the goal doesn't need).
     """
-    item_pool = []
-    included_itemcount = 0
-
-    # Area keys to skip when door randomizer is enabled
-    area_key_names = {
-        "Rooftop key", "Warehouse key", "Paradise Plaza key",
-        "Colby's Movieland key", "Leisure Park key", "North Plaza key",
-        "Crislip's Home Saloon key", "Food Court key", "Wonderland Plaza key",
-        "Al Fresca Plaza key", "Entrance Plaza key", "Seon's Food and Stuff key",
-        "Maintenance Tunnel key", "Carlito's Hideout key", "Maintenance Tunnel Access Key"
-    }
-
-    # Time keys to skip when scoop sanity is enabled
-    time_key_names = {
-        "DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM", "DAY3_11_AM", "DAY4_12_PM"
-    }
-
-    if options.guaranteed_items.value:
-        for item_name in options.guaranteed_items.value:
-            item = item_dictionary[item_name]
-            item_pool.append(item)
-            included_itemcount = included_itemcount + 1
-    remaining_count = count - included_itemcount
+    pool: Dict[str, int] = {}
 
-    if options.restricted_item_mode.value:
-        for item_name in specialty_items:
-            item = item_dictionary[item_name]
-            item_pool.append(item)
-            remaining_count = remaining_count - 1
-            included_itemcount = included_itemcount + 1
-
-    itemList = [item for item in _all_items]
-    lockList = [item for item in _all_items if item.category == DRItemCategory.LOCK]
-    scoopList = [item for item in _all_items if item.category == DRItemCategory.SCOOP]
-    consumableList = [item for item in _all_items if item.category == DRItemCategory.CONSUMABLE]
-    weaponList = [item for item in _all_items if item.category == DRItemCategory.WEAPON]
-    skillList = [item for item in _all_items if item.category == DRItemCategory.SKILL]
-    upgradeList = [item for item in _all_items if item.category == DRItemCategory.UPGRADE]
-    buffList = [item for item in _all_items if item.category == DRItemCategory.BUFF]
-
-    # Trap subset of fillers — gated by options.trap_percentage on a per-roll
-    # basis when filling remaining slots.
-    trapList = [item for item in _all_items if item.category == DRItemCategory.TRAP]
-    nonTrapFiller = [item for item in itemList if item.category in (
-        DRItemCategory.MISC, DRItemCategory.WEAPON, DRItemCategory.CONSUMABLE,
-        DRItemCategory.BUFF
-    )]
+    def add(name, copies=1):
+        pool[name] = pool.get(name, 0) + copies
 
-    # Strip overpowered filler entries when the option is on. Guaranteed
-    # Items (added unconditionally above) and Restricted-mode specialty
-    # items (none of which overlap with overpowered_items) are unaffected.
-    if getattr(options, "exclude_overpowered_items",
-               type("X", (), {"value": False})()).value:
-        nonTrapFiller = [it for it in nonTrapFiller if it.name not in overpowered_items]
+    for item_name in options.guaranteed_items.value:
+        add(item_name)
 
-    fillerList = nonTrapFiller + trapList
+    if options.restricted_item_mode.value:
+        for item_name in specialty_items:
+            add(item_name)
 
-    for lock in lockList:
+    for lock in _items_by_category[DRItemCategory.LOCK]:
         # Skip area keys if door randomizer is enabled (they're precollected)
-        if options.door_randomizer and lock.name in area_key_names:
+        if options.door_randomizer and lock.name in _area_key_names:
             continue
         # Skip time keys if scoop sanity is enabled
-        if options.scoop_sanity and lock.name in time_key_names:
+        if options.scoop_sanity and lock.name in _time_key_names:
             continue
-
-        item = item_dictionary[lock.name]
-        item_pool.append(item)
-        remaining_count = remaining_count - 1
-        included_itemcount = included_itemcount + 1
+        add(lock.name)
 
     if options.scoop_sanity:
         excluded = set(excluded_scoop_names)
-        for scoop in scoopList:
+        for scoop in _items_by_category[DRItemCategory.SCOOP]:
             # Skip "Out of Control" if door randomizer is also enabled (it's precollected for softlock prevention)
             if options.door_randomizer and scoop.name == "Out of Control":
                 continue
@@ -543,56 +542,34 @@ def BuildItemPool(multiworld, count, options, excluded_scoop_names=()):
             # under the Savior goal).
             if scoop.name in excluded:
                 continue
-            item = item_dictionary[scoop.name]
-            item_pool.append(item)
-            remaining_count = remaining_count - 1
-            included_itemcount = included_itemcount + 1
-
+            add(scoop.name)
 
     # Useful items: skills + stat upgrades. Quantity per stat depends on
     # whether extras are enabled. Modes:
     #   * vanilla_only    — neither skills nor stat upgrades added
     #   * replace         — full core pool (extras add more if enabled)
     #   * extra_buffs_only — only the extra/over-vanilla pool added
-    progression_mode = getattr(options, "vanilla_progression",
-                               type("X", (), {"value": 1})()).value
     # Match Options.py Choice: 0=vanilla_only, 1=replace, 2=extra_buffs_only
-    extras_enabled = bool(getattr(options, "enable_extra_stat_buffs",
-                                  type("X", (), {"value": False})()).value)
-
-    if getattr(options, "enable_skill_items",
-               type("X", (), {"value": True})()).value and progression_mode != 0:
-        if progression_mode != 2:   # skills only in replace, not extra_buffs_only
-            for skill in skillList:
-                item_pool.append(skill)
-                remaining_count -= 1
-                included_itemcount += 1
-
-    # Per-stat counts: (base_when_replace, extras_addition_if_enabled)
-    UPGRADE_COUNTS = {
-        "Progressive Health Upgrade":    (8, 4),
-        "Progressive Attack Upgrade":    (6, 10),
-        "Progressive Throw Upgrade":     (4, 8),
-        "Progressive Item Slot Upgrade": (8, 3),
-        "Progressive Run Level Upgrade": (2, 0),
-        "Progressive Speed Upgrade":     (0, 10),    # extras-only category
-    }
-    if getattr(options, "enable_stat_items",
-               type("X", (), {"value": True})()).value and progression_mode != 0:
-        for upg in upgradeList:
+    progression_mode = options.vanilla_progression.value
+    extras_enabled = bool(options.enable_extra_stat_buffs.value)
+
+    if options.enable_skill_items.value and progression_mode == 1:
+        # skills only in replace, not extra_buffs_only
+        for skill in _items_by_category[DRItemCategory.SKILL]:
+            add(skill.name)
+
+    if options.enable_stat_items.value and progression_mode != 0:
+        for upg in _items_by_category[DRItemCategory.UPGRADE]:
             base, extra = UPGRADE_COUNTS.get(upg.name, (0, 0))
-            count_to_add = 0
             if progression_mode == 1:   # replace
-                count_to_add = base + (extra if extras_enabled else 0)
-            elif progression_mode == 2:   # extra_buffs_only
-                count_to_add = extra
-            for _ in range(count_to_add):
-                item_pool.append(upg)
-                remaining_count -= 1
-                included_itemcount += 1
+                copies = base + (extra if extras_enabled else 0)
+            else:   # extra_buffs_only
+                copies = extra
+            if copies:
+                add(upg.name, copies)
 
     # Fill remaining filler slots. trap_percentage controls what fraction of
-    # those slots become traps; the rest are random non-trap fillers.
+    # those slots become traps; the rest are non-trap fillers.
     #
     # Earlier revisions used a per-encounter roll (walk the shuffled
     # nonTrapFiller+trapList, roll trap_pct% to keep each trap candidate).
@@ -603,42 +580,32 @@ def BuildItemPool(multiworld, count, options, excluded_scoop_names=()):
     # seeing certain trap types (Hostile NPC Trap in particular).
     #
     # The two-bucket approach below makes trap_percentage mean what the
-    # docstring says it means. Trap slots are filled by cycling through a
-    # shuffled trapList, so every trap type appears at least once before
-    # any repeats -- this guarantees Hostile NPC Trap and the others all
-    # show up in the pool whenever the trap-slot count is >= len(trapList).
-    trap_pct = int(getattr(options, "trap_percentage",
-                            type("X", (), {"value": 25})()).value)
-    remaining_count = max(0, remaining_count)
+    # docstring says it means. Both buckets are spread evenly over their
+    # item types (see _spread), so every trap type appears at least once
+    # before any repeats -- this guarantees Hostile NPC Trap and the others
+    # all show up in the pool whenever the trap-slot count is >= the number
+    # of trap types. Non-trap filler keeps the same "unique-first, then
+    # duplicates" property.
+    trapList = _items_by_category[DRItemCategory.TRAP]
+    nonTrapFiller = [item for item in _all_items if item.category in (
+        DRItemCategory.MISC, DRItemCategory.WEAPON, DRItemCategory.CONSUMABLE,
+        DRItemCategory.BUFF
+    )]
+
+    # Strip overpowered filler entries when the option is on. Guaranteed
+    # Items (added unconditionally above) and Restricted-mode specialty
+    # items (none of which overlap with overpowered_items) are unaffected.
+    if options.exclude_overpowered_items.value:
+        nonTrapFiller = [it for it in nonTrapFiller if it.name not in overpowered_items]
+
+    trap_pct = int(options.trap_percentage.value)
+    remaining_count = max(0, count - sum(pool.values()))
     trap_slot_count = (
         min(int(round(remaining_count * trap_pct / 100)), remaining_count)
         if trapList else 0
     )
     non_trap_slot_count = remaining_count - trap_slot_count
 
-    # Trap slots: round-robin through a shuffled trapList so each trap type
-    # gets equal representation (with a fresh shuffle on every full cycle).
-    if trap_slot_count > 0 and trapList:
-        trap_cycle = []
-        for _ in range(trap_slot_count):
-            if not trap_cycle:
-                trap_cycle = list(trapList)
-                multiworld.random.shuffle(trap_cycle)
-            item_pool.append(trap_cycle.pop())
-
-    # Non-trap filler slots: shuffle once, walk in order, reshuffle on
-    # wrap-around. This keeps the existing "unique-first, then duplicates"
-    # property of the original algorithm.
-    if non_trap_slot_count > 0 and nonTrapFiller:
-        shuffled_filler = list(nonTrapFiller)
-        multiworld.random.shuffle(shuffled_filler)
-        filler_index = 0
-        for _ in range(non_trap_slot_count):
-            if filler_index >= len(shuffled_filler):
-                multiworld.random.shuffle(shuffled_filler)
-                filler_index = 0
-            item_pool.append(shuffled_filler[filler_index])
-            filler_index += 1
-
-    multiworld.random.shuffle(item_pool)
-    return item_pool
+    _spread(pool, trapList, trap_slot_count, random)
+    _spread(pool, nonTrapFiller, non_trap_slot_count, random)
+    return pool
@@ -0,0 +1,64 @@
+# apworld/drdr/RuleProfiler.py
+# Opt-in access-rule profiler for DRDR generation.
+#
+# Set DRDR_PROFILE_RULES=1 before generating. DRWorld.set_rules then wraps
+# every location and entrance rule of the slot (the ones set_rules assigned
+# and the entrance rules create_regions left behind) so each call is counted
+# and timed, and generate_output writes a ranked report into the output
+# directory, next to the spoiler. With the variable unset nothing is wrapped.
+#
+# Times are inclusive: a location rule that makes AP update reachable regions
+# also pays for the entrance rules evaluated during that update.
+
+import os
+import time
+from typing import Callable, Dict, List, Optional
+
+PROFILE_ENV_VAR = "DRDR_PROFILE_RULES"
+
+
+def profiling_enabled() -> bool:
+    return os.environ.get(PROFILE_ENV_VAR, "").strip().lower() not in ("", "0", "false", "no")
+
+
+class RuleProfiler:
+    def __init__(self, player_name: str):
+        self.player_name = player_name
+        # (kind, spot name) -> [calls, seconds]
+        self.stats: Dict[tuple, List] = {}
+
+    def wrap(self, kind: str, name: str, rule: Callable) -> Callable:
+        stat = self.stats.setdefault((kind, name), [0, 0.0])
+        clock = time.perf_counter
+
+        def profiled(state):
+            start = clock()
+            try:
+                return rule(state)
+            finally:
+                stat[0] += 1
+                stat[1] += clock() - start
+        return profiled
+
+    def instrument(self, regions) -> None:
+        """Wraps the access rule of every location and exit in `regions`."""
+        for region in regions:
+            for location in region.locations:
+                location.access_rule = self.wrap("location", location.name, location.access_rule)
+            for entrance in region.exits:
+                entrance.access_rule = self.wrap("entrance", entrance.name, entrance.access_rule)
+
+    def report(self, limit: Optional[int] = None) -> str:
+        ranked = sorted(self.stats.items(), key=lambda entry: entry[1][1], reverse=True)
+        total_calls = sum(calls for calls, _ in self.stats.values())
+        total_seconds = sum(seconds for _, seconds in self.stats.values())
+        lines = [
+            f"DRDR access-rule profile for {self.player_name}",
+            f"{len(ranked)} rules, {total_calls} calls, {total_seconds:.3f}s inclusive",
+            "",
+            f"{'seconds':>10} {'calls':>10} {'us/call':>9}  kind      name",
+        ]
+        for (kind, name), (calls, seconds) in ranked[:limit]:
+            per_call = seconds / calls * 1e6 if calls else 0.0
+            lines.append(f"{seconds:>10.4f} {calls:>10} {per_call:>9.2f}  {kind:<8}  {name}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,485 @@
+# apworld/drdr/Rules.py
+# Compiled access-rule layer for DRWorld.set_rules.
+#
+# Region and key-item requirements are lowered to integer bitmasks at rule
+# build time: bit i of a region mask is REGION_ORDER[i], bit j of an item
+# mask is MASKED_ITEM_NAMES[j]. A compiled rule is then one or two mask ANDs
+# against masks kept in a RuleCache per player on the CollectionState:
+#
+#   * the item mask is updated by DRWorld.collect / DRWorld.remove when an
+#     item's count crosses 0 <-> 1;
+#   * the reachable-region mask is rebuilt from state.reachable_regions only
+#     when that set has grown since the last build (once per sweep step), and
+#     is invalidated by DRWorld.remove. The region-point total behind the
+#     "Reach Level N" rules is recomputed in the same step.
+#
+# The caches live in state.drdr_rule_caches, which DRLogic (a LogicMixin in
+# __init__.py) adds to CollectionState and copies in CollectionState.copy(),
+# so a copy carries them over together with the reachable-region set they
+# were derived from. prog_items only ever holds real items.
+#
+# RuleCache.version is bumped on every item change and every region-mask
+# rebuild, so two evaluations that see the same version see the same
+# reachable set. Tally uses it to compute aggregate counts (stickers,
+# psychopaths, rescues) once per version instead of once per rule.
+#
+# A rule that depends on another location having been reached asks
+# DRRules.reached() for it. That records the location in DRRules.events and
+# checks a locked event item instead, which DRWorld places on an addressless
+# twin of the location once every rule is final. Fill's event sweep collects
+# it, so the dependency is a prog_items lookup rather than a nested
+# can_reach_location re-resolving the other location's region and rule.
+
+from bisect import bisect_right
+from typing import Callable, Iterable, Optional
+
+from .Items import DRItemCategory, item_dictionary
+
+# Every region that location/entrance rules can name, in create_regions order.
+REGION_ORDER = [
+    "Menu",
+    "Heliport",
+    "Security Room",
+    "Rooftop",
+    "Warehouse",
+    "Paradise Plaza",
+    "Entrance Plaza",
+    "Al Fresca Plaza",
+    "Leisure Park",
+    "Wonderland Plaza",
+    "North Plaza",
+    "Food Court",
+    "Colby's Movieland",
+    "Seon's Food and Stuff",
+    "Crislip's Home Saloon",
+    "Maintenance Tunnel",
+    "Carlito's Hideout",
+    "Tunnels",
+    "Level Ups",
+    "Challenges",
+]
+REGION_BITS = {name: 1 << i for i, name in enumerate(REGION_ORDER)}
+
+# Determines the value of the region towards levels
+REGION_LEVEL_VALUES = {
+    "Security Room": 1,
+    "Rooftop": 1,
+    "Paradise Plaza": 3,
+    "Entrance Plaza": 2,
+    "Leisure Park": 3,
+    "Al Fresca Plaza": 2,
+    "Food Court": 2,
+    "Wonderland Plaza": 3,
+    "North Plaza": 2,
+    "Maintenance Tunnel": 4,
+    "Seon's Food and Stuff": 1,
+    "Crislip's Home Saloon": 1,
+    "Colby's Movieland": 1,
+}
+REGION_POINT_BITS = [(REGION_BITS[name], value) for name, value in REGION_LEVEL_VALUES.items()]
+
+# Region points needed to reach a level: (first level of the band, points).
+# Level 1 needs nothing; levels 2-6 need 1 point, 7-9 need 2, and so on.
+LEVEL_POINT_THRESHOLDS = [
+    (2, 1),
+    (7, 2),
+    (10, 4),
+    (12, 5),
+    (13, 7),
+    (16, 10),
+    (19, 13),
+    (22, 17),
+    (26, 22),
+    (31, 23),
+    (41, 25),
+]
+_LEVEL_BAND_STARTS = [level for level, _ in LEVEL_POINT_THRESHOLDS]
+
+# Area keys, time keys and scoop items -- the items set_rules gates on with a
+# plain single-copy state.has().
+MASKED_ITEM_NAMES = [
+    data.name for data in item_dictionary.values()
+    if data.category in (DRItemCategory.LOCK, DRItemCategory.SCOOP)
+]
+ITEM_BITS = {name: 1 << i for i, name in enumerate(MASKED_ITEM_NAMES)}
+
+
+class RuleCache:
+    """One player's derived rule state on a CollectionState."""
+    __slots__ = ("item_mask", "region_count", "region_mask", "region_points", "version",
+                 "escort_survivors", "escort_females", "tallies")
+
+    def __init__(self):
+        self.item_mask = 0
+        # Size of the reachable-region set region_mask/region_points were
+        # built from; 0 when they need rebuilding.
+        self.region_count = 0
+        self.region_mask = 0
+        self.region_points = 0
+        self.version = 0
+        # Running (total, female) survivor totals over the scoop items held,
+        # kept by DRWorld.collect / DRWorld.remove from SCOOP_SURVIVOR_COUNTS.
+        # Each scoop counts once, however many copies are held.
+        self.escort_survivors = 0
+        self.escort_females = 0
+        # Tally name -> (version, value).
+        self.tallies = {}
+
+    def copy(self) -> "RuleCache":
+        new = RuleCache.__new__(RuleCache)
+        new.item_mask = self.item_mask
+        new.region_count = self.region_count
+        new.region_mask = self.region_mask
+        new.region_points = self.region_points
+        new.version = self.version
+        new.escort_survivors = self.escort_survivors
+        new.escort_females = self.escort_females
+        new.tallies = self.tallies.copy()
+        return new
+
+
+def rule_cache(state, player: int) -> RuleCache:
+    try:
+        return state.drdr_rule_caches[player]
+    except KeyError:
+        cache = state.drdr_rule_caches[player] = RuleCache()
+        return cache
+
+
+def region_mask_of(names: Iterable[str]) -> int:
+    mask = 0
+    for name in names:
+        mask |= REGION_BITS[name]
+    return mask
+
+
+def item_mask_of(names: Iterable[str]) -> int:
+    mask = 0
+    for name in names:
+        mask |= ITEM_BITS[name]
+    return mask
+
+
+def level_points_required(level: int) -> int:
+    band = bisect_right(_LEVEL_BAND_STARTS, level)
+    return LEVEL_POINT_THRESHOLDS[band - 1][1] if band else 0
+
+
+def event_item_name(location_name: str) -> str:
+    """The event item that marks `location_name` as reached."""
+    return f"{location_name} (Reached)"
+
+
+def on_collect(state, player: int, name: str) -> None:
+    """Called by DRWorld.collect after prog_items[name] was incremented."""
+    cache = rule_cache(state, player)
+    bit = ITEM_BITS.get(name)
+    if bit is not None and state.prog_items[player][name] == 1:
+        cache.item_mask |= bit
+    cache.version += 1
+
+
+def on_remove(state, player: int, name: str) -> None:
+    """Called by DRWorld.remove after prog_items[name] was decremented.
+    CollectionState.remove resets the reachable-region set right after, so
+    the cached region mask is dropped here as well."""
+    cache = rule_cache(state, player)
+    bit = ITEM_BITS.get(name)
+    if bit is not None and state.prog_items[player][name] < 1:
+        cache.item_mask &= ~bit
+    cache.region_count = 0
+    cache.version += 1
+
+
+def reachable_region_mask(state, player: int) -> int:
+    if state.stale[player]:
+        state.update_reachable_regions(player)
+    reachable = state.reachable_regions[player]
+    cache = rule_cache(state, player)
+    # reachable_regions only grows between removes, so its size is enough to
+    # tell whether the cached mask is current. Menu is always in a fresh set,
+    # so a built mask never has a count of 0.
+    if cache.region_count == len(reachable):
+        return cache.region_mask
+    mask = 0
+    for region in reachable:
+        mask |= REGION_BITS.get(region.name, 0)
+    points = 0
+    for bit, value in REGION_POINT_BITS:
+        if mask & bit:
+            points += value
+    cache.region_mask = mask
+    cache.region_points = points
+    cache.region_count = len(reachable)
+    cache.version += 1
+    return mask
+
+
+def reachable_region_points(state, player: int) -> int:
+    reachable_region_mask(state, player)
+    return rule_cache(state, player).region_points
+
+
+def state_version(state, player: int) -> int:
+    """Brings the region set up to date and returns the state's version.
+    Never 0 once called: the first mask build on a state bumps it."""
+    reachable_region_mask(state, player)
+    return rule_cache(state, player).version
+
+
+class Tally:
+    """A count over the reachable set, shared by every threshold rule built
+    from it. `count(state)` runs at most once per state version; the result
+    is cached in the player's RuleCache next to the version it was computed
+    at."""
+
+    def __init__(self, player: int, name: str, count: Callable[..., int]):
+        self.player = player
+        self.name = name
+        self.count = count
+
+    def __call__(self, state) -> int:
+        version = state_version(state, self.player)
+        tallies = rule_cache(state, self.player).tallies
+        cached = tallies.get(self.name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        value = self.count(state)
+        tallies[self.name] = (version, value)
+        return value
+
+    def at_least(self, n: int) -> Callable:
+        return lambda state: self(state) >= n
+
+
+class DRRules:
+    """Rule builder for one DRDR slot. requires() compiles a region/item
+    conjunction into a mask test; anything it can't express (location
+    chains, option-dependent branches, any-of item lists) is passed as
+    `then` and runs only after the mask test has passed.
+    """
+
+    def __init__(self, player: int, restricted_items: bool = False):
+        self.player = player
+        self.restricted_items = restricted_items
+        # location name -> event item name, for every location a rule asked
+        # reached() about.
+        self.events = {}
+
+    def region_mask(self, state) -> int:
+        return reachable_region_mask(state, self.player)
+
+    def item_mask(self, state) -> int:
+        return rule_cache(state, self.player).item_mask
+
+    def region_points(self, state) -> int:
+        return reachable_region_points(state, self.player)
+
+    def tally(self, name: str, count: Callable[..., int]) -> Tally:
+        return Tally(self.player, name, count)
+
+    def event(self, location: str) -> str:
+        """Event item for `location`, registering the location for an event
+        twin."""
+        return self.events.setdefault(location, event_item_name(location))
+
+    def reached(self, *locations: str) -> Callable:
+        """Rule for every one of `locations` having been reached."""
+        player = self.player
+        if len(locations) == 1:
+            item = self.event(locations[0])
+            return lambda state: state.has(item, player)
+        items = [self.event(location) for location in locations]
+        return lambda state: state.has_all(items, player)
+
+    def reached_any(self, locations: Iterable[str]) -> Callable:
+        """Rule for at least one of `locations` having been reached."""
+        items = [self.event(location) for location in locations]
+        player = self.player
+        return lambda state: state.has_any(items, player)
+
+    def reach_count(self, name: str, weighted_locations: Iterable) -> Tally:
+        """Tally of the reached (location, weight) pairs' weights."""
+        weighted_events = [(self.event(location), weight) for location, weight in weighted_locations]
+        player = self.player
+
+        def count(state):
+            counts = state.prog_items[player]
+            return sum(weight for item, weight in weighted_events if counts[item])
+        return self.tally(name, count)
+
+    def level(self, level: int) -> Callable:
+        """Rule for being able to reach `level`: the cached region-point
+        total against the LEVEL_POINT_THRESHOLDS band for that level."""
+        return self.compile(points_need=level_points_required(level))
+
+    def requires(self, regions: Iterable[str] = (), items: Iterable[str] = (),
+                 restricted_any: Iterable[str] = (),
+                 then: Optional[Callable] = None) -> Callable:
+        """`restricted_any`: in restricted item mode, at least one of these
+        items is also required. Dropped entirely when the mode is off."""
+        restricted_any = tuple(restricted_any)
+        if restricted_any and self.restricted_items:
+            player = self.player
+            inner = then
+
+            def then(state):
+                return (any(state.has(name, player) for name in restricted_any)
+                        and (inner is None or inner(state)))
+        return self.compile(region_mask_of(regions), item_mask_of(items), then=then)
+
+    def any_region(self, regions: Iterable[str]) -> Callable:
+        """Rule for reaching at least one of `regions`."""
+        need = region_mask_of(regions)
+        player = self.player
+        return lambda state: reachable_region_mask(state, player) & need != 0
+
+    def compile(self, region_need: int = 0, item_need: int = 0, points_need: int = 0,
+                then: Optional[Callable] = None) -> Callable:
+        """Lowest-level builder: every requirement already as a mask or a
+        region-point total. The returned rule remembers its requirements as
+        `rule.masks` so RuleRegistry can simplify it later."""
+        rule = self._compile(region_need, item_need, points_need, then)
+        if rule is not then:
+            rule.masks = (region_need, item_need, points_need, then)
+        return rule
+
+    def _compile(self, region_need, item_need, points_need, then):
+        player = self.player
+
+        if not region_need and not points_need:
+            if not item_need:
+                return then if then is not None else (lambda state: True)
+            # Item-only rules never touch the region set, so they are safe to
+            # use as entrance rules (evaluated mid update_reachable_regions).
+            def rule(state):
+                return (rule_cache(state, player).item_mask & item_need == item_need
+                        and (then is None or then(state)))
+            return rule
+
+        if not item_need and not region_need and then is None:
+            return lambda state: reachable_region_points(state, player) >= points_need
+
+        def rule(state):
+            cache = rule_cache(state, player)
+            if cache.item_mask & item_need != item_need:
+                return False
+            if reachable_region_mask(state, player) & region_need != region_need:
+                return False
+            if points_need and cache.region_points < points_need:
+                return False
+            return then is None or then(state)
+        return rule
+
+
+class StoryChain:
+    """The main-scoop story chain with every link's requirements flattened.
+
+    A link names the links it follows; link() folds their requirements plus
+    the predecessors' own parent regions into one (regions, items, points)
+    triple, so rule(name) never has to reach back through the chain. This is
+    what `can_reach_location(previous)` evaluated recursively, done once at
+    rule-build time. Links must be declared after the links they follow.
+    """
+
+    def __init__(self, rules: DRRules, parent_region: Callable[[str], str]):
+        self.rules = rules
+        self.parent_region = parent_region
+        self.links = {}
+
+    def link(self, name: str, after: Iterable[str] = (), regions: Iterable[str] = (),
+             items: Iterable[str] = (), level: Optional[int] = None) -> None:
+        region_need = region_mask_of(regions)
+        item_need = item_mask_of(items)
+        points_need = level_points_required(level) if level else 0
+        for previous in after:
+            previous_regions, previous_items, previous_points = self.links[previous]
+            region_need |= previous_regions | REGION_BITS[self.parent_region(previous)]
+            item_need |= previous_items
+            points_need = max(points_need, previous_points)
+        self.links[name] = (region_need, item_need, points_need)
+
+    def rule(self, name: str) -> Callable:
+        """Access rule for the link's own location."""
+        return self.rules.compile(*self.links[name])
+
+    def reach(self, name: str) -> Callable:
+        """Equivalent of state.can_reach_location(name) for other rules."""
+        region_need, item_need, points_need = self.links[name]
+        region_need |= REGION_BITS[self.parent_region(name)]
+        return self.rules.compile(region_need, item_need, points_need)
+
+
+def rule_reads_options(rule) -> bool:
+    """True if `rule`, or any function it closes over or takes as a default,
+    looks up an `options` attribute when called."""
+    seen = set()
+    pending = [rule]
+    while pending:
+        func = pending.pop()
+        if id(func) in seen:
+            continue
+        seen.add(id(func))
+        if isinstance(func, (list, tuple)):
+            pending.extend(func)
+            continue
+        if isinstance(func, Tally):
+            pending.append(func.count)
+            continue
+        code = getattr(func, "__code__", None)
+        if code is None:
+            continue
+        codes = [code]
+        while codes:
+            c = codes.pop()
+            if "options" in c.co_names:
+                return True
+            codes.extend(const for const in c.co_consts if hasattr(const, "co_names"))
+        for cell in func.__closure__ or ():
+            try:
+                pending.append(cell.cell_contents)
+            except ValueError:  # empty cell
+                pass
+        pending.extend(func.__defaults__ or ())
+    return False
+
+
+class RuleRegistry:
+    """Collects every access rule set_rules assigns and applies each spot's
+    final rule once, in apply().
+
+    Rules built by DRRules.compile are simplified on the way: the spot's own
+    parent region is dropped from the region mask (Location.can_reach and
+    Entrance.can_reach check it already), and a rule left with nothing to
+    check is not assigned at all, so the spot keeps AP's default rule.
+    """
+
+    def __init__(self, rules: DRRules):
+        self.rules = rules
+        self.pending = {}
+        self.replaced = 0
+
+    def set(self, spot, rule: Callable) -> None:
+        if spot in self.pending:
+            self.replaced += 1
+        self.pending[spot] = rule
+
+    def apply(self) -> int:
+        """Assigns the collected rules. Returns how many rule closures were
+        never assigned: overwritten ones plus ones that checked only the
+        parent region."""
+        dropped = self.replaced
+        for spot, rule in self.pending.items():
+            masks = getattr(rule, "masks", None)
+            if masks is not None:
+                region_need, item_need, points_need, then = masks
+                parent_bit = REGION_BITS.get(spot.parent_region.name, 0)
+                if region_need & parent_bit:
+                    region_need &= ~parent_bit
+                    rule = self.rules.compile(region_need, item_need, points_need, then)
+                if not (region_need or item_need or points_need or then):
+                    dropped += 1
+                    continue
+            spot.access_rule = rule
+        self.pending.clear()
+        return dropped
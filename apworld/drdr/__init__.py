@@ -1,22 +1,33 @@
 # world/drdr/__init__.py
+import logging
+import os
 from typing import Any, Dict, Set, List
 
 from BaseClasses import MultiWorld, Region, Item, Entrance, Tutorial, ItemClassification, LocationProgressType
 
-from worlds.AutoWorld import World, WebWorld
+from worlds.AutoWorld import World, WebWorld, LogicMixin
 from worlds.generic.Rules import set_rule, add_rule, add_item_rule, forbid_item
 
 from .Items import DRItem, DRItemCategory, item_dictionary, key_item_names, item_descriptions, BuildItemPool, specialty_items, progression_skills, microwave_food_items, challenge_tool_items
 from .Locations import DRLocation, DRLocationCategory, location_tables, location_dictionary
 from .Options import DROption, dr_option_groups
+from .RuleProfiler import RuleProfiler, profiling_enabled
+from .Rules import (
+    DRRules, RuleRegistry, StoryChain, on_collect, on_remove, region_mask_of,
+    RuleCache, rule_cache,
+    REGION_LEVEL_VALUES, reachable_region_points,
+)
 
 import re
 
-from .DoorRandomization import generate_door_randomization_for_ap, DOOR_MODE_CHAOS, DOOR_MODE_PAIRED, AREA_NAMES
+from .DoorRandomization import (
+    generate_door_layout, encode_door_redirects, decode_door_redirects, DOOR_MODE_CHAOS, DOOR_MODE_PAIRED, AREA_NAMES,
+    DOOR_TABLE,
+)
 from .shared_data import (
     AREA_KEY_NAMES, TIME_KEY_NAMES,
     AP_TRIGGER_LOCATIONS, expand_trigger_location_names,
-    trigger_location_required_regions,
+    trigger_location_required_regions, STICKERS, SURVIVORS,
 )
 
 # Main scoop names eligible for randomized ordering (ScoopSanity)
@@ -125,7 +136,7 @@ SCOOP_REGION_REQUIREMENTS = {
 
 # Level requirements for each main scoop position (0-indexed) in the shuffled order.
 # Scoops at higher positions require higher levels, spreading them across spheres.
-# Uses the same level thresholds as LEVEL_SPHERE_GATES.
+# Each gate is checked against LEVEL_POINT_THRESHOLDS like the level-up rules.
 SCOOP_POSITION_LEVEL_GATES = [
     None,  # Position 0: no level gate (accessible ASAP)
     None,  # Position 1: no level gate
@@ -161,7 +172,8 @@ PSYCHOPATH_SCOOP_NAMES = [
 ]
 
 # Survivor counts per scoop: (total_survivors, female_survivors)
-# Used by ScoopSanity logic for "Escort 8 survivors at once" and "Frank the pimp"
+# Used by ScoopSanity logic for "Escort 8 survivors at once" and "Frank the pimp",
+# through the running totals DRWorld.collect/remove keep in the state.
 # Excludes Kent chain (Tad requires 3 scoops) and free survivors (Bill, Jeff, Natalie)
 SCOOP_SURVIVOR_COUNTS = {
     # Survivor scoops
@@ -193,26 +205,25 @@ SCOOP_SURVIVOR_COUNTS = {
     "The Convicts": (1, 1),                 # Sophie Richard (F)
 }
 
-# Determines the value of the region towards levels
-REGION_LEVEL_VALUES = {
-    "Security Room": 1,
-    "Rooftop": 1,
-    "Paradise Plaza": 3,
-    "Entrance Plaza": 2,
-    "Leisure Park": 3,
-    "Al Fresca Plaza": 2,
-    "Food Court": 2,
-    "Wonderland Plaza": 3,
-    "North Plaza": 2,
-    "Maintenance Tunnel": 4,
-    "Seon's Food and Stuff": 1,
-    "Crislip's Home Saloon": 1,
-    "Colby's Movieland": 1,
-}
+# REGION_LEVEL_VALUES (imported above) and the level thresholds live in
+# Rules.py, next to the cached point total they feed.
+
+# Layout of the dict fill_slot_data returns. Version 1 (no
+# slot_data_version field) repeated every option at the top level and sent
+# parallel locationsId/locationsAddress/locationsTarget and itemsId/
+# itemsAddress arrays. Version 2 sent each option once and encoded those
+# tables compactly. Version 3 sends door_redirects as door-table index pairs
+# instead of per-door target geometry. Version 4 replaces the expanded
+# pp_bonus_trigger_data with pp_bonus_trigger_ids. Bump this whenever the
+# layout changes, and teach DRAP/SlotData.lua to read the new one.
+SLOT_DATA_VERSION = 4
+
+# Items.py dr_code by item name, for the slot_data location/item tables.
+name_to_dr_code = {item.name: item.dr_code for item in item_dictionary.values()}
+
 
 def get_reachable_region_points(state, player: int) -> int:
-    return sum(value for region, value in REGION_LEVEL_VALUES.items() 
-               if state.can_reach_region(region, player))
+    return reachable_region_points(state, player)
 
 # PP Sticker groups: (count, required_regions, required_locations)
 # Used by milestone rules to dynamically count how many stickers the player can reach
@@ -272,6 +283,19 @@ class DRWeb(WebWorld):
     option_groups = dr_option_groups
 
 
+class DRLogic(LogicMixin):
+    # Per-player RuleCache (item/region masks, escort totals, tallies) kept
+    # next to prog_items, so prog_items holds nothing but real items.
+    drdr_rule_caches: Dict[int, RuleCache]
+
+    def init_mixin(self, multiworld: MultiWorld) -> None:
+        self.drdr_rule_caches = {}
+
+    def copy_mixin(self, new_state) -> Any:
+        new_state.drdr_rule_caches = {player: cache.copy() for player, cache in self.drdr_rule_caches.items()}
+        return new_state
+
+
 class DRWorld(World):
     """
     Dead Rising is a game about re-killing people and taking photos.
@@ -299,8 +323,23 @@ class DRWorld(World):
         self.enabled_location_categories = set()
         self.door_redirects = {}
         self.scoop_order = []
+        self.rule_profiler = None
+        self.item_classifications = None
+        self.pool_size = 0
+        self.ut_slot_data = None
+        self.placement_rows = None
 
     def generate_early(self):
+        # Universal Tracker re-generation (see interpret_slot_data): the
+        # connected slot's slot_data, else None for a real generation.
+        _passthrough = getattr(self.multiworld, "re_gen_passthrough", None)
+        self.ut_slot_data = None
+        if _passthrough and self.game in _passthrough:
+            self.ut_slot_data = _passthrough[self.game] or {}
+            self._adopt_slot_data_options(self.ut_slot_data.get("options") or {})
+
+        self.item_classifications = self._build_item_classifications()
+
         # Savior+ScoopSanity drops main scoops entirely — the player wins by
         # rescuing survivors, so main scoops would only advance unused state.
         self.main_scoops_enabled = not (
@@ -345,22 +384,26 @@ class DRWorld(World):
                 self.multiworld.push_precollected(self.create_item(key_name))
             self.multiworld.push_precollected(self.create_item("Maintenance Tunnel Access Key"))
 
-            # Get the door randomizer mode (0 = chaos, 1 = paired)
-            door_mode = self.options.door_randomizer_mode.value
-
-            # Generate door redirects for this player using per-slot random
-            # This ensures each player gets a unique door layout even with the same server seed
-            self.door_redirects = generate_door_randomization_for_ap(
-                self.random,
-                mode=door_mode,
-                randomize_rooftop_service_hallway=bool(
-                    self.options.randomize_rooftop_service_hallway_doors
-                ),
-                # ScoopSanity unlocks the Security Room <-> Entrance Plaza
-                # door pair (no longer cutscene-only after Jessie), so they
-                # become randomizable+walkable.
-                scoop_sanity=bool(self.options.scoop_sanity.value),
-            )
+            if self.ut_slot_data is not None:
+                # Universal Tracker: take the seed's real layout rather than
+                # generating an unrelated one.
+                self.door_redirects = self._slot_data_door_redirects(self.ut_slot_data)
+            else:
+                # Get the door randomizer mode (0 = chaos, 1 = paired)
+                door_mode = self.options.door_randomizer_mode.value
+
+                # Draw the door seed from this player's own random, so each
+                # player gets a unique door layout even with the same server
+                # seed.
+                self.door_redirects = generate_door_layout(
+                    self.random.randint(0, 2 ** 31),
+                    door_mode,
+                    bool(self.options.randomize_rooftop_service_hallway_doors),
+                    # ScoopSanity unlocks the Security Room <-> Entrance Plaza
+                    # door pair (no longer cutscene-only after Jessie), so they
+                    # become randomizable+walkable.
+                    bool(self.options.scoop_sanity.value),
+                )
 
         # If ScoopSanity is enabled, generate a randomized main scoop order and precollect all time keys
         if self.options.scoop_sanity:
@@ -368,12 +411,9 @@ class DRWorld(World):
                 self.multiworld.push_precollected(self.create_item(time_key))
             if self.main_scoops_enabled:
                 # Universal Tracker re-generation: use the connected slot's
-                # actual order (see interpret_slot_data) instead of rolling
-                # a fresh one, so tracker logic matches the real seed.
-                _passthrough = getattr(self.multiworld, "re_gen_passthrough", None)
-                _ut_order = None
-                if _passthrough and self.game in _passthrough:
-                    _ut_order = (_passthrough[self.game] or {}).get("scoop_order")
+                # actual order instead of rolling a fresh one, so tracker
+                # logic matches the real seed.
+                _ut_order = self.ut_slot_data.get("scoop_order") if self.ut_slot_data else None
                 if _ut_order:
                     self.scoop_order = list(_ut_order)
                 else:
@@ -393,10 +433,34 @@ class DRWorld(World):
             self.multiworld.push_precollected(self.create_item("Out of Control"))
 
 
+    def _adopt_slot_data_options(self, slot_options: Dict[str, Any]) -> None:
+        # fill_slot_data's option values back onto self.options. Choices the
+        # client gets as strings (vanilla_progression) map back through the
+        # option's name table; anything unrecognised keeps the YAML value.
+        for name, value in slot_options.items():
+            option = getattr(self.options, name, None)
+            if option is None:
+                continue
+            if isinstance(value, str):
+                value = getattr(type(option), "options", {}).get(value, option.value)
+            elif isinstance(value, bool):
+                value = int(value)
+            option.value = value
+
+    @staticmethod
+    def _slot_data_door_redirects(slot_data: Dict[str, Any]) -> Dict[str, dict]:
+        redirects = slot_data.get("door_redirects") or {}
+        # Version 3+ sends door-table index pairs, older versions the
+        # expanded per-door dict.
+        if isinstance(redirects, list):
+            return decode_door_redirects(redirects)
+        return dict(redirects)
+
     def create_regions(self):
         regions: Dict[str, Region] = {}
+        manifest = self._location_manifest()
         regions["Menu"] = self.create_region("Menu", [])
-        regions.update({region_name: self.create_region(region_name, location_tables[region_name]) for region_name in [
+        regions.update({region_name: self.create_region(region_name, manifest[region_name]) for region_name in [
             "Heliport",
             "Security Room",
             "Rooftop",
@@ -423,6 +487,18 @@ class DRWorld(World):
             regions[from_region].exits.append(connection)
             connection.connect(regions[to_region])
 
+        # Door randomizer precollects every area key and the Maintenance
+        # Tunnel Access Key (generate_early), so no entrance carries a rule
+        # and every region is reachable from the start. Model that as a
+        # single hub -- Menu connects straight to each region -- instead of
+        # the mall graph below, so sweeps walk one entrance per region.
+        # Region names, and with them every location rule, are unchanged.
+        if self.options.door_randomizer:
+            for region_name in regions:
+                if region_name != "Menu":
+                    create_connection("Menu", region_name)
+            return
+
         create_connection("Menu", "Heliport")
         create_connection("Heliport", "Security Room")
         create_connection("Security Room", "Rooftop")
@@ -520,10 +596,28 @@ class DRWorld(World):
         "Meet Jessie in the Warehouse",
     }
 
-    # For each region, add the associated locations retrieved from the corresponding location_table
-    def create_region(self, region_name, location_table) -> Region:
-        new_region = Region(region_name, self.player, self.multiworld)
+    # Per-region location manifests, keyed on the options the filters below
+    # depend on: (scoop_sanity, goal, pp_bonus_locations). Every slot with
+    # the same settings reuses the first slot's manifest instead of running
+    # the whole static location table through the filters again.
+    _location_manifests: Dict[tuple, Dict[str, List[tuple]]] = {}
+
+    def _location_manifest(self) -> Dict[str, List[tuple]]:
+        key = (bool(self.options.scoop_sanity), self.options.goal.value,
+               bool(self.options.pp_bonus_locations))
+        manifest = DRWorld._location_manifests.get(key)
+        if manifest is None:
+            manifest = {region_name: self._filter_location_table(location_table)
+                        for region_name, location_table in location_tables.items()}
+            DRWorld._location_manifests[key] = manifest
+        return manifest
+
+    # The locations of one region's table that this slot's options create, as
+    # (name, category, default_item, address) tuples. Address None marks an
+    # event location; create_region places its locked event item.
+    def _filter_location_table(self, location_table) -> List[tuple]:
         goal_location_name = self.GOAL_LOCATIONS[self.options.goal.value]
+        manifest = []
 
         for location in location_table:
             # Skip time-wait locations when ScoopSanity is enabled (time is frozen)
@@ -538,142 +632,126 @@ class DRWorld(World):
 
             # Goal location: create but don't place an item (Victory placed in create_items)
             if location.name == goal_location_name:
-                new_location = DRLocation(
-                    self.player,
-                    location.name,
-                    location.category,
-                    location.default_item,
-                    self.location_name_to_id[location.name],
-                    new_region
-                )
-                new_region.locations.append(new_location)
+                manifest.append((location.name, location.category, location.default_item,
+                                 self.location_name_to_id[location.name]))
             elif location.category in self.enabled_location_categories:
                 # Skip PP-bonus locations whose required predecessor wasn't
-                # created this seed (set populated in __init__ above).
+                # created this seed (set populated in generate_early).
                 if (location.category == DRLocationCategory.PP_BONUS
                         and location.name in self._pp_bonus_excluded_names):
                     continue
-                new_location = DRLocation(
-                    self.player,
-                    location.name,
-                    location.category,
-                    location.default_item,
-                    self.location_name_to_id[location.name],
-                    new_region
-                )
-                new_region.locations.append(new_location)
+                manifest.append((location.name, location.category, location.default_item,
+                                 self.location_name_to_id[location.name]))
             elif location.name in self.PROLOGUE_MAIN_SCOOPS:
                 # Always-included prologue main-scoop locations — they fire
                 # during the forced intro regardless of AP state, so they're
                 # real checks even when the rest of MAIN_SCOOP is disabled.
-                new_location = DRLocation(
-                    self.player,
-                    location.name,
-                    location.category,
-                    location.default_item,
-                    self.location_name_to_id[location.name],
-                    new_region
-                )
-                new_region.locations.append(new_location)
+                manifest.append((location.name, location.category, location.default_item,
+                                 self.location_name_to_id[location.name]))
             elif location.category == DRLocationCategory.EVENT:
                 # Replace events with event items for spoiler log readability.
-                event_item = self.create_item(location.default_item)
-                new_location = DRLocation(
-                    self.player,
-                    location.name,
-                    location.category,
-                    location.default_item,
-                    None,
-                    new_region
-                )
+                manifest.append((location.name, location.category, location.default_item, None))
+        return manifest
+
+    # For each region, add the locations listed for it in the manifest
+    def create_region(self, region_name, manifest) -> Region:
+        new_region = Region(region_name, self.player, self.multiworld)
+
+        for name, category, default_item, address in manifest:
+            new_location = DRLocation(self.player, name, category, default_item, address, new_region)
+            if address is None:
+                event_item = self.create_item(default_item)
                 event_item.code = None
                 new_location.place_locked_item(event_item)
-                new_region.locations.append(new_location)
+            new_region.locations.append(new_location)
 
         self.multiworld.regions.append(new_region)
         return new_region
 
     def create_items(self):
-        itempool: List[DRItem] = []
-        itempoolSize = 0
         goal_location_name = self.GOAL_LOCATIONS[self.options.goal.value]
 
-        for location in self.multiworld.get_locations(self.player):
-                item_data = item_dictionary[location.default_item_name]
-                if item_data.category in [DRItemCategory.SKIP] or \
-                        location.category in [DRLocationCategory.EVENT]:
-                    # Skip the goal location - we handle Victory placement separately
-                    if location.name == goal_location_name:
-                        continue
-                    item = self.create_item(location.default_item_name)
-                    self.multiworld.get_location(location.name, self.player).place_locked_item(item)
-                elif (location.category in self.enabled_location_categories
-                      or location.name in self.PROLOGUE_MAIN_SCOOPS):
-                    # Skip the goal location from the item pool (it gets Victory instead)
-                    if location.name == goal_location_name:
-                        continue
-                    # Prologue main-scoop locations are always real checkable
-                    # locations (see PROLOGUE_MAIN_SCOOPS), even when MAIN_SCOOP
-                    # category isn't enabled (Savior+ScoopSanity). They need
-                    # items in the pool just like any other checkable location.
-                    itempoolSize += 1
+        # One pass over this slot's location manifest (see create_region):
+        # EVENT locations already hold their event item, SKIP defaults are
+        # locked in place, and every other non-goal location takes a pool item.
+        pool_size = 0
+        for region_locations in self._location_manifest().values():
+            for name, category, default_item, address in region_locations:
+                # The goal location gets Victory below
+                if address is None or name == goal_location_name:
+                    continue
+                if item_dictionary[default_item].category == DRItemCategory.SKIP:
+                    self.get_location(name).place_locked_item(self.create_item(default_item))
+                else:
+                    pool_size += 1
 
         self.get_location(goal_location_name).place_locked_item(self.create_item("Victory"))
 
+        self.pool_size = pool_size
+        self.multiworld.itempool += [self.create_item(name)
+                                     for name, copies in self._build_item_counts().items()
+                                     for _ in range(copies)]
+
+    def _build_item_counts(self) -> Dict[str, int]:
         # Under Savior+ScoopSanity, drop main scoop items from the pool —
         # their locations don't exist and their completion would only advance
         # story state the goal doesn't need.
+        # Universal Tracker never fills, so the pool is only sized, not drawn.
+        if self.ut_slot_data is not None:
+            return {self.get_filler_item_name(): self.pool_size}
         excluded_scoops = MAIN_SCOOP_NAMES if not self.main_scoops_enabled else ()
-        foo = BuildItemPool(self.multiworld, itempoolSize, self.options,
-                            excluded_scoop_names=excluded_scoops)
-
-        for item in foo:
-            itempool.append(self.create_item(item.name))
-
-        self.multiworld.itempool += itempool
-
-
+        return BuildItemPool(self.random, self.pool_size, self.options,
+                             excluded_scoop_names=excluded_scoops)
 
     def create_item(self, name: str) -> Item:
+        if self.item_classifications is None:
+            self.item_classifications = self._build_item_classifications()
+        return DRItem(name, self.item_classifications[name], self.item_name_to_id[name], self.player)
+
+    def _build_item_classifications(self) -> Dict[str, ItemClassification]:
+        # Every item's classification under this slot's options, built once
+        # (generate_early) so create_item is a dict lookup.
         # Skills and stat-upgrade items get Useful classification — guaranteed
         # in the multiworld pool (when enabled) but not part of progression
         # logic. Buffs go to filler. Traps stay trap-classified.
         useful_categories = [DRItemCategory.SKILL, DRItemCategory.UPGRADE]
-        data = self.item_name_to_id[name]
-
-        if name in key_item_names or item_dictionary[name].category in [DRItemCategory.LOCK, DRItemCategory.EVENT]:
-            item_classification = ItemClassification.progression
-        elif item_dictionary[name].category == DRItemCategory.SCOOP and self.options.scoop_sanity:
-            item_classification = ItemClassification.progression
-        elif name in specialty_items and self.options.restricted_item_mode:
-            item_classification = ItemClassification.progression
-        elif name in microwave_food_items and self.options.pp_bonus_locations:
-            # Food items bypass the Seon's requirement in the microwave
-            # rules, so state.has must be able to see them in every mode.
-            item_classification = ItemClassification.progression
-        elif name in challenge_tool_items:
-            # A sent tool can satisfy the challenge rules -- replacing its
-            # spawn zones outside restricted mode, whitelisting the pickup
-            # inside it -- so state.has must see it in every mode.
-            item_classification = ItemClassification.progression
-        elif (name in progression_skills
-              and self.options.enable_skill_items
-              and self.options.vanilla_progression.value == 1):
-            # Skills that gate AP locations need to be progression so the
-            # fill algorithm treats them as accessibility keys. Without this,
-            # `state.has("Zombie Ride", ...)` rules cause FillError because
-            # only progression items count toward accessibility checks.
-            # (Mirrors BuildItemPool: skills only join the pool when
-            # enable_skill_items is on AND vanilla_progression == replace.)
-            item_classification = ItemClassification.progression
-        elif item_dictionary[name].category in useful_categories:
-            item_classification = ItemClassification.useful
-        elif item_dictionary[name].category == DRItemCategory.TRAP:
-            item_classification = ItemClassification.trap
-        else:
-            item_classification = ItemClassification.filler
+        classifications = {}
+
+        for name, item_data in item_dictionary.items():
+            if name in key_item_names or item_data.category in [DRItemCategory.LOCK, DRItemCategory.EVENT]:
+                item_classification = ItemClassification.progression
+            elif item_data.category == DRItemCategory.SCOOP and self.options.scoop_sanity:
+                item_classification = ItemClassification.progression
+            elif name in specialty_items and self.options.restricted_item_mode:
+                item_classification = ItemClassification.progression
+            elif name in microwave_food_items and self.options.pp_bonus_locations:
+                # Food items bypass the Seon's requirement in the microwave
+                # rules, so state.has must be able to see them in every mode.
+                item_classification = ItemClassification.progression
+            elif name in challenge_tool_items:
+                # A sent tool can satisfy the challenge rules -- replacing its
+                # spawn zones outside restricted mode, whitelisting the pickup
+                # inside it -- so state.has must see it in every mode.
+                item_classification = ItemClassification.progression
+            elif (name in progression_skills
+                  and self.options.enable_skill_items
+                  and self.options.vanilla_progression.value == 1):
+                # Skills that gate AP locations need to be progression so the
+                # fill algorithm treats them as accessibility keys. Without this,
+                # `state.has("Zombie Ride", ...)` rules cause FillError because
+                # only progression items count toward accessibility checks.
+                # (Mirrors BuildItemPool: skills only join the pool when
+                # enable_skill_items is on AND vanilla_progression == replace.)
+                item_classification = ItemClassification.progression
+            elif item_data.category in useful_categories:
+                item_classification = ItemClassification.useful
+            elif item_data.category == DRItemCategory.TRAP:
+                item_classification = ItemClassification.trap
+            else:
+                item_classification = ItemClassification.filler
+            classifications[name] = item_classification
 
-        return DRItem(name, item_classification, data, self.player)
+        return classifications
 
 
     def get_filler_item_name(self) -> str:
@@ -682,7 +760,8 @@ class DRWorld(World):
     def interpret_slot_data(self, slot_data):
         # Universal Tracker support: returning the slot data makes the
         # tracker re-generate with it attached as re_gen_passthrough, so
-        # generate_early can adopt the seed's real scoop order.
+        # generate_early adopts the seed's real options, scoop order and
+        # door layout, and skips door generation and pool drawing.
         return slot_data
 
     def pre_fill(self) -> None:
@@ -697,83 +776,172 @@ class DRWorld(World):
         if self.options.scoop_sanity and self.scoop_order:
             self.multiworld.early_items[self.player][self.scoop_order[0]] = 1
 
-    def set_rules(self) -> None:
-
-        # Helper: "Ending A reachable" gate used by a handful of challenge and
-        # survivor rules as a proxy for late-game progression. When main scoops
-        # are disabled (Savior+ScoopSanity), the Ending A location doesn't
-        # exist, so calling state.can_reach_location on it would fail at rule
-        # evaluation. In that mode we drop the gate — region requirements are
-        # enough for Savior's purposes.
-        def ending_a_ok(state):
-            if not self.main_scoops_enabled:
-                return True
-            return state.can_reach_location(
-                "Ending A: Solve all of the cases and be on the helipad at 12pm",
-                self.player,
-            )
-
-        # Default per-location rule: requires reaching the location's region.
-        # Sphere-0 regions get `lambda: True` so fill can place progression
-        # items there from the first sweep. More specific rules below tighten
-        # access where needed (set_rule replaces — later calls win).
-        SPHERE_0_REGIONS = {"Menu", "Heliport", "Security Room", "Level Ups", "Challenges"}
-
-        for region in self.multiworld.get_regions(self.player):
-            if region.name in SPHERE_0_REGIONS:
-                for location in region.locations:
-                    set_rule(location, lambda state: True)
-            else:
-                for location in region.locations:
-                    set_rule(location, lambda state, r=region.name:
-                             state.can_reach_region(r, self.player))
-
-        # Region-Based Levels
-        points = lambda state: get_reachable_region_points(state, self.player)
-
-        for level in range(2, 7):      # Levels 2-6
-            set_rule(self.multiworld.get_location(f"Reach Level {level}", self.player),
-                    lambda state, p=points: p(state) >= 1)
-
-        for level in range(7, 10):     # Levels 7-9
-            set_rule(self.multiworld.get_location(f"Reach Level {level}", self.player),
-                    lambda state, p=points: p(state) >= 2)
-
-        for level in range(10, 12):    # Levels 10-11
-            set_rule(self.multiworld.get_location(f"Reach Level {level}", self.player),
-                    lambda state, p=points: p(state) >= 4)
+    def collect(self, state, item) -> bool:
+        change = super().collect(state, item)
+        if change:
+            on_collect(state, self.player, item.name)
+            survivors = SCOOP_SURVIVOR_COUNTS.get(item.name)
+            if survivors and state.prog_items[self.player][item.name] == 1:
+                cache = rule_cache(state, self.player)
+                cache.escort_survivors += survivors[0]
+                cache.escort_females += survivors[1]
+        return change
+
+    def remove(self, state, item) -> bool:
+        change = super().remove(state, item)
+        if change:
+            on_remove(state, self.player, item.name)
+            survivors = SCOOP_SURVIVOR_COUNTS.get(item.name)
+            if survivors and state.prog_items[self.player][item.name] == 0:
+                cache = rule_cache(state, self.player)
+                cache.escort_survivors -= survivors[0]
+                cache.escort_females -= survivors[1]
+        return change
+
+    def _build_story_chain(self, rules: DRRules) -> StoryChain:
+        ENDING_A = "Ending A: Solve all of the cases and be on the helipad at 12pm"
+        story = StoryChain(
+            rules, lambda name: self.multiworld.get_location(name, self.player).parent_region.name)
 
-        for level in range(12, 13):    # Levels 12
-            set_rule(self.multiworld.get_location(f"Reach Level {level}", self.player),
-                    lambda state, p=points: p(state) >= 5)
+        # "Meet Jessie in the Warehouse" is a prologue main scoop that
+        # always exists (see PROLOGUE_MAIN_SCOOPS), so it is linked outside
+        # the main_scoops_enabled guard and Savior+ScoopSanity still gates
+        # it correctly.
+        story.link("Meet Jessie in the Warehouse", regions=["Warehouse"])
+
+        # The rest of the main-scoop completion chain. These locations are
+        # MAIN_SCOOP category and don't exist when Savior+ScoopSanity is
+        # active (main scoops excluded).
+        if self.main_scoops_enabled and self.options.scoop_sanity:
+            # ScoopSanity: gate every event of every scoop uniformly on
+            # (item received, previous scoop's completion, scoop regions,
+            # position-level gate). Replaces the vanilla event-to-event chain
+            # so randomized order can't strand intermediate events behind the
+            # vanilla predecessor. Day items aren't checked here -- the engine
+            # sets time flags directly on chain advance in ScoopSanity.
+            for i, scoop_name in enumerate(self.scoop_order):
+                prereq = ("Meet Jessie in the Warehouse" if i == 0
+                          else SCOOP_COMPLETION_MAP[self.scoop_order[i - 1]])
+                level_req = (SCOOP_POSITION_LEVEL_GATES[i]
+                             if i < len(SCOOP_POSITION_LEVEL_GATES)
+                             else None)
+                for event_name in SCOOP_EVENTS[scoop_name]:
+                    story.link(event_name, after=[prereq], items=[scoop_name],
+                               regions=SCOOP_REGION_REQUIREMENTS.get(scoop_name, []),
+                               level=level_req)
 
-        for level in range(13, 16):    # Levels 13-15
-            set_rule(self.multiworld.get_location(f"Reach Level {level}", self.player),
-                    lambda state, p=points: p(state) >= 7)
+            # Complete Memories is the post-chain anchor; gates on the last
+            # randomized scoop's completion regardless of which scoop that is.
+            story.link("Complete Memories", after=[SCOOP_COMPLETION_MAP[self.scoop_order[-1]]])
+
+        elif self.main_scoops_enabled:
+            # Vanilla path (story chains from Meet Jessie -> walk Brad through
+            # the mall to the safe room).
+            story.link("Complete Backup for Brad", after=["Meet Jessie in the Warehouse"],
+                       regions=["Leisure Park", "Paradise Plaza", "Food Court"], items=["Food Court key"])
+            story.link("Escort Brad to see Dr Barnaby", after=["Complete Backup for Brad"],
+                       regions=["Entrance Plaza", "Al Fresca Plaza"], items=["Entrance Plaza key"])
+            story.link("Complete Temporary Agreement", after=["Escort Brad to see Dr Barnaby"])
+
+            story.link("Meet back at the Security Room at 6am day 2", after=["Complete Temporary Agreement"],
+                       items=["DAY2_06_AM"])
+            story.link("Complete Image in the Monitor", after=["Meet back at the Security Room at 6am day 2"])
+            story.link("Complete Rescue the Professor", after=["Complete Image in the Monitor"])
+
+            story.link("Meet Steven", after=["Complete Rescue the Professor"],
+                       regions=["North Plaza", "Seon's Food and Stuff"])
+            story.link("Clean up... Register 6!", after=["Meet Steven"])
+            story.link("Complete Medicine Run", after=["Clean up... Register 6!"])
+            story.link("Complete Professor's Past", after=["Complete Medicine Run"],
+                       items=["DAY2_06_AM", "DAY2_11_AM"])
+            story.link("Complete Girl Hunting", after=["Complete Professor's Past"])
+            story.link("Beat up Isabela", after=["Complete Girl Hunting"])
+            story.link("Complete Promise to Isabela", after=["Beat up Isabela"],
+                       items=["DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM"])
+            story.link("Save Isabela from the zombie", after=["Complete Promise to Isabela"])
+            story.link("Complete Transporting Isabela", after=["Save Isabela from the zombie"])
+            story.link("Carry Isabela back to the Security Room", after=["Complete Transporting Isabela"])
+            story.link("Complete Santa Cabeza", after=["Carry Isabela back to the Security Room"])
+
+            story.link("Meet back at the Security Room at 11am day 3", after=["Complete Santa Cabeza"],
+                       items=["DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM", "DAY3_11_AM"])
+            story.link("Complete Bomb Collector", after=["Meet back at the Security Room at 11am day 3"],
+                       regions=["Maintenance Tunnel"])
+            story.link("Beat Drivin Carlito", after=["Complete Bomb Collector"],
+                       regions=["Maintenance Tunnel"])
+            # Bomb Collector or Carlito; Carlito already requires Bomb
+            # Collector, so Bomb Collector alone is the requirement.
+            story.link("Meet back at the Security Room at 5pm day 3", after=["Complete Bomb Collector"])
+            story.link("Escort Isabela to Carlito's Hideout and have a chat",
+                       after=["Meet back at the Security Room at 5pm day 3"], regions=["Carlito's Hideout"])
+
+            story.link("Complete Jessie's Discovery", after=["Escort Isabela to Carlito's Hideout and have a chat"])
+            story.link("Meet Larry", after=["Complete Jessie's Discovery"])
+            story.link("Complete The Butcher", after=["Meet Larry"])
+            story.link("Complete Memories", after=["Complete The Butcher"])
+
+            story.link("Head back to the Security Room at the end of day 3", after=["Complete Memories"])
+            story.link("Witness Special Forces 10pm day 3", after=["Complete Memories"])
 
-        for level in range(16, 19):    # Levels 16-18
-            set_rule(self.multiworld.get_location(f"Reach Level {level}", self.player),
-                    lambda state, p=points: p(state) >= 10)
+        if self.main_scoops_enabled:
+            story.link(ENDING_A, after=["Complete Memories"], regions=["Heliport"],
+                       items=["DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM", "DAY3_11_AM", "DAY4_12_PM"])
 
-        for level in range(19, 22):    # Levels 19-21
-            set_rule(self.multiworld.get_location(f"Reach Level {level}", self.player),
-                    lambda state, p=points: p(state) >= 13)
+        # Overtime rules only apply when goal is Ending S
+        if self.options.goal.value == 0:
+            story.link("Get bit!", after=[ENDING_A])
+            story.link("Gather the suppressants and generator and talk to Isabela", after=["Get bit!"],
+                       regions=["Paradise Plaza", "Entrance Plaza", "Al Fresca Plaza", "Leisure Park",
+                                "Food Court", "Maintenance Tunnel", "Wonderland Plaza"])
+            story.link("See the crashed helicopter", after=["Get bit!"])
+            story.link("Frank sees a sick-ass RC Drone", after=["Get bit!"])
+            story.link("Give Isabela 5 queens", after=["Gather the suppressants and generator and talk to Isabela"])
+            story.link("Reach the end of the tunnel with Isabela", after=["Give Isabela 5 queens"])
+            story.link("Get to the Humvee", after=["Give Isabela 5 queens"], regions=["Tunnels"])
+            story.link("Fight a tank and win", after=["Get to the Humvee"])
+            story.link("Ending S: Beat up Brock with your bare fists!", after=["Fight a tank and win"])
+            story.link("Kill 10 Special Forces", after=["Get bit!", ENDING_A],
+                       regions=["Paradise Plaza"], items=["DAY3_11_AM"])
+            story.link("Kill 100 zombies with an RPG", after=["Get bit!"], regions=["Maintenance Tunnel"])
+
+        return story
 
-        for level in range(22, 26):    # Levels 22-25
-            set_rule(self.multiworld.get_location(f"Reach Level {level}", self.player),
-                    lambda state, p=points: p(state) >= 17)
+    def set_rules(self) -> None:
+        # Compiled region/item masks (see Rules.py). rules.requires() is used
+        # for every rule whose requirements are plain region reach and
+        # single-copy LOCK/SCOOP items; the rest rides along as `then`.
+        #
+        # Options are resolved here, once: rules below pick their ScoopSanity
+        # or vanilla requirements with `if scoop_sanity else` and pass
+        # restricted-mode items as restricted_any, so no rule closure reads
+        # self.options while fill is running (checked at the end).
+        scoop_sanity = bool(self.options.scoop_sanity)
+        restricted_mode_on = bool(self.options.restricted_item_mode.value)
+        rules = DRRules(self.player, restricted_items=restricted_mode_on)
+        story = self._build_story_chain(rules)
 
-        for level in range(26, 31):    # Levels 26-30
-            set_rule(self.multiworld.get_location(f"Reach Level {level}", self.player),
-                    lambda state, p=points: p(state) >= 22)
+        # Helper: "Ending A reachable" gate used by a handful of challenge and
+        # survivor rules as a proxy for late-game progression. When main scoops
+        # are disabled (Savior+ScoopSanity), the Ending A location doesn't
+        # exist, so there is nothing to gate on. In that mode we drop the
+        # gate — region requirements are enough for Savior's purposes.
+        if self.main_scoops_enabled:
+            ending_a_ok = story.reach("Ending A: Solve all of the cases and be on the helipad at 12pm")
+        else:
+            def ending_a_ok(state):
+                return True
 
-        for level in range(31, 41):    # Levels 31-40
-            set_rule(self.multiworld.get_location(f"Reach Level {level}", self.player),
-                    lambda state, p=points: p(state) >= 23)
+        # Every rule below goes through the registry and is applied once at
+        # the end (later calls for the same spot win). A location without a
+        # rule of its own keeps AP's default: Location.can_reach already
+        # requires the parent region, so no per-region closure is needed.
+        registry = RuleRegistry(rules)
 
-        for level in range(41, 51):    # Levels 41-50
-            set_rule(self.multiworld.get_location(f"Reach Level {level}", self.player),
-                    lambda state, p=points: p(state) >= 25)
+        # Region-Based Levels. Each "Reach Level N" rule compares the cached
+        # region-point total (see Rules.py) against N's threshold band.
+        for level in range(2, 51):
+            registry.set(self.multiworld.get_location(f"Reach Level {level}", self.player),
+                     rules.level(level))
 
         # Exclude Levels Above code
         if self.options.exclude_levels:
@@ -804,29 +972,20 @@ class DRWorld(World):
 
         # Victory condition based on goal
         goal_location_name = self.GOAL_LOCATIONS[self.options.goal.value]
-        set_rule(self.multiworld.get_location("Victory", self.player), lambda state: state.can_reach_location(goal_location_name, self.player))
+        if goal_location_name in story.links:
+            registry.set(self.multiworld.get_location("Victory", self.player), story.reach(goal_location_name))
+        else:
+            registry.set(self.multiworld.get_location("Victory", self.player), rules.reached(goal_location_name))
 
         # Savior goal: the synthetic goal location is reachable once the
         # player can reach at least `number_of_survivors` "Rescue X" locations.
-        # We capture the target in a local so the closure doesn't pay the
-        # options-attribute-lookup cost on every rule evaluation.
+        # The reachable-rescue count is a Tally, so it is computed once per
+        # state version however often fill re-checks the goal.
         if self.options.goal.value == 2:
-            savior_target = self.options.number_of_survivors.value
-            savior_player = self.player
-            savior_rescue_locations = list(self.ALL_RESCUE_LOCATIONS)
-
-            def savior_rule(state, _target=savior_target, _player=savior_player,
-                            _locs=savior_rescue_locations):
-                reached = 0
-                for loc_name in _locs:
-                    if state.can_reach_location(loc_name, _player):
-                        reached += 1
-                        if reached >= _target:
-                            return True
-                return False
-
-            set_rule(self.multiworld.get_location(self.SAVIOR_GOAL_LOCATION, self.player),
-                     savior_rule)
+            rescues = rules.reach_count(
+                "savior_rescues", [(name, 1) for name in self.ALL_RESCUE_LOCATIONS])
+            registry.set(self.multiworld.get_location(self.SAVIOR_GOAL_LOCATION, self.player),
+                     rescues.at_least(self.options.number_of_survivors.value))
 
             # When main scoops are enabled under Savior, Ending A still exists
             # as filler — mark it excluded from progression so fill doesn't
@@ -852,13 +1011,13 @@ class DRWorld(World):
         # Brad escort completes (the mission fires the cutscene itself).
         # Generation now keeps Backup out of the first slot, so that branch
         # is a safeguard for hand-edited orders.
-        if (not self.options.scoop_sanity
+        if (not scoop_sanity
                 or (self.scoop_order and self.scoop_order[0] == "Backup for Brad")):
-            _shutter = lambda state: state.can_reach_location("Escort Brad to see Dr Barnaby", self.player)
+            ep_shutter = rules.requires(
+                regions=["Entrance Plaza"],
+                then=story.reach("Escort Brad to see Dr Barnaby"))
         else:
-            _shutter = lambda state: state.can_reach_region("Warehouse", self.player)
-        ep_shutter = lambda state: (state.can_reach_region("Entrance Plaza", self.player)
-                                    and _shutter(state))
+            ep_shutter = rules.requires(regions=["Entrance Plaza", "Warehouse"])
 
         # PP-bonus rules (per-count for "counted" entries). Per-location rule
         # combines: required_regions (ALL reachable; first may be bypassed by
@@ -867,31 +1026,28 @@ class DRWorld(World):
         # mode, requires ANY one of the listed items), and ep_shutter (the
         # entry sits behind Entrance Plaza's storefront shutters).
         if self.options.pp_bonus_locations:
-            restricted_mode_on = bool(self.options.restricted_item_mode.value)
-
             def _make_rule(required_regions, alt_item, req_loc, items_any,
                            restricted_on=restricted_mode_on,
                            player=self.player):
+                # Region gating: ALL required regions must be reachable,
+                # except the first can be bypassed by alt_item. The
+                # bypassable region stays a runtime check; the rest are
+                # compiled into the mask.
+                first = required_regions[0] if required_regions and alt_item else None
+                masked_regions = required_regions[1:] if first else required_regions
+                req_event = rules.event(req_loc) if req_loc else None
+
                 def rule(state):
-                    # Region gating: ALL required regions must be reachable,
-                    # except the first can be bypassed by alt_item.
-                    if required_regions:
-                        first = required_regions[0]
-                        first_ok = state.can_reach_region(first, player)
-                        if not first_ok and alt_item:
-                            first_ok = state.has(alt_item, player)
-                        if not first_ok:
-                            return False
-                        for r in required_regions[1:]:
-                            if not state.can_reach_region(r, player):
-                                return False
-                    if req_loc and not state.can_reach_location(req_loc, player):
+                    if first and not (state.can_reach_region(first, player)
+                                      or state.has(alt_item, player)):
+                        return False
+                    if req_event and not state.has(req_event, player):
                         return False
                     if restricted_on and items_any:
                         if not any(state.has(it, player) for it in items_any):
                             return False
                     return True
-                return rule
+                return rules.requires(regions=masked_regions, then=rule)
 
             # Entries flagged ep_shutter sit inside Entrance Plaza's
             # storefronts, so reaching EP is not enough -- the shutter
@@ -937,32 +1093,29 @@ class DRWorld(World):
                     _required = list(_entry.get("required_regions") or [])
                     _required_alts = _entry.get("alt_items_any") or []
 
-                    def _make_count_rule(n, counts=_region_counts,
-                                         required=_required,
+                    def _zone_total(state, counts=[(region_mask_of([r]), c) for r, c in _region_counts.items()]):
+                        reachable = rules.region_mask(state)
+                        return sum(c for bit, c in counts if reachable & bit)
+
+                    def _make_count_rule(n, total=rules.tally(f"zones_{_entry['id']}", _zone_total),
+                                         required=region_mask_of(_required),
                                          alts=_required_alts,
-                                         req_loc=_req_loc,
+                                         req_event=rules.event(_req_loc) if _req_loc else None,
                                          items_any=_items_any,
                                          restricted_on=restricted_mode_on,
                                          player=self.player):
                         def rule(state):
-                            if required and not all(
-                                    state.can_reach_region(r, player)
-                                    for r in required):
+                            reachable = rules.region_mask(state)
+                            if reachable & required != required:
                                 if restricted_on or not any(
                                         state.has(it, player) for it in alts):
                                     return False
-                            if req_loc and not state.can_reach_location(req_loc, player):
+                            if req_event and not state.has(req_event, player):
                                 return False
                             if restricted_on and items_any:
                                 if not any(state.has(it, player) for it in items_any):
                                     return False
-                            total = 0
-                            for r, c in counts.items():
-                                if state.can_reach_region(r, player):
-                                    total += c
-                                    if total >= n:
-                                        return True
-                            return False
+                            return total(state) >= n
                         return rule
 
                     _targets = [(_names[_i], _i + 1)
@@ -977,7 +1130,7 @@ class DRWorld(World):
                         _rule = _make_count_rule(_n)
                         if _shuttered:
                             _rule = _gate_on_shutter(_rule)
-                        set_rule(_loc, _rule)
+                        registry.set(_loc, _rule)
                     continue
 
                 # Build a list of (location_name, required_regions) tuples
@@ -1008,31 +1161,31 @@ class DRWorld(World):
                     _rule = _make_rule(_regions, _alt_item, _req_loc, _items_any)
                     if _shuttered:
                         _rule = _gate_on_shutter(_rule)
-                    set_rule(_loc, _rule)
+                    registry.set(_loc, _rule)
 
         if not self.options.door_randomizer:
             # Normal key-based entrance rules
-            set_rule(self.multiworld.get_entrance("Security Room -> Rooftop", self.player), lambda state: state.has("Rooftop key", self.player))
-            set_rule(self.multiworld.get_entrance("Rooftop -> Warehouse", self.player), lambda state: state.has("Warehouse key", self.player))
-            set_rule(self.multiworld.get_entrance("Warehouse -> Paradise Plaza", self.player), lambda state: state.has("Paradise Plaza key", self.player))
-            set_rule(self.multiworld.get_entrance("Paradise Plaza -> Colby's Movieland", self.player), lambda state: state.has("Colby's Movieland key", self.player))
-            set_rule(self.multiworld.get_entrance("Paradise Plaza -> Leisure Park", self.player), lambda state: state.has("Leisure Park key", self.player))
-            set_rule(self.multiworld.get_entrance("Leisure Park -> Food Court", self.player), lambda state: state.has("Food Court key", self.player))
-            set_rule(self.multiworld.get_entrance("Leisure Park -> North Plaza", self.player), lambda state: state.has("North Plaza key", self.player))
-            set_rule(self.multiworld.get_entrance("Leisure Park -> Maintenance Tunnel", self.player), lambda state: state.has("Maintenance Tunnel key", self.player))
-            set_rule(self.multiworld.get_entrance("Food Court -> Al Fresca Plaza", self.player), lambda state: state.has("Al Fresca Plaza key", self.player))
-            set_rule(self.multiworld.get_entrance("Food Court -> Wonderland Plaza", self.player), lambda state: state.has("Wonderland Plaza key", self.player))
-            set_rule(self.multiworld.get_entrance("Food Court -> Leisure Park", self.player), lambda state: state.has("Leisure Park key", self.player))
-            set_rule(self.multiworld.get_entrance("Al Fresca Plaza -> Entrance Plaza", self.player), lambda state: state.has("Entrance Plaza key", self.player))
-            set_rule(self.multiworld.get_entrance("Al Fresca Plaza -> Food Court", self.player), lambda state: state.has("Food Court key", self.player))
-            set_rule(self.multiworld.get_entrance("Entrance Plaza -> Al Fresca Plaza", self.player), lambda state: state.has("Al Fresca Plaza key", self.player))
-            set_rule(self.multiworld.get_entrance("Wonderland Plaza -> North Plaza", self.player), lambda state: state.has("North Plaza key", self.player))
-            set_rule(self.multiworld.get_entrance("Wonderland Plaza -> Food Court", self.player), lambda state: state.has("Food Court key", self.player))
-            set_rule(self.multiworld.get_entrance("Seon's Food and Stuff -> North Plaza", self.player), lambda state: state.has("North Plaza key", self.player))
-            set_rule(self.multiworld.get_entrance("North Plaza -> Wonderland Plaza", self.player), lambda state: state.has("Wonderland Plaza key", self.player))
-            set_rule(self.multiworld.get_entrance("North Plaza -> Seon's Food and Stuff", self.player), lambda state: state.has("Seon's Food and Stuff key", self.player))
-            set_rule(self.multiworld.get_entrance("North Plaza -> Carlito's Hideout", self.player), lambda state: state.has("Carlito's Hideout key", self.player))
-            set_rule(self.multiworld.get_entrance("North Plaza -> Crislip's Home Saloon", self.player), lambda state: state.has("Crislip's Home Saloon key", self.player))
+            registry.set(self.multiworld.get_entrance("Security Room -> Rooftop", self.player), rules.requires(items=["Rooftop key"]))
+            registry.set(self.multiworld.get_entrance("Rooftop -> Warehouse", self.player), rules.requires(items=["Warehouse key"]))
+            registry.set(self.multiworld.get_entrance("Warehouse -> Paradise Plaza", self.player), rules.requires(items=["Paradise Plaza key"]))
+            registry.set(self.multiworld.get_entrance("Paradise Plaza -> Colby's Movieland", self.player), rules.requires(items=["Colby's Movieland key"]))
+            registry.set(self.multiworld.get_entrance("Paradise Plaza -> Leisure Park", self.player), rules.requires(items=["Leisure Park key"]))
+            registry.set(self.multiworld.get_entrance("Leisure Park -> Food Court", self.player), rules.requires(items=["Food Court key"]))
+            registry.set(self.multiworld.get_entrance("Leisure Park -> North Plaza", self.player), rules.requires(items=["North Plaza key"]))
+            registry.set(self.multiworld.get_entrance("Leisure Park -> Maintenance Tunnel", self.player), rules.requires(items=["Maintenance Tunnel key"]))
+            registry.set(self.multiworld.get_entrance("Food Court -> Al Fresca Plaza", self.player), rules.requires(items=["Al Fresca Plaza key"]))
+            registry.set(self.multiworld.get_entrance("Food Court -> Wonderland Plaza", self.player), rules.requires(items=["Wonderland Plaza key"]))
+            registry.set(self.multiworld.get_entrance("Food Court -> Leisure Park", self.player), rules.requires(items=["Leisure Park key"]))
+            registry.set(self.multiworld.get_entrance("Al Fresca Plaza -> Entrance Plaza", self.player), rules.requires(items=["Entrance Plaza key"]))
+            registry.set(self.multiworld.get_entrance("Al Fresca Plaza -> Food Court", self.player), rules.requires(items=["Food Court key"]))
+            registry.set(self.multiworld.get_entrance("Entrance Plaza -> Al Fresca Plaza", self.player), rules.requires(items=["Al Fresca Plaza key"]))
+            registry.set(self.multiworld.get_entrance("Wonderland Plaza -> North Plaza", self.player), rules.requires(items=["North Plaza key"]))
+            registry.set(self.multiworld.get_entrance("Wonderland Plaza -> Food Court", self.player), rules.requires(items=["Food Court key"]))
+            registry.set(self.multiworld.get_entrance("Seon's Food and Stuff -> North Plaza", self.player), rules.requires(items=["North Plaza key"]))
+            registry.set(self.multiworld.get_entrance("North Plaza -> Wonderland Plaza", self.player), rules.requires(items=["Wonderland Plaza key"]))
+            registry.set(self.multiworld.get_entrance("North Plaza -> Seon's Food and Stuff", self.player), rules.requires(items=["Seon's Food and Stuff key"]))
+            registry.set(self.multiworld.get_entrance("North Plaza -> Carlito's Hideout", self.player), rules.requires(items=["Carlito's Hideout key"]))
+            registry.set(self.multiworld.get_entrance("North Plaza -> Crislip's Home Saloon", self.player), rules.requires(items=["Crislip's Home Saloon key"]))
 
             # Maintenance Tunnel doors: every mall<->tunnel door needs the
             # Maintenance Tunnel key plus the Access Key -- either the AP
@@ -1041,20 +1194,19 @@ class DRWorld(World):
             # exits also need the destination zone's key. The tunnel-to-EP
             # exit only exists in ScoopSanity (see create_connection).
             _mt_region = self.multiworld.get_region("Maintenance Tunnel", self.player)
-            _tunnel_door = lambda state: (state.has("Maintenance Tunnel key", self.player)
-                                          and (state.has("Maintenance Tunnel Access Key", self.player)
-                                               or state.can_reach_region("Maintenance Tunnel", self.player)))
+            _tunnel_door = rules.requires(
+                items=["Maintenance Tunnel key"],
+                then=lambda state: (state.has("Maintenance Tunnel Access Key", self.player)
+                                    or state.can_reach_region("Maintenance Tunnel", self.player)))
             for _zone in MAINTENANCE_TUNNEL_ZONES:
                 _into = self.multiworld.get_entrance(f"{_zone} -> Maintenance Tunnel", self.player)
-                set_rule(_into, _tunnel_door)
+                registry.set(_into, _tunnel_door)
                 self.multiworld.register_indirect_condition(_mt_region, _into)
-                if _zone != "Entrance Plaza" or self.options.scoop_sanity:
-                    set_rule(self.multiworld.get_entrance(f"Maintenance Tunnel -> {_zone}", self.player),
-                             lambda state, k=f"{_zone} key": state.has("Maintenance Tunnel key", self.player)
-                                           and state.has(k, self.player))
-            set_rule(self.multiworld.get_entrance("Maintenance Tunnel -> Leisure Park", self.player),
-                     lambda state: state.has("Maintenance Tunnel key", self.player)
-                                   and state.has("Leisure Park key", self.player))
+                if _zone != "Entrance Plaza" or scoop_sanity:
+                    registry.set(self.multiworld.get_entrance(f"Maintenance Tunnel -> {_zone}", self.player),
+                             rules.requires(items=["Maintenance Tunnel key", f"{_zone} key"]))
+            registry.set(self.multiworld.get_entrance("Maintenance Tunnel -> Leisure Park", self.player),
+                     rules.requires(items=["Maintenance Tunnel key", "Leisure Park key"]))
 
             # ScoopSanity-only entrance rules:
             #   * Security Room -> Entrance Plaza requires Rooftop key +
@@ -1065,400 +1217,129 @@ class DRWorld(World):
             #     (key only). Not modeled in vanilla: EP access always goes
             #     through Al Fresca first, and the shutter opens during the
             #     Rescue the Professor escort, which chains behind EP reach.
-            if self.options.scoop_sanity:
-                set_rule(self.multiworld.get_entrance("Security Room -> Entrance Plaza", self.player),
-                         lambda state: state.has("Rooftop key", self.player)
-                                       and state.has("Warehouse key", self.player)
-                                       and state.has("Entrance Plaza key", self.player))
-                set_rule(self.multiworld.get_entrance("Paradise Plaza -> Entrance Plaza", self.player),
-                         lambda state: state.has("Entrance Plaza key", self.player))
-
-        # "Meet Jessie in the Warehouse" is a prologue main scoop that
-        # always exists (see PROLOGUE_MAIN_SCOOPS). Its rule is set outside
-        # the main_scoops_enabled guard so Savior+ScoopSanity still gates it
-        # correctly. Other rules that reference it from within the guard are
-        # fine because they only run when it's guaranteed to exist.
-        set_rule(self.multiworld.get_location("Meet Jessie in the Warehouse", self.player), lambda state: state.can_reach_region("Warehouse", self.player))
-
-        # Events — the rest of the main-scoop completion chain. These
-        # locations are MAIN_SCOOP category and don't exist when
-        # Savior+ScoopSanity is active (main scoops excluded). Skip the
-        # block to avoid KeyErrors from get_location on nonexistent names.
-        if self.main_scoops_enabled:
-            # ScoopSanity overrides this rule per-event in the SCOOP_EVENTS
-            # loop below; here is the vanilla path only (story chains from
-            # Meet Jessie -> walk Brad through the mall to the safe room).
-            set_rule(self.multiworld.get_location("Complete Backup for Brad", self.player), lambda state: state.can_reach_location("Meet Jessie in the Warehouse", self.player) and state.can_reach_region("Leisure Park", self.player) and state.can_reach_region("Paradise Plaza", self.player) and state.can_reach_region("Food Court", self.player) and state.has("Food Court key", self.player))
-
-            set_rule(self.multiworld.get_location("Escort Brad to see Dr Barnaby", self.player), lambda state: state.can_reach_location("Complete Backup for Brad", self.player) and state.can_reach_region("Entrance Plaza", self.player) and state.can_reach_region("Al Fresca Plaza", self.player) and state.has("Entrance Plaza key", self.player))
-
-            set_rule(self.multiworld.get_location("Complete Temporary Agreement", self.player), lambda state: state.can_reach_location("Escort Brad to see Dr Barnaby", self.player))
-
-            if not self.options.scoop_sanity:
-                set_rule(self.multiworld.get_location("Meet back at the Security Room at 6am day 2", self.player), lambda state: state.has("DAY2_06_AM", self.player) and state.can_reach_location("Complete Temporary Agreement", self.player))
-
-                set_rule(self.multiworld.get_location("Complete Image in the Monitor", self.player), lambda state: state.can_reach_location("Meet back at the Security Room at 6am day 2", self.player))
-
-            set_rule(self.multiworld.get_location("Complete Rescue the Professor", self.player), lambda state: state.can_reach_location("Complete Image in the Monitor", self.player))
-
-            set_rule(self.multiworld.get_location("Meet Steven", self.player), lambda state: state.can_reach_location("Complete Rescue the Professor", self.player) and state.can_reach_region("North Plaza", self.player) and state.can_reach_region("Seon's Food and Stuff", self.player))
-
-            set_rule(self.multiworld.get_location("Clean up... Register 6!", self.player), lambda state: state.can_reach_location("Meet Steven", self.player))
-
-            set_rule(self.multiworld.get_location("Complete Medicine Run", self.player), lambda state: state.can_reach_location("Clean up... Register 6!", self.player))
-
-            set_rule(self.multiworld.get_location("Complete Professor's Past", self.player), lambda state: state.can_reach_location("Complete Medicine Run", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player))
-
-            set_rule(self.multiworld.get_location("Complete Girl Hunting", self.player), lambda state: state.can_reach_location("Complete Professor's Past", self.player))
-
-            set_rule(self.multiworld.get_location("Beat up Isabela", self.player), lambda state: state.can_reach_location("Complete Girl Hunting", self.player))
-
-            set_rule(self.multiworld.get_location("Complete Promise to Isabela", self.player), lambda state: state.can_reach_location("Beat up Isabela", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player))
-
-            set_rule(self.multiworld.get_location("Save Isabela from the zombie", self.player), lambda state: state.can_reach_location("Complete Promise to Isabela", self.player))
-
-            set_rule(self.multiworld.get_location("Complete Transporting Isabela", self.player), lambda state: state.can_reach_location("Save Isabela from the zombie", self.player))
-
-            set_rule(self.multiworld.get_location("Carry Isabela back to the Security Room", self.player), lambda state: state.can_reach_location("Complete Transporting Isabela", self.player))
-
-            set_rule(self.multiworld.get_location("Complete Santa Cabeza", self.player), lambda state: state.can_reach_location("Carry Isabela back to the Security Room", self.player))
-
-            if not self.options.scoop_sanity:
-                set_rule(self.multiworld.get_location("Meet back at the Security Room at 11am day 3", self.player), lambda state: state.can_reach_location("Complete Santa Cabeza", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.has("DAY3_11_AM", self.player))
-
-                set_rule(self.multiworld.get_location("Complete Bomb Collector", self.player), lambda state: state.can_reach_location("Meet back at the Security Room at 11am day 3", self.player) and state.can_reach_region("Maintenance Tunnel", self.player))
-
-                set_rule(self.multiworld.get_location("Beat Drivin Carlito", self.player), lambda state: state.can_reach_location("Complete Bomb Collector", self.player) and state.can_reach_region("Maintenance Tunnel", self.player))
-
-                set_rule(self.multiworld.get_location("Meet back at the Security Room at 5pm day 3", self.player), lambda state: state.can_reach_location("Complete Bomb Collector", self.player) or state.can_reach_location("Beat Drivin Carlito", self.player))
-
-                set_rule(self.multiworld.get_location("Escort Isabela to Carlito's Hideout and have a chat", self.player), lambda state: state.can_reach_location("Meet back at the Security Room at 5pm day 3", self.player) and state.can_reach_region("Carlito's Hideout", self.player))
-
-            if self.options.scoop_sanity:
-                self.multiworld.get_location("Beat Drivin Carlito", self.player).progress_type = LocationProgressType.EXCLUDED
-
-                self.multiworld.get_location("Rescue Greg Simpson", self.player).progress_type = LocationProgressType.EXCLUDED
-
-            set_rule(self.multiworld.get_location("Complete Jessie's Discovery", self.player), lambda state: state.can_reach_location("Escort Isabela to Carlito's Hideout and have a chat", self.player))
-
-            set_rule(self.multiworld.get_location("Meet Larry", self.player), lambda state: state.can_reach_location("Complete Jessie's Discovery", self.player))
-
-            set_rule(self.multiworld.get_location("Complete The Butcher", self.player), lambda state: state.can_reach_location("Meet Larry", self.player))
-
-            set_rule(self.multiworld.get_location("Complete Memories", self.player), lambda state: state.can_reach_location("Complete The Butcher", self.player))
-
-            if not self.options.scoop_sanity:
-                set_rule(self.multiworld.get_location("Head back to the Security Room at the end of day 3", self.player), lambda state: state.can_reach_location("Complete Memories", self.player))
-
-                set_rule(self.multiworld.get_location("Witness Special Forces 10pm day 3", self.player), lambda state: state.can_reach_location("Complete Memories", self.player))
-
-            set_rule(self.multiworld.get_location("Ending A: Solve all of the cases and be on the helipad at 12pm", self.player), lambda state: state.can_reach_location("Complete Memories", self.player) and state.can_reach_region("Heliport", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.has("DAY3_11_AM", self.player) and state.has("DAY4_12_PM", self.player))
-
-        # Overtime rules only apply when goal is Ending S
-        if self.options.goal.value == 0:
-            set_rule(self.multiworld.get_location("Get bit!", self.player), lambda state: state.can_reach_location("Ending A: Solve all of the cases and be on the helipad at 12pm", self.player))
-
-            set_rule(self.multiworld.get_location("Gather the suppressants and generator and talk to Isabela", self.player), lambda state: state.can_reach_location("Get bit!", self.player) and (state.can_reach_region("Paradise Plaza", self.player) and state.can_reach_region("Entrance Plaza", self.player) and state.can_reach_region("Al Fresca Plaza", self.player) and state.can_reach_region("Leisure Park", self.player) and state.can_reach_region("Food Court", self.player) and state.can_reach_region("Maintenance Tunnel", self.player) and state.can_reach_region("Wonderland Plaza", self.player)))
-
-            set_rule(self.multiworld.get_location("See the crashed helicopter", self.player), lambda state: state.can_reach_location("Get bit!", self.player))
-
-            set_rule(self.multiworld.get_location("Frank sees a sick-ass RC Drone", self.player), lambda state: state.can_reach_location("Get bit!", self.player))
-
-            set_rule(self.multiworld.get_location("Give Isabela 5 queens", self.player), lambda state: state.can_reach_location("Gather the suppressants and generator and talk to Isabela", self.player))
-
-            set_rule(self.multiworld.get_location("Reach the end of the tunnel with Isabela", self.player), lambda state: state.can_reach_location("Give Isabela 5 queens", self.player))
-
-            set_rule(self.multiworld.get_location("Get to the Humvee", self.player), lambda state: state.can_reach_location("Give Isabela 5 queens", self.player) and state.can_reach_region("Tunnels", self.player))
-
-            set_rule(self.multiworld.get_location("Fight a tank and win", self.player), lambda state: state.can_reach_location("Get to the Humvee", self.player))
-
-            set_rule(self.multiworld.get_location("Ending S: Beat up Brock with your bare fists!", self.player), lambda state: state.can_reach_location("Fight a tank and win", self.player))
-
-            set_rule(self.multiworld.get_location("Kill 10 Special Forces", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player) and state.has("DAY3_11_AM", self.player) and state.can_reach_location("Get bit!", self.player) and state.can_reach_location("Ending A: Solve all of the cases and be on the helipad at 12pm", self.player))
-
-            set_rule(self.multiworld.get_location("Kill 100 zombies with an RPG", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player) and state.can_reach_location("Get bit!", self.player))
-
-        # ScoopSanity: gate every event of every scoop uniformly on
-        # (item received, previous scoop's completion, scoop regions,
-        # position-level gate). Replaces the vanilla event-to-event chain
-        # so randomized order can't strand intermediate events behind the
-        # vanilla predecessor. Day items aren't checked here -- the engine
-        # sets time flags directly on chain advance in ScoopSanity.
-        if self.options.scoop_sanity and self.scoop_order:
-            for i, scoop_name in enumerate(self.scoop_order):
-                prereq = ("Meet Jessie in the Warehouse" if i == 0
-                          else SCOOP_COMPLETION_MAP[self.scoop_order[i - 1]])
-                regions = SCOOP_REGION_REQUIREMENTS.get(scoop_name, [])
-                level_req = (SCOOP_POSITION_LEVEL_GATES[i]
-                             if i < len(SCOOP_POSITION_LEVEL_GATES)
-                             else None)
-                for event_name in SCOOP_EVENTS[scoop_name]:
-                    loc = self.multiworld.get_location(event_name, self.player)
-                    set_rule(loc,
-                        lambda state, sn=scoop_name, p=prereq,
-                               rn=regions, lv=level_req:
-                            state.has(sn, self.player) and
-                            state.can_reach_location(p, self.player) and
-                            all(state.can_reach_region(r, self.player) for r in rn) and
-                            (lv is None or
-                             state.can_reach_location(f"Reach Level {lv}", self.player)))
-
-            # Complete Memories is the post-chain anchor; gates on the last
-            # randomized scoop's completion regardless of which scoop that is.
-            last_completion = SCOOP_COMPLETION_MAP[self.scoop_order[-1]]
-            set_rule(self.multiworld.get_location("Complete Memories", self.player),
-                lambda state, lc=last_completion: state.can_reach_location(lc, self.player))
-
-
-        # PP STICKER LOGIC
-        # PP Stickers in Paradise Plaza
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 1", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 2", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 3", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 4", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 5", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 6", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 7", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 8", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 9", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 10", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 11", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 12", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 13", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 14", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
-
-        # PP Stickers in Colby's Movieland
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 15", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 16", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 17", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 18", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 19", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 20", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 21", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 22", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 23", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 24", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player))
-
-        # PP Stickers in Entrance Plaza -- behind the shutters (25-34), as are
-        # the EP survivors and Wayne's check further down. ep_shutter is
-        # defined above, alongside the PP-bonus rules that also need it.
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 25", self.player), ep_shutter)
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 26", self.player), ep_shutter)
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 27", self.player), ep_shutter)
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 28", self.player), ep_shutter)
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 29", self.player), ep_shutter)
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 30", self.player), ep_shutter)
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 31", self.player), ep_shutter)
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 32", self.player), ep_shutter)
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 33", self.player), ep_shutter)
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 34", self.player), ep_shutter)
-
-        # PP Stickers in Al Fresca Plaza
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 35", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 36", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 37", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 38", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 39", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 40", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 41", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 42", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 43", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 44", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 45", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player))
-
-        # PP Stickers in Food Court
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 46", self.player), lambda state: state.can_reach_region("Food Court", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 47", self.player), lambda state: state.can_reach_region("Food Court", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 48", self.player), lambda state: state.can_reach_region("Food Court", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 49", self.player), lambda state: state.can_reach_region("Food Court", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 50", self.player), lambda state: state.can_reach_region("Food Court", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 51", self.player), lambda state: state.can_reach_region("Food Court", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 52", self.player), lambda state: state.can_reach_region("Food Court", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 53", self.player), lambda state: state.can_reach_region("Food Court", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 54", self.player), lambda state: state.can_reach_region("Food Court", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 55", self.player), lambda state: state.can_reach_region("Food Court", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 56", self.player), lambda state: state.can_reach_region("Food Court", self.player))
-
-        # PP Stickers in Wonderland Plaza
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 57", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 58", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 59", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 60", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 61", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 62", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 63", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 64", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 65", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 66", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 67", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 68", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 69", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 70", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 71", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player))
-
-        # PP Stickers in North Plaza
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 72", self.player), lambda state: state.can_reach_region("North Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 73", self.player), lambda state: state.can_reach_region("North Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 76", self.player), lambda state: state.can_reach_region("North Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 77", self.player), lambda state: state.can_reach_region("North Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 78", self.player), lambda state: state.can_reach_region("North Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 79", self.player), lambda state: state.can_reach_region("North Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 80", self.player), lambda state: state.can_reach_region("North Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 81", self.player), lambda state: state.can_reach_region("North Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 82", self.player), lambda state: state.can_reach_region("North Plaza", self.player))
-
-        # PP Stickers in Seon's Food and Stuff
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 83", self.player), lambda state: state.can_reach_region("Seon's Food and Stuff", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 84", self.player), lambda state: state.can_reach_region("Seon's Food and Stuff", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 85", self.player), lambda state: state.can_reach_region("Seon's Food and Stuff", self.player))
-
-        # PP Stickers in Crislip's Home Saloon
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 74", self.player), lambda state: state.can_reach_region("Crislip's Home Saloon", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 75", self.player), lambda state: state.can_reach_region("Crislip's Home Saloon", self.player))
-
-        # PP Stickers in Leisure Park
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 86", self.player), lambda state: state.can_reach_region("Leisure Park", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 87", self.player), lambda state: state.can_reach_region("Leisure Park", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 88", self.player), lambda state: state.can_reach_region("Leisure Park", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 89", self.player), lambda state: state.can_reach_region("Leisure Park", self.player))
-
-        # PP Stickers in Maintenance Tunnel
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 90", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 91", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 92", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 93", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 94", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 95", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 96", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player))
-
-        # PP Stickers in Security Room
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 97", self.player), lambda state: state.can_reach_region("Security Room", self.player))
-
-        # PP Stickers in Cultists' Hideout
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 98", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player) and state.can_reach_region("Leisure Park", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.can_reach_location("Get grabbed by the raincoats", self.player))
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 99", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player) and state.can_reach_region("Leisure Park", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.can_reach_location("Get grabbed by the raincoats", self.player))
-
-        # PP Stickers in Rooftop
-        set_rule(self.multiworld.get_location("Photograph PP Sticker 100", self.player), lambda state: state.can_reach_region("Rooftop", self.player))
-
-        # SURVIVORS LOGIC
-        # Survivors in Rooftop
-        set_rule(self.multiworld.get_location("Rescue Jeff Meyer", self.player), lambda state: state.can_reach_region("Rooftop", self.player))
-        set_rule(self.multiworld.get_location("Rescue Natalie Meyer", self.player), lambda state: state.can_reach_region("Rooftop", self.player))
-
-        # Survivors in Paradise Plaza
-        set_rule(self.multiworld.get_location("Rescue Heather Tompkins", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.can_reach_location("Rescue Ross Folk", self.player) and state.can_reach_location("Rescue Tonya Waters", self.player)) or (self.options.scoop_sanity and state.has("Twin Sisters", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Pamela Tompkins", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.can_reach_location("Rescue Ross Folk", self.player) and state.can_reach_location("Rescue Tonya Waters", self.player)) or (self.options.scoop_sanity and state.has("Twin Sisters", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Ronald Shiner", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player) and (not self.options.restricted_item_mode or state.has("Orange Juice", self.player)) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or (self.options.scoop_sanity and state.has("Restaurant Man", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Jennifer Gorman", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or (self.options.scoop_sanity and state.has("The Cult", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Tad Hawthorne", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player) and state.can_reach_location("Kill Kent on day 3", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.has("DAY3_11_AM", self.player)) or (self.options.scoop_sanity and state.has("Cut from the Same Cloth", self.player) and state.has("Photo Challenge", self.player) and state.has("Photographer's Pride", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Simone Ravendark", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.has("DAY3_11_AM", self.player) and state.can_reach_location("Complete Santa Cabeza", self.player)) or (self.options.scoop_sanity and state.has("A Woman in Despair", self.player))))
+            if scoop_sanity:
+                registry.set(self.multiworld.get_entrance("Security Room -> Entrance Plaza", self.player),
+                         rules.requires(items=["Rooftop key", "Warehouse key", "Entrance Plaza key"]))
+                registry.set(self.multiworld.get_entrance("Paradise Plaza -> Entrance Plaza", self.player),
+                         rules.requires(items=["Entrance Plaza key"]))
+
+        # Story chain. Every link's rule is its flattened requirement set
+        # (see _build_story_chain), so no story rule re-evaluates the links
+        # before it.
+        for name in story.links:
+            registry.set(self.multiworld.get_location(name, self.player), story.rule(name))
+
+        if self.main_scoops_enabled and scoop_sanity:
+            self.multiworld.get_location("Beat Drivin Carlito", self.player).progress_type = LocationProgressType.EXCLUDED
+
+            self.multiworld.get_location("Rescue Greg Simpson", self.player).progress_type = LocationProgressType.EXCLUDED
+
+
+        # PP STICKER AND SURVIVOR LOGIC
+        # Per-sticker and per-survivor requirements live in drdr_shared.json
+        # (the Lua trackers read the same rows): required regions, the
+        # Entrance Plaza shutter (ep_shutter, defined above with the PP-bonus
+        # rules), ScoopSanity scoop items or vanilla time keys, locations
+        # that must be reached first, and restricted-mode items. Rows with
+        # the same requirements share one compiled rule.
+        table_rules = {}
+
+        def _table_rule(regions=(), items=(), restricted_any=(), requires_locations=(), shutter=False):
+            key = (tuple(regions), tuple(items), tuple(restricted_any), tuple(requires_locations), shutter)
+            if key not in table_rules:
+                # Story links are already flattened; any other location is
+                # checked through its event item.
+                gates = [story.reach(name) for name in requires_locations if name in story.links]
+                others = [name for name in requires_locations if name not in story.links]
+                if others:
+                    gates.append(rules.reached(*others))
+                if shutter:
+                    gates.append(ep_shutter)
+                if len(gates) > 1:
+                    then = lambda state, gates=tuple(gates): all(gate(state) for gate in gates)
+                else:
+                    then = gates[0] if gates else None
+                table_rules[key] = rules.requires(regions=regions, items=items,
+                                                  restricted_any=restricted_any, then=then)
+            return table_rules[key]
+
+        for sticker in STICKERS:
+            registry.set(self.multiworld.get_location(sticker["LocationName"], self.player),
+                         _table_rule(regions=sticker.get("RequiredRegions", ()),
+                                     items=sticker.get("TimeKeys", ()),
+                                     requires_locations=sticker.get("RequiresLocations", ()),
+                                     shutter=sticker.get("EpShutter", False)))
+
+        # Greg Simpson also needs Paradise Plaza: rescuing him unlocks the
+        # Wonderland Plaza shortcut.
+        for survivor in SURVIVORS:
+            if "location_name" not in survivor:
+                continue
+            requires_locations = list(survivor.get("requires_locations", ()))
+            if not scoop_sanity:
+                requires_locations += survivor.get("vanilla_requires_locations", ())
+            registry.set(self.multiworld.get_location(survivor["location_name"], self.player),
+                         _table_rule(regions=survivor.get("required_regions", ()),
+                                     items=survivor.get("scoop_items" if scoop_sanity else "time_keys", ()),
+                                     restricted_any=survivor.get("restricted_mode_items_any", ()),
+                                     requires_locations=requires_locations,
+                                     shutter=survivor.get("ep_shutter", False)))
         ## 1.1.0 HAS A BUG WITH "Rescue Simone Ravendark", THIS NEXT LINE EXCLUDES THIS CHECK IN ALL PLAY MODES AND SHOULD BE REMOVED UPON FIX BEING IMPLEMENTED
         self.multiworld.get_location("Rescue Simone Ravendark", self.player).progress_type = LocationProgressType.EXCLUDED
 
-        # Survivors in Leisure Park
-        set_rule(self.multiworld.get_location("Rescue Sophie Richard", self.player), lambda state: state.can_reach_region("Leisure Park", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has("The Convicts", self.player))))
-
-        # Survivors in Food Court
-        set_rule(self.multiworld.get_location("Rescue Gil Jiminez", self.player), lambda state: state.can_reach_region("Food Court", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player)) or (self.options.scoop_sanity and state.has("The Drunkard", self.player))))
-
-        # Survivors in Al Fresca Plaza
-        set_rule(self.multiworld.get_location("Rescue Aaron Swoop", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has("Barricade Pair", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Burt Thompson", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has("Barricade Pair", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Leah Stein", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has("A Mother's Lament", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Gordon Stalworth", self.player), lambda state: state.can_reach_region("Al Fresca Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player)) or (self.options.scoop_sanity and state.has("The Coward", self.player))))
-
-        # Survivors in Entrance Plaza
-        set_rule(self.multiworld.get_location("Rescue Bill Brenton", self.player), ep_shutter)
-        set_rule(self.multiworld.get_location("Rescue Wayne Blackwell", self.player), lambda state: ep_shutter(state) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.can_reach_location("Meet the Hall Family", self.player)) or (self.options.scoop_sanity and state.has("Mark of the Sniper", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Jolie Wu", self.player), lambda state: ep_shutter(state) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or (self.options.scoop_sanity and state.has("The Woman Who Didn't Make it", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Rachel Decker", self.player), lambda state: ep_shutter(state) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or (self.options.scoop_sanity and state.has("The Woman Who Didn't Make it", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Floyd Sanders", self.player), lambda state: ep_shutter(state) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or (self.options.scoop_sanity and state.has("Antique Lover", self.player))))
-
-        # Survivors in Wonderland Plaza
-        set_rule(self.multiworld.get_location("Rescue Greg Simpson", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and state.can_reach_region("Paradise Plaza", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has("Out of Control", self.player)))) # Greg Simpson is the only Wonderland Plaza Survivor with additional Logic due to him unlocking the shortcut
-        set_rule(self.multiworld.get_location("Rescue Yuu Tanaka", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and (not self.options.restricted_item_mode or state.has("Book [Japanese Conversation]", self.player)) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has("Japanese Tourists", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Shinji Kitano", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and (not self.options.restricted_item_mode or state.has("Book [Japanese Conversation]", self.player)) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has("Japanese Tourists", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Tonya Waters", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player)) or (self.options.scoop_sanity and state.has("Lovers", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Ross Folk", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player)) or (self.options.scoop_sanity and state.has("Lovers", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Kay Nelson", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.can_reach_location("Kill Jo", self.player)) or (self.options.scoop_sanity and state.has("Above the Law", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Lilly Deacon", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.can_reach_location("Kill Jo", self.player)) or (self.options.scoop_sanity and state.has("Above the Law", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Kelly Carpenter", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.can_reach_location("Kill Jo", self.player)) or (self.options.scoop_sanity and state.has("Above the Law", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Janet Star", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.can_reach_location("Kill Jo", self.player)) or (self.options.scoop_sanity and state.has("Above the Law", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Sally Mills", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or (self.options.scoop_sanity and state.has("Hanging by a Thread", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Nick Evans", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or (self.options.scoop_sanity and state.has("Hanging by a Thread", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Mindy Baker", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.can_reach_location("Defeat Paul", self.player)) or (self.options.scoop_sanity and state.has("Long Haired Punk", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Debbie Willet", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.can_reach_location("Defeat Paul", self.player)) or (self.options.scoop_sanity and state.has("Long Haired Punk", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Paul Carson", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and (not self.options.restricted_item_mode or state.has("Fire Extinguisher", self.player)) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.can_reach_location("Defeat Paul", self.player)) or (self.options.scoop_sanity and state.has("Long Haired Punk", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Leroy McKenna", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player)) or (self.options.scoop_sanity and state.has("A Sick Man", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Susan Walsh", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player)) or (self.options.scoop_sanity and state.has("The Woman Left Behind", self.player))))
-
-        # Survivors in North Plaza
-        set_rule(self.multiworld.get_location("Rescue David Bailey", self.player), lambda state: state.can_reach_region("North Plaza", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has("Shadow of the North Plaza", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Kindell Johnson", self.player), lambda state: state.can_reach_region("North Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player)) or (self.options.scoop_sanity and state.has("Dressed for Action", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Brett Styles", self.player), lambda state: state.can_reach_region("North Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player)) or (self.options.scoop_sanity and state.has("Gun Shop Standoff", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Jonathan Picardson", self.player), lambda state: state.can_reach_region("North Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player)) or (self.options.scoop_sanity and state.has("Gun Shop Standoff", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Alyssa Laurent", self.player), lambda state: state.can_reach_region("North Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player)) or (self.options.scoop_sanity and state.has("Gun Shop Standoff", self.player))))
-
-        # Survivors locked behind Hatchet Man (requires both North Plaza and Crislip's Home Saloon)
-        set_rule(self.multiworld.get_location("Rescue Josh Manning", self.player), lambda state: state.can_reach_region("North Plaza", self.player) and state.can_reach_region("Crislip's Home Saloon", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.can_reach_location("Kill Cliff", self.player)) or (self.options.scoop_sanity and state.has("The Hatchet Man", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Barbara Patterson", self.player), lambda state: state.can_reach_region("North Plaza", self.player) and state.can_reach_region("Crislip's Home Saloon", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.can_reach_location("Kill Cliff", self.player)) or (self.options.scoop_sanity and state.has("The Hatchet Man", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Rich Atkins", self.player), lambda state: state.can_reach_region("North Plaza", self.player) and state.can_reach_region("Crislip's Home Saloon", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.can_reach_location("Kill Cliff", self.player)) or (self.options.scoop_sanity and state.has("The Hatchet Man", self.player))))
-
-        # Survivors in Colby's Movieland
-        set_rule(self.multiworld.get_location("Rescue Beth Shrake", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.can_reach_location("Kill Sean", self.player)) or (self.options.scoop_sanity and state.has("A Strange Group", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Michelle Feltz", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.can_reach_location("Kill Sean", self.player)) or (self.options.scoop_sanity and state.has("A Strange Group", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Nathan Crabbe", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.can_reach_location("Kill Sean", self.player)) or (self.options.scoop_sanity and state.has("A Strange Group", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Ray Mathison", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.can_reach_location("Kill Sean", self.player)) or (self.options.scoop_sanity and state.has("A Strange Group", self.player))))
-        set_rule(self.multiworld.get_location("Rescue Cheryl Jones", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.can_reach_location("Kill Sean", self.player)) or (self.options.scoop_sanity and state.has("A Strange Group", self.player))))
-
         # Psychopaths
-        set_rule(self.multiworld.get_location("Watch the convicts kill that poor guy", self.player), lambda state: state.can_reach_region("Leisure Park", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has("The Convicts", self.player))))
+        registry.set(self.multiworld.get_location("Watch the convicts kill that poor guy", self.player), rules.requires(regions=["Leisure Park"], items=["The Convicts"] if scoop_sanity else []))
 
-        set_rule(self.multiworld.get_location("Meet Cletus", self.player), lambda state: state.can_reach_region("North Plaza", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has("Cletus", self.player))))
-        set_rule(self.multiworld.get_location("Kill Cletus", self.player), lambda state: state.can_reach_location("Meet Cletus", self.player))
+        registry.set(self.multiworld.get_location("Meet Cletus", self.player), rules.requires(regions=["North Plaza"], items=["Cletus"] if scoop_sanity else []))
+        registry.set(self.multiworld.get_location("Kill Cletus", self.player), rules.reached("Meet Cletus"))
 
-        set_rule(self.multiworld.get_location("Meet Adam", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has("Out of Control", self.player))))
-        set_rule(self.multiworld.get_location("Kill Adam", self.player), lambda state: state.can_reach_location("Meet Adam", self.player))
+        registry.set(self.multiworld.get_location("Meet Adam", self.player), rules.requires(regions=["Wonderland Plaza"], items=["Out of Control"] if scoop_sanity else []))
+        registry.set(self.multiworld.get_location("Kill Adam", self.player), rules.reached("Meet Adam"))
 
-        set_rule(self.multiworld.get_location("Meet Cliff", self.player), lambda state: state.can_reach_region("Crislip's Home Saloon", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player)) or (self.options.scoop_sanity and state.has("The Hatchet Man", self.player))))
-        set_rule(self.multiworld.get_location("Kill Cliff", self.player), lambda state: state.can_reach_location("Meet Cliff", self.player))
+        registry.set(self.multiworld.get_location("Meet Cliff", self.player), rules.requires(regions=["Crislip's Home Saloon"], items=["The Hatchet Man"] if scoop_sanity else ["DAY2_06_AM"]))
+        registry.set(self.multiworld.get_location("Kill Cliff", self.player), rules.reached("Meet Cliff"))
 
-        set_rule(self.multiworld.get_location("Meet Jo", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or (self.options.scoop_sanity and state.has("Above the Law", self.player))))
-        set_rule(self.multiworld.get_location("Kill Jo", self.player), lambda state: state.can_reach_location("Meet Jo", self.player))
+        registry.set(self.multiworld.get_location("Meet Jo", self.player), rules.requires(regions=["Wonderland Plaza"], items=["Above the Law"] if scoop_sanity else ["DAY2_06_AM", "DAY2_11_AM"]))
+        registry.set(self.multiworld.get_location("Kill Jo", self.player), rules.reached("Meet Jo"))
 
-        set_rule(self.multiworld.get_location("Meet the Hall Family", self.player), lambda state: state.can_reach_region("Entrance Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or (self.options.scoop_sanity and state.has("Mark of the Sniper", self.player))))
-        set_rule(self.multiworld.get_location("Kill Roger and Jack (and Thomas if you want) and chat with Wayne", self.player), lambda state: state.can_reach_location("Meet the Hall Family", self.player) and (not self.options.scoop_sanity or ep_shutter(state)))
+        registry.set(self.multiworld.get_location("Meet the Hall Family", self.player), rules.requires(regions=["Entrance Plaza"], items=["Mark of the Sniper"] if scoop_sanity else ["DAY2_06_AM", "DAY2_11_AM"]))
+        registry.set(self.multiworld.get_location("Kill Roger and Jack (and Thomas if you want) and chat with Wayne", self.player), rules.requires(then=(lambda state, met_halls=rules.reached("Meet the Hall Family"): met_halls(state) and ep_shutter(state)) if scoop_sanity else rules.reached("Meet the Hall Family")))
 
-        set_rule(self.multiworld.get_location("Witness Sean in Paradise Plaza", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or (self.options.scoop_sanity and (state.has("The Cult", self.player)) or (state.has("A Strange Group", self.player)))))
-        set_rule(self.multiworld.get_location("Get grabbed by the raincoats", self.player), lambda state: state.can_reach_location("Witness Sean in Paradise Plaza", self.player) and state.can_reach_region("Leisure Park", self.player))
-        set_rule(self.multiworld.get_location("Meet Sean", self.player), lambda state: state.can_reach_region("Colby's Movieland", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player)) or (self.options.scoop_sanity and state.has("A Strange Group", self.player))))
-        set_rule(self.multiworld.get_location("Kill Sean", self.player), lambda state: state.can_reach_location("Meet Sean", self.player))
+        registry.set(self.multiworld.get_location("Witness Sean in Paradise Plaza", self.player), rules.requires(regions=["Paradise Plaza"], then=(lambda state: state.has("The Cult", self.player) or state.has("A Strange Group", self.player)) if scoop_sanity else (lambda state: (state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or state.has("A Strange Group", self.player))))
+        registry.set(self.multiworld.get_location("Get grabbed by the raincoats", self.player), rules.requires(regions=["Leisure Park"], then=rules.reached("Witness Sean in Paradise Plaza")))
+        registry.set(self.multiworld.get_location("Meet Sean", self.player), rules.requires(regions=["Colby's Movieland"], items=["A Strange Group"] if scoop_sanity else ["DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM"]))
+        registry.set(self.multiworld.get_location("Kill Sean", self.player), rules.reached("Meet Sean"))
 
-        set_rule(self.multiworld.get_location("Meet Paul", self.player), lambda state: state.can_reach_region("Wonderland Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player)) or (self.options.scoop_sanity and state.has("Long Haired Punk", self.player))))
-        set_rule(self.multiworld.get_location("Defeat Paul", self.player), lambda state: state.can_reach_location("Meet Paul", self.player))
+        registry.set(self.multiworld.get_location("Meet Paul", self.player), rules.requires(regions=["Wonderland Plaza"], items=["Long Haired Punk"] if scoop_sanity else ["DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM"]))
+        registry.set(self.multiworld.get_location("Defeat Paul", self.player), rules.reached("Meet Paul"))
 
-        set_rule(self.multiworld.get_location("Meet Kent on day 1", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has("Cut from the Same Cloth", self.player))))
-        set_rule(self.multiworld.get_location("Complete Kent's day 1 photoshoot", self.player), lambda state: state.can_reach_location("Meet Kent on day 1", self.player))
-        set_rule(self.multiworld.get_location("Meet Kent on day 2", self.player), lambda state, masks=("Novelty Mask (Bear)", "Novelty Mask (Servbot)", "Novelty Mask (Horse)"): (state.can_reach_location("Complete Kent's day 1 photoshoot", self.player)) and (not self.options.restricted_item_mode or any(state.has(m, self.player) for m in masks)) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or (self.options.scoop_sanity and state.has("Cut from the Same Cloth", self.player) and state.has("Photo Challenge", self.player))))
-        set_rule(self.multiworld.get_location("Complete Kent's day 2 photoshoot", self.player), lambda state: state.can_reach_location("Meet Kent on day 2", self.player))
-        set_rule(self.multiworld.get_location("Meet Kent on day 3", self.player), lambda state: state.can_reach_location("Complete Kent's day 2 photoshoot", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.has("DAY3_11_AM", self.player)) or (self.options.scoop_sanity and state.has("Cut from the Same Cloth", self.player) and state.has("Photo Challenge", self.player) and state.has("Photographer's Pride", self.player))))
-        set_rule(self.multiworld.get_location("Kill Kent on day 3", self.player), lambda state: state.can_reach_location("Meet Kent on day 3", self.player))
+        registry.set(self.multiworld.get_location("Meet Kent on day 1", self.player), rules.requires(regions=["Paradise Plaza"], items=["Cut from the Same Cloth"] if scoop_sanity else []))
+        registry.set(self.multiworld.get_location("Complete Kent's day 1 photoshoot", self.player), rules.reached("Meet Kent on day 1"))
+        registry.set(self.multiworld.get_location("Meet Kent on day 2", self.player), rules.requires(items=["Cut from the Same Cloth", "Photo Challenge"] if scoop_sanity else ["DAY2_06_AM", "DAY2_11_AM"], restricted_any=("Novelty Mask (Bear)", "Novelty Mask (Servbot)", "Novelty Mask (Horse)"), then=rules.reached("Complete Kent's day 1 photoshoot")))
+        registry.set(self.multiworld.get_location("Complete Kent's day 2 photoshoot", self.player), rules.reached("Meet Kent on day 2"))
+        registry.set(self.multiworld.get_location("Meet Kent on day 3", self.player), rules.requires(items=["Cut from the Same Cloth", "Photo Challenge", "Photographer's Pride"] if scoop_sanity else ["DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM", "DAY3_11_AM"], then=rules.reached("Complete Kent's day 2 photoshoot")))
+        registry.set(self.multiworld.get_location("Kill Kent on day 3", self.player), rules.reached("Meet Kent on day 3"))
 
         # Challenges
-        set_rule(self.multiworld.get_location("Reach Level 10!", self.player), lambda state: state.can_reach_location("Reach Level 10", self.player))
-        set_rule(self.multiworld.get_location("Reach Level 20!", self.player), lambda state: state.can_reach_location("Reach Level 20", self.player))
-        set_rule(self.multiworld.get_location("Reach Level 30!", self.player), lambda state: state.can_reach_location("Reach Level 30", self.player))
-        set_rule(self.multiworld.get_location("Reach Level 40!", self.player), lambda state: state.can_reach_location("Reach Level 40", self.player))
-        set_rule(self.multiworld.get_location("Reach max level", self.player), lambda state: state.can_reach_location("Reach Level 50", self.player))
-        set_rule(self.multiworld.get_location("Kill 500 zombies by vehicle", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player))
-        set_rule(self.multiworld.get_location("Kill 1000 zombies by vehicle", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player))
+        registry.set(self.multiworld.get_location("Reach Level 10!", self.player), rules.level(10))
+        registry.set(self.multiworld.get_location("Reach Level 20!", self.player), rules.level(20))
+        registry.set(self.multiworld.get_location("Reach Level 30!", self.player), rules.level(30))
+        registry.set(self.multiworld.get_location("Reach Level 40!", self.player), rules.level(40))
+        registry.set(self.multiworld.get_location("Reach max level", self.player), rules.level(50))
+        registry.set(self.multiworld.get_location("Kill 500 zombies by vehicle", self.player), rules.requires(regions=["Maintenance Tunnel"]))
+        registry.set(self.multiworld.get_location("Kill 1000 zombies by vehicle", self.player), rules.requires(regions=["Maintenance Tunnel"]))
         all_side_scoops = SURVIVOR_SCOOP_NAMES + PSYCHOPATH_SCOOP_NAMES
-        set_rule(self.multiworld.get_location("Get 50 survivors to join", self.player), lambda state, scoops=all_side_scoops: state.can_reach_region("Paradise Plaza", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.has("DAY3_11_AM", self.player) and state.can_reach_location("Kill Kent on day 3", self.player) and state.can_reach_location("Kill Cliff", self.player) and state.can_reach_location("Kill Jo", self.player) and state.can_reach_location("Kill Adam", self.player) and state.can_reach_location("Kill Sean", self.player) and state.can_reach_location("Kill Roger and Jack (and Thomas if you want) and chat with Wayne", self.player) and state.can_reach_location("Defeat Paul", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has_all(scoops, self.player) and ending_a_ok(state))))
-        set_rule(self.multiworld.get_location("Encounter 10 survivors", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.has("DAY3_11_AM", self.player) and state.can_reach_location("Kill Kent on day 3", self.player) and state.can_reach_location("Kill Cliff", self.player) and state.can_reach_location("Kill Jo", self.player) and state.can_reach_location("Kill Adam", self.player) and state.can_reach_location("Kill Sean", self.player) and state.can_reach_location("Kill Roger and Jack (and Thomas if you want) and chat with Wayne", self.player) and state.can_reach_location("Defeat Paul", self.player))
-        set_rule(self.multiworld.get_location("Encounter 50 survivors", self.player), lambda state, scoops=all_side_scoops: state.can_reach_region("Paradise Plaza", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.has("DAY3_11_AM", self.player) and state.can_reach_location("Kill Kent on day 3", self.player) and state.can_reach_location("Kill Cliff", self.player) and state.can_reach_location("Kill Jo", self.player) and state.can_reach_location("Kill Adam", self.player) and state.can_reach_location("Kill Sean", self.player) and state.can_reach_location("Kill Roger and Jack (and Thomas if you want) and chat with Wayne", self.player) and state.can_reach_location("Defeat Paul", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has_all(scoops, self.player) and ending_a_ok(state))))
-        set_rule(self.multiworld.get_location("Save 10 survivors", self.player), lambda state, scoops=all_side_scoops: state.can_reach_region("Paradise Plaza", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.has("DAY3_11_AM", self.player) and state.has("DAY4_12_PM", self.player) and state.can_reach_location("Kill Kent on day 3", self.player) and state.can_reach_location("Kill Cliff", self.player) and state.can_reach_location("Kill Jo", self.player) and state.can_reach_location("Kill Adam", self.player) and state.can_reach_location("Kill Sean", self.player) and state.can_reach_location("Kill Roger and Jack (and Thomas if you want) and chat with Wayne", self.player) and state.can_reach_location("Defeat Paul", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has_all(scoops, self.player) and ending_a_ok(state))))
-        set_rule(self.multiworld.get_location("Save 50 survivors", self.player), lambda state, scoops=all_side_scoops: state.can_reach_region("Paradise Plaza", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.has("DAY3_11_AM", self.player) and state.has("DAY4_12_PM", self.player) and state.can_reach_location("Kill Kent on day 3", self.player) and state.can_reach_location("Kill Cliff", self.player) and state.can_reach_location("Kill Jo", self.player) and state.can_reach_location("Kill Adam", self.player) and state.can_reach_location("Kill Sean", self.player) and state.can_reach_location("Kill Roger and Jack (and Thomas if you want) and chat with Wayne", self.player) and state.can_reach_location("Defeat Paul", self.player) and ((not self.options.scoop_sanity) or (self.options.scoop_sanity and state.has_all(scoops, self.player) and ending_a_ok(state))))
+        psychos_down = rules.reached("Kill Kent on day 3", "Kill Cliff", "Kill Jo", "Kill Adam", "Kill Sean", "Kill Roger and Jack (and Thomas if you want) and chat with Wayne", "Defeat Paul")
+        # ScoopSanity: every side scoop received, and Ending A reachable.
+        if scoop_sanity:
+            all_survivors = lambda state: psychos_down(state) and ending_a_ok(state)
+        else:
+            all_survivors = psychos_down
+        registry.set(self.multiworld.get_location("Get 50 survivors to join", self.player), rules.requires(regions=["Paradise Plaza"], items=["DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM", "DAY3_11_AM"] + (all_side_scoops if scoop_sanity else []), then=all_survivors))
+        registry.set(self.multiworld.get_location("Encounter 10 survivors", self.player), rules.requires(regions=["Paradise Plaza"], items=["DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM", "DAY3_11_AM"], then=psychos_down))
+        registry.set(self.multiworld.get_location("Encounter 50 survivors", self.player), rules.requires(regions=["Paradise Plaza"], items=["DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM", "DAY3_11_AM"] + (all_side_scoops if scoop_sanity else []), then=all_survivors))
+        registry.set(self.multiworld.get_location("Save 10 survivors", self.player), rules.requires(regions=["Paradise Plaza"], items=["DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM", "DAY3_11_AM", "DAY4_12_PM"] + (all_side_scoops if scoop_sanity else []), then=all_survivors))
+        registry.set(self.multiworld.get_location("Save 50 survivors", self.player), rules.requires(regions=["Paradise Plaza"], items=["DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM", "DAY3_11_AM", "DAY4_12_PM"] + (all_side_scoops if scoop_sanity else []), then=all_survivors))
 
         # These five survivor-count milestones are gated behind nearly every
         # late-game scoop, so they only become reachable once most of the
@@ -1474,12 +1355,12 @@ class DRWorld(World):
         ):
             self.multiworld.get_location(_name, self.player).progress_type = LocationProgressType.EXCLUDED
 
-        set_rule(self.multiworld.get_location("Kill 1000 zombies", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player))
-        set_rule(self.multiworld.get_location("Kill 2000 zombies", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player) and state.can_reach_region("North Plaza", self.player) and state.can_reach_region("Entrance Plaza", self.player))
-        set_rule(self.multiworld.get_location("Kill 5000 zombies", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player) and state.can_reach_region("North Plaza", self.player) and state.can_reach_region("Entrance Plaza", self.player) and state.can_reach_region("Wonderland Plaza", self.player) and state.can_reach_region("Al Fresca Plaza", self.player))
-        set_rule(self.multiworld.get_location("Kill 10000 zombies", self.player), lambda state: state.can_reach_region("Maintenance Tunnel", self.player) and state.can_reach_region("North Plaza", self.player) and state.can_reach_region("Entrance Plaza", self.player) and state.can_reach_region("Wonderland Plaza", self.player) and state.can_reach_region("Al Fresca Plaza", self.player) and ending_a_ok(state))
-        set_rule(self.multiworld.get_location("Walk a quarter marathon", self.player), lambda state: state.can_reach_region("Leisure Park", self.player) and state.can_reach_region("Al Fresca Plaza", self.player) and state.can_reach_region("Wonderland Plaza", self.player) and state.can_reach_region("North Plaza", self.player) and state.can_reach_region("Entrance Plaza", self.player) and state.can_reach_region("Food Court", self.player) and state.can_reach_region("Paradise Plaza", self.player) and state.can_reach_region("Seon's Food and Stuff", self.player) and state.can_reach_region("Crislip's Home Saloon", self.player) and state.can_reach_region("Colby's Movieland", self.player))
-        set_rule(self.multiworld.get_location("Destroy all of the wall plates in the Food Court", self.player), lambda state: state.can_reach_region("Food Court", self.player))
+        registry.set(self.multiworld.get_location("Kill 1000 zombies", self.player), rules.requires(regions=["Maintenance Tunnel"]))
+        registry.set(self.multiworld.get_location("Kill 2000 zombies", self.player), rules.requires(regions=["Maintenance Tunnel", "North Plaza", "Entrance Plaza"]))
+        registry.set(self.multiworld.get_location("Kill 5000 zombies", self.player), rules.requires(regions=["Maintenance Tunnel", "North Plaza", "Entrance Plaza", "Wonderland Plaza", "Al Fresca Plaza"]))
+        registry.set(self.multiworld.get_location("Kill 10000 zombies", self.player), rules.requires(regions=["Maintenance Tunnel", "North Plaza", "Entrance Plaza", "Wonderland Plaza", "Al Fresca Plaza"], then=ending_a_ok))
+        registry.set(self.multiworld.get_location("Walk a quarter marathon", self.player), rules.requires(regions=["Leisure Park", "Al Fresca Plaza", "Wonderland Plaza", "North Plaza", "Entrance Plaza", "Food Court", "Paradise Plaza", "Seon's Food and Stuff", "Crislip's Home Saloon", "Colby's Movieland"]))
+        registry.set(self.multiworld.get_location("Destroy all of the wall plates in the Food Court", self.player), rules.requires(regions=["Food Court"]))
         # Psychopath encounter / photograph / kill lists.
         # Steven and Larry are MAIN_SCOOP-category locations (tied to the
         # Medicine Run and The Butcher story missions). When main scoops are
@@ -1506,22 +1387,32 @@ class DRWorld(World):
             photograph_psychos.extend([("Meet Steven", 1), ("Meet Larry", 1)])
             kill_psychos.extend([("Clean up... Register 6!", 1), ("Complete The Butcher", 1)])
 
-        set_rule(self.multiworld.get_location("Kill 1 psychopath", self.player),
-                 lambda state, names=meet_psycho_names: any(state.can_reach_location(n, self.player) for n in names))
-        set_rule(self.multiworld.get_location("Photograph 8 psychopaths", self.player),
-                 lambda state, psychopaths=photograph_psychos: sum(c for p, c in psychopaths if state.can_reach_location(p, self.player)) >= 8)
-        set_rule(self.multiworld.get_location("Kill 8 psychopaths", self.player),
-                 lambda state, psychopaths=kill_psychos: sum(c for p, c in psychopaths if state.can_reach_location(p, self.player)) >= 8)
-        set_rule(self.multiworld.get_location("Hit 10 zombies with a parasol", self.player), lambda state: ((state.can_reach_region("Entrance Plaza", self.player) or state.can_reach_region("Al Fresca Plaza", self.player) or state.can_reach_region("Crislip's Home Saloon", self.player)) and (not self.options.restricted_item_mode or state.has("Parasol", self.player))) or (not self.options.restricted_item_mode and state.has("Parasol", self.player) and (state.can_reach_region("Paradise Plaza", self.player))))
-        set_rule(self.multiworld.get_location("Kill 50 cultists", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player) and state.can_reach_location("Witness Sean in Paradise Plaza", self.player))
-        set_rule(self.multiworld.get_location("Photograph 30 survivors", self.player), lambda state: state.can_reach_region("Leisure Park", self.player) and state.can_reach_region("Al Fresca Plaza", self.player) and state.can_reach_region("Wonderland Plaza", self.player) and state.can_reach_region("North Plaza", self.player) and state.can_reach_region("Entrance Plaza", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player))
-        set_rule(self.multiworld.get_location("Escort 8 survivors at once", self.player), lambda state, counts=SCOOP_SURVIVOR_COUNTS: state.can_reach_region("Paradise Plaza", self.player) and state.can_reach_region("Al Fresca Plaza", self.player) and state.can_reach_location("Kill Jo", self.player) and state.can_reach_region("Food Court", self.player) and state.can_reach_region("Entrance Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or (self.options.scoop_sanity and sum(c[0] for s, c in counts.items() if state.has(s, self.player)) >= 8)))
-        set_rule(self.multiworld.get_location("Frank the pimp", self.player), lambda state, counts=SCOOP_SURVIVOR_COUNTS: state.can_reach_region("Paradise Plaza", self.player) and state.can_reach_region("Al Fresca Plaza", self.player) and state.can_reach_location("Kill Jo", self.player) and state.can_reach_region("Food Court", self.player) and state.can_reach_region("Entrance Plaza", self.player) and ((not self.options.scoop_sanity and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player)) or (self.options.scoop_sanity and sum(c[1] for s, c in counts.items() if state.has(s, self.player)) >= 8)))
-        set_rule(self.multiworld.get_location("Jump a vehicle 50 feet", self.player), lambda state: state.can_reach_region("Leisure Park", self.player))
-        set_rule(self.multiworld.get_location("Bowl over 5 zombies", self.player), lambda state: ((state.can_reach_region("Paradise Plaza", self.player) or state.can_reach_region("Wonderland Plaza", self.player)) and (not self.options.restricted_item_mode or state.has("Bowling Ball", self.player))) or (not self.options.restricted_item_mode and state.has("Bowling Ball", self.player) and (state.can_reach_region("Paradise Plaza", self.player) or state.can_reach_region("Entrance Plaza", self.player))))
-        set_rule(self.multiworld.get_location("Hit a golf ball 100 feet", self.player), lambda state: ((state.can_reach_region("Paradise Plaza", self.player) or state.can_reach_region("Entrance Plaza", self.player)) and (not self.options.restricted_item_mode or state.has("Golf Club", self.player))) or (not self.options.restricted_item_mode and state.has("Golf Club", self.player) and state.can_reach_region("Rooftop", self.player)))
-        set_rule(self.multiworld.get_location("Fire 30 bullets", self.player), lambda state: state.can_reach_location("Fire 300 bullets", self.player) or ((not self.options.restricted_item_mode or state.has("Handgun", self.player)) and (state.can_reach_region("North Plaza", self.player) or state.can_reach_region("Wonderland Plaza", self.player) or state.can_reach_region("Paradise Plaza", self.player) or state.can_reach_region("Al Fresca Plaza", self.player))))
-        set_rule(self.multiworld.get_location("Fire 300 bullets", self.player), lambda state, smallguns=("Handgun", "Submachine Gun", "Shotgun", "Sniper Rifle"), guns=("Handgun", "Submachine Gun", "Shotgun", "Sniper Rifle", "Heavy Machinegun", "Machinegun"): (state.can_reach_region("North Plaza", self.player) and (not self.options.restricted_item_mode or any(state.has(g, self.player) for g in smallguns))) or (not self.options.restricted_item_mode and any(state.has(g, self.player) for g in guns) and state.can_reach_region("Rooftop", self.player)))
+        registry.set(self.multiworld.get_location("Kill 1 psychopath", self.player),
+                 rules.reached_any(meet_psycho_names))
+        registry.set(self.multiworld.get_location("Photograph 8 psychopaths", self.player),
+                 rules.reach_count("photographed_psychos", photograph_psychos).at_least(8))
+        registry.set(self.multiworld.get_location("Kill 8 psychopaths", self.player),
+                 rules.reach_count("killed_psychos", kill_psychos).at_least(8))
+        registry.set(self.multiworld.get_location("Kill 50 cultists", self.player), rules.requires(regions=["Paradise Plaza"], then=rules.reached("Witness Sean in Paradise Plaza")))
+        registry.set(self.multiworld.get_location("Photograph 30 survivors", self.player), rules.requires(regions=["Leisure Park", "Al Fresca Plaza", "Wonderland Plaza", "North Plaza", "Entrance Plaza"], items=["DAY2_06_AM", "DAY2_11_AM", "DAY3_00_AM"]))
+        registry.set(self.multiworld.get_location("Escort 8 survivors at once", self.player), rules.requires(regions=["Paradise Plaza", "Al Fresca Plaza", "Food Court", "Entrance Plaza"], items=[] if scoop_sanity else ["DAY2_06_AM", "DAY2_11_AM"], then=(lambda state, killed_jo=rules.reached("Kill Jo"): killed_jo(state) and rule_cache(state, self.player).escort_survivors >= 8) if scoop_sanity else rules.reached("Kill Jo")))
+        registry.set(self.multiworld.get_location("Frank the pimp", self.player), rules.requires(regions=["Paradise Plaza", "Al Fresca Plaza", "Food Court", "Entrance Plaza"], items=[] if scoop_sanity else ["DAY2_06_AM", "DAY2_11_AM"], then=(lambda state, killed_jo=rules.reached("Kill Jo"): killed_jo(state) and rule_cache(state, self.player).escort_females >= 8) if scoop_sanity else rules.reached("Kill Jo")))
+        registry.set(self.multiworld.get_location("Jump a vehicle 50 feet", self.player), rules.requires(regions=["Leisure Park"]))
+        # Weapon challenges: restricted item mode needs the weapon and a zone
+        # to use it in; otherwise any zone that stocks it, or a received copy
+        # carried somewhere it can be used.
+        if restricted_mode_on:
+            registry.set(self.multiworld.get_location("Hit 10 zombies with a parasol", self.player), rules.requires(restricted_any=["Parasol"], then=rules.any_region(["Entrance Plaza", "Al Fresca Plaza", "Crislip's Home Saloon"])))
+            registry.set(self.multiworld.get_location("Bowl over 5 zombies", self.player), rules.requires(restricted_any=["Bowling Ball"], then=rules.any_region(["Paradise Plaza", "Wonderland Plaza"])))
+            registry.set(self.multiworld.get_location("Hit a golf ball 100 feet", self.player), rules.requires(restricted_any=["Golf Club"], then=rules.any_region(["Paradise Plaza", "Entrance Plaza"])))
+            registry.set(self.multiworld.get_location("Fire 30 bullets", self.player), lambda state, fired_300=rules.reached("Fire 300 bullets"), zones=rules.any_region(["North Plaza", "Wonderland Plaza", "Paradise Plaza", "Al Fresca Plaza"]): fired_300(state) or (state.has("Handgun", self.player) and zones(state)))
+            registry.set(self.multiworld.get_location("Fire 300 bullets", self.player), rules.requires(regions=["North Plaza"], restricted_any=["Handgun", "Submachine Gun", "Shotgun", "Sniper Rifle"]))
+        else:
+            registry.set(self.multiworld.get_location("Hit 10 zombies with a parasol", self.player), lambda state, zones=rules.any_region(["Entrance Plaza", "Al Fresca Plaza", "Crislip's Home Saloon"]), carried=rules.requires(regions=["Paradise Plaza"]): zones(state) or (state.has("Parasol", self.player) and carried(state)))
+            registry.set(self.multiworld.get_location("Bowl over 5 zombies", self.player), lambda state, zones=rules.any_region(["Paradise Plaza", "Wonderland Plaza"]), carried=rules.any_region(["Paradise Plaza", "Entrance Plaza"]): zones(state) or (state.has("Bowling Ball", self.player) and carried(state)))
+            registry.set(self.multiworld.get_location("Hit a golf ball 100 feet", self.player), lambda state, zones=rules.any_region(["Paradise Plaza", "Entrance Plaza"]), carried=rules.requires(regions=["Rooftop"]): zones(state) or (state.has("Golf Club", self.player) and carried(state)))
+            registry.set(self.multiworld.get_location("Fire 30 bullets", self.player), lambda state, fired_300=rules.reached("Fire 300 bullets"), zones=rules.any_region(["North Plaza", "Wonderland Plaza", "Paradise Plaza", "Al Fresca Plaza"]): fired_300(state) or zones(state))
+            registry.set(self.multiworld.get_location("Fire 300 bullets", self.player), lambda state, guns=("Handgun", "Submachine Gun", "Shotgun", "Sniper Rifle", "Heavy Machinegun", "Machinegun"), carried=rules.requires(regions=["Rooftop"]), north_plaza=rules.requires(regions=["North Plaza"]): north_plaza(state) or (any(state.has(g, self.player) for g in guns) and carried(state)))
         # "Ride zombies for 50 feet" requires Zombie Ride only when that
         # skill is actually in the AP item pool. BuildItemPool adds skills
         # only when enable_skill_items is on AND vanilla_progression is
@@ -1529,14 +1420,14 @@ class DRWorld(World):
         # the engine grants skills on level-up and they aren't AP items,
         # so the location is reachable purely via region access.
         _zombie_ride_is_pool_item = bool(self.options.enable_skill_items) and self.options.vanilla_progression.value == 1
-        set_rule(self.multiworld.get_location("Ride zombies for 50 feet", self.player),
+        registry.set(self.multiworld.get_location("Ride zombies for 50 feet", self.player),
                  lambda state, gated=_zombie_ride_is_pool_item:
                      state.can_reach_region("Maintenance Tunnel", self.player)
                      and (not gated or state.has("Zombie Ride", self.player)))
-        set_rule(self.multiworld.get_location("Change into 46 new outfits", self.player), lambda state: state.can_reach_region("Leisure Park", self.player) and state.can_reach_region("Al Fresca Plaza", self.player) and state.can_reach_region("Wonderland Plaza", self.player) and state.can_reach_region("North Plaza", self.player) and state.can_reach_region("Entrance Plaza", self.player) and state.can_reach_region("Food Court", self.player) and state.can_reach_region("Paradise Plaza", self.player) and state.can_reach_region("Seon's Food and Stuff", self.player) and state.can_reach_region("Crislip's Home Saloon", self.player) and state.can_reach_region("Colby's Movieland", self.player))
-        set_rule(self.multiworld.get_location("Change into 5 new outfits", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
+        registry.set(self.multiworld.get_location("Change into 46 new outfits", self.player), rules.requires(regions=["Leisure Park", "Al Fresca Plaza", "Wonderland Plaza", "North Plaza", "Entrance Plaza", "Food Court", "Paradise Plaza", "Seon's Food and Stuff", "Crislip's Home Saloon", "Colby's Movieland"]))
+        registry.set(self.multiworld.get_location("Change into 5 new outfits", self.player), rules.requires(regions=["Paradise Plaza"]))
         # PP Sticker group access for the "Photograph N PP Stickers"
-        # challenge rules. Each group becomes (count, regions, locations,
+        # challenge rules. Each group becomes (count, region mask, locations,
         # predicate). The Brad-escort entry in the EP group (25-34) is a
         # marker for the EP shutter and is swapped for the mode-aware
         # ep_shutter predicate. Savior+SS additionally drops main-scoop
@@ -1556,15 +1447,19 @@ class DRWorld(World):
                 pred = ep_shutter
             if not self.main_scoops_enabled:
                 locs = [l for l in locs if l not in main_scoop_location_names]
-            pp_sticker_groups.append((count, regions, locs, pred))
+            events = [rules.event(l) for l in locs]
+            pp_sticker_groups.append((count, region_mask_of(regions), events, pred))
 
-        def _reachable_stickers(state, groups=pp_sticker_groups):
+        def _count_stickers(state, groups=pp_sticker_groups):
+            reachable = rules.region_mask(state)
             return sum(
-                count for (count, regions, locs, pred) in groups
-                if all(state.can_reach_region(r, self.player) for r in regions)
-                and all(state.can_reach_location(l, self.player) for l in locs)
+                count for (count, need, events, pred) in groups
+                if reachable & need == need
+                and state.has_all(events, self.player)
                 and (pred is None or pred(state))
             )
+        # One sticker count per state version, shared by the ten milestones.
+        _reachable_stickers = rules.tally("pp_stickers", _count_stickers)
 
         for _n, _name in [
             (10, "Photograph 10 PP Stickers"), (20, "Photograph 20 PP Stickers"),
@@ -1573,11 +1468,11 @@ class DRWorld(World):
             (70, "Photograph 70 PP Stickers"), (80, "Photograph 80 PP Stickers"),
             (90, "Photograph 90 PP Stickers"), (100, "Photograph all PP Stickers"),
         ]:
-            set_rule(self.multiworld.get_location(_name, self.player),
-                     lambda state, n=_n: _reachable_stickers(state) >= n)
-        set_rule(self.multiworld.get_location("Get 10000 PP in one photo", self.player), lambda state: state.can_reach_region("Rooftop", self.player))
+            registry.set(self.multiworld.get_location(_name, self.player),
+                     _reachable_stickers.at_least(_n))
+        registry.set(self.multiworld.get_location("Get 10000 PP in one photo", self.player), rules.requires(regions=["Rooftop"]))
 
-        set_rule(self.multiworld.get_location("Find Greg's secret passage", self.player), lambda state: state.can_reach_location("Kill Adam", self.player))
+        registry.set(self.multiworld.get_location("Find Greg's secret passage", self.player), rules.reached("Kill Adam"))
         # Endings
         # set_rule(self.multiworld.get_location("Ending B: Don't solve all of the cases but be on the helipad at 12pm", self.player), lambda state: state.can_reach_region("Heliport", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.has("DAY3_11_AM", self.player) and state.has("DAY4_12_PM", self.player) and state.can_reach_location("Ending S: Beat up Brock with your bare fists!", self.player))
         # set_rule(self.multiworld.get_location("Ending C: Solve all of the cases but don't meet Isabela at 10am", self.player), lambda state: state.can_reach_location("Complete Memories", self.player) and state.can_reach_region("Heliport", self.player) and state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.has("DAY3_11_AM", self.player) and state.has("DAY4_12_PM", self.player) and state.can_reach_location("Ending S: Beat up Brock with your bare fists!", self.player))
@@ -1585,27 +1480,49 @@ class DRWorld(World):
         # set_rule(self.multiworld.get_location("Ending E: Don't solve all of the cases and don't be on the helipad at 12pm", self.player), lambda state: state.has("DAY2_06_AM", self.player) and state.has("DAY2_11_AM", self.player) and state.has("DAY3_00_AM", self.player) and state.has("DAY3_11_AM", self.player) and state.has("DAY4_12_PM", self.player) and state.can_reach_location("Complete Backup for Brad", self.player) and state.can_reach_location("Ending S: Beat up Brock with your bare fists!", self.player))
         # set_rule(self.multiworld.get_location("Ending F: Fail to collect all of the bombs in time", self.player), lambda state: state.can_reach_location("Complete Bomb Collector", self.player))
 
-        if not self.options.scoop_sanity:
-            set_rule(self.multiworld.get_location("Survive until 7pm on day 1", self.player), lambda state: state.can_reach_region("Paradise Plaza", self.player))
+        if not scoop_sanity:
+            registry.set(self.multiworld.get_location("Survive until 7pm on day 1", self.player), rules.requires(regions=["Paradise Plaza"]))
 
         # Victory Condition
         self.multiworld.completion_condition[self.player] = lambda state: state.has("Victory", self.player)
 
+        dropped = registry.apply()
+        logging.debug(f"DRDR player {self.player}: {dropped} access rules dropped "
+                      f"as overwritten or parent-region only")
+        self._create_reached_events(rules)
+
+        # Opt-in rule profiling (DRDR_PROFILE_RULES, see RuleProfiler.py).
+        if profiling_enabled():
+            self.rule_profiler = RuleProfiler(self.multiworld.get_player_name(self.player))
+            self.rule_profiler.instrument(self.multiworld.get_regions(self.player))
+
+
+    def _create_reached_events(self, rules: DRRules) -> None:
+        # Every location a rule depends on (rules.reached / rules.event) gets
+        # an addressless twin in the same region with the same, now final,
+        # access rule, holding that location's locked event item. Fill sweeps
+        # the twin as soon as the location itself is reachable.
+        for location_name, item_name in rules.events.items():
+            location = self.multiworld.get_location(location_name, self.player)
+            region = location.parent_region
+            event = DRLocation(self.player, item_name, DRLocationCategory.EVENT, item_name, None, region)
+            event.access_rule = location.access_rule
+            event.place_locked_item(DRItem(item_name, ItemClassification.progression, None, self.player))
+            region.locations.append(event)
 
     def _build_door_overlay_data(self) -> Dict[str, Dict[str, str]]:
         """{scene_code: {vanilla_dest_name: actual_dest_name}} for the Lua
-        DoorPromptOverlay. Source ids are 'SCN_<scene>|<vanilla_target>|door<n>';
-        AREA_NAMES inverts the vanilla code to the on-screen prompt name.
-        No-op redirects are filtered out.
+        DoorPromptOverlay. The source door's scene and vanilla destination
+        come from DOOR_TABLE; AREA_NAMES turns the vanilla code into the
+        on-screen prompt name. No-op redirects are filtered out.
         """
         out: Dict[str, Dict[str, str]] = {}
         for source_id, redirect in (self.door_redirects or {}).items():
-            parts = source_id.split("|")
-            if len(parts) < 3 or not parts[0].startswith("SCN_"):
+            door = DOOR_TABLE.by_id.get(source_id)
+            if door is None:
                 continue
-            src_scene = parts[0][4:]              # strip "SCN_"
-            vanilla_target_code = parts[1]
-            vanilla_target_name = AREA_NAMES.get(vanilla_target_code, vanilla_target_code)
+            src_scene = door.from_area
+            vanilla_target_name = AREA_NAMES.get(door.to_area, door.to_area)
             actual_target_name = redirect.get("target_area_name")
             if not actual_target_name:
                 continue
@@ -1615,30 +1532,63 @@ class DRWorld(World):
             out.setdefault(src_scene, {})[vanilla_target_name] = actual_target_name
         return out
 
+    # Sets placement_rows on every DRDR world in the multiworld to
+    # ([item dr_code received], [(location id, location dr_code, target dr_code)]).
+    # Built by one pass over every filled location, so each DRDR slot reads
+    # only its own rows instead of rescanning the whole multiworld. Each
+    # world drops its rows once fill_slot_data has used them.
+    # Addressless event locations and codeless event items (the rules'
+    # "(Reached)" twins) never reach the client and are left out.
+    @classmethod
+    def _build_placement_index(cls, multiworld: MultiWorld) -> None:
+        players = set(multiworld.get_game_players(cls.game))
+        received: Dict[int, List[int]] = {player: [] for player in players}
+        owned: Dict[int, List[tuple]] = {player: [] for player in players}
+
+        for location in multiworld.get_filled_locations():
+            item = location.item
+            if item.player in players and item.code is not None:
+                received[item.player].append(name_to_dr_code[item.name])
+
+            if location.player in players and location.address is not None:
+                target = name_to_dr_code[item.name] if item.player == location.player else 0
+                owned[location.player].append((
+                    location.address,
+                    item_dictionary[location_dictionary[location.name].default_item].dr_code,
+                    target,
+                ))
+
+        for player in players:
+            owned[player].sort()
+            multiworld.worlds[player].placement_rows = (received[player], owned[player])
+
+    @classmethod
+    def stage_fill_slot_data(cls, multiworld: MultiWorld) -> None:
+        cls._build_placement_index(multiworld)
+
+    def _encode_location_table(self, rows: List[tuple]) -> List[int]:
+        """Flat [id_delta, address, target, ...] triples for this slot's
+        locations, in id order. Each id is stored as its distance from the
+        previous one (the first from base_id), so runs of consecutive ids in
+        a region encode as 1s. target is the item's dr_code when it belongs
+        to this slot, else 0.
+        """
+        table: List[int] = []
+        previous = self.base_id
+        for location_id, address, target in rows:
+            table += (location_id - previous, address, target)
+            previous = location_id
+        return table
+
     def fill_slot_data(self) -> Dict[str, object]:
-        slot_data: Dict[str, object] = {}
-
-        name_to_dr_code = {item.name: item.dr_code for item in item_dictionary.values()}
-        items_id = []
-        items_address = []
-        locations_id = []
-        locations_address = []
-        locations_target = []
+        # Cores that don't run stage_fill_slot_data get the index built by
+        # the first DRDR slot instead.
+        if self.placement_rows is None:
+            DRWorld._build_placement_index(self.multiworld)
+        received, owned = self.placement_rows
+        self.placement_rows = None
         hints = {}
 
-        for location in self.multiworld.get_filled_locations():
-            if location.item.player == self.player:
-                items_id.append(location.item.code)
-                items_address.append(name_to_dr_code[location.item.name])
-
-            if location.player == self.player:
-                locations_address.append(item_dictionary[location_dictionary[location.name].default_item].dr_code)
-                locations_id.append(location.address)
-                if location.item.player == self.player:
-                    locations_target.append(name_to_dr_code[location.item.name])
-                else:
-                    locations_target.append(0)
-
         goal = self.options.goal.value  # 0 = Ending S, 1 = Ending A, 2 = Savior
         number_of_survivors = self.options.number_of_survivors.value
         death_link_enabled = bool(self.options.death_link.value)
@@ -1675,14 +1625,12 @@ class DRWorld(World):
         costume_chaos_mode      = bool(self.options.costume_chaos_mode.value)
         dlc_outfits_enabled     = bool(self.options.dlc_outfits_enabled.value)
 
-        # PP-bonus location toggle + the per-entry firing-rule data the Lua
-        # side needs to convert MsgEvents fires into AP location checks.
-        # Each entry tells Lua: "when this (list, msg_no) fires the Nth time,
-        # send the corresponding location_name as a check". For "single"
-        # entries the Nth thing is just a single name. For "counted" entries
-        # we send a per-N list plus an all_location_name keyed off all_msg_no.
+        # PP-bonus location toggle + the ids of the AP_TRIGGER_LOCATIONS
+        # entries live this seed. The Lua side (AP_LocationTriggers) expands
+        # each id into its (list, msg_no) watchers and location names from
+        # its own copy of drdr_shared.json.
         pp_bonus_locations_enabled = bool(self.options.pp_bonus_locations.value)
-        pp_bonus_trigger_data: List[Dict[str, Any]] = []
+        pp_bonus_trigger_ids: List[str] = []
         if pp_bonus_locations_enabled:
             for _entry in AP_TRIGGER_LOCATIONS:
                 _names = expand_trigger_location_names(_entry)
@@ -1694,26 +1642,14 @@ class DRWorld(World):
                 # anyway -- pruning here saves the failed lookups.
                 if any(n in self._pp_bonus_excluded_names for n in _names):
                     continue
-                _t = _entry.get("type")
-                _d: Dict[str, Any] = {
-                    "id":      _entry.get("id"),
-                    "list":    _entry.get("list"),
-                    "msg_no":  _entry.get("msg_no"),
-                    "type":    _t,
-                }
-                if _t == "single":
-                    _d["location_name"] = _entry.get("location_name")
-                elif _t == "counted":
-                    # Per-count names: index N-1 -> name for count N
-                    _max = int(_entry.get("max_count", 0))
-                    # The first _max items in _names are the per-count names
-                    _d["count_names"] = _names[:_max]
-                    if _entry.get("all_msg_no") is not None:
-                        _d["all_msg_no"]      = _entry["all_msg_no"]
-                        _d["all_location_name"] = _entry.get("all_location_name")
-                pp_bonus_trigger_data.append(_d)
-
-        slot_data = {
+                pp_bonus_trigger_ids.append(_entry["id"])
+
+        # Layout (see SLOT_DATA_VERSION): every option appears once,
+        # under "options". Data that isn't an option stays top level, and
+        # scoop_order and the door tables are left out when unused. Items
+        # are sent as dr_codes only, since an item's id is base_id + dr_code.
+        slot_data: Dict[str, object] = {
+            "slot_data_version": SLOT_DATA_VERSION,
             "options": {
                 "goal": goal,
                 "number_of_survivors": number_of_survivors,
@@ -1721,7 +1657,7 @@ class DRWorld(World):
                 "death_link": death_link_enabled,
                 "restricted_item_mode": restricted_item_mode_enabled,
                 "door_randomizer": door_randomizer_enabled,
-                "door_randomizer_mode": door_randomizer_mode,
+                "door_randomizer_mode": door_randomizer_mode,  # 0 = chaos, 1 = paired
                 "scoop_sanity": scoop_sanity_enabled,
                 "exclude_levels": exclude_levels_enabled,
                 "exclude_levels_above": self.options.exclude_levels_above.value,
@@ -1740,44 +1676,23 @@ class DRWorld(World):
                 "dlc_outfits_enabled": dlc_outfits_enabled,
                 "pp_bonus_locations": pp_bonus_locations_enabled,
             },
-            "goal": goal,
-            "number_of_survivors": number_of_survivors,
-            "death_link": death_link_enabled,
-            "restricted_item_mode": restricted_item_mode_enabled,
-            "door_randomizer": door_randomizer_enabled,
-            "door_randomizer_mode": door_randomizer_mode,  # For Lua: 0 = chaos, 1 = paired
-            "door_redirects": self.door_redirects if door_randomizer_enabled else {},
-            # Per-scene {vanilla_dest: actual_dest} for the Lua door-prompt
-            # overlay. Empty when door_randomizer is off.
-            "door_overlay_data": (
-                self._build_door_overlay_data() if door_randomizer_enabled else {}
-            ),
-            "scoop_sanity": scoop_sanity_enabled,
-            "exclude_levels": exclude_levels_enabled,
-            "scoop_order": self.scoop_order if scoop_sanity_enabled else {},
-            # Player-stats slot data (read by Lua on slot connect)
-            "vanilla_progression": vanilla_progression_value,
-            "trap_percentage": trap_percentage,
-            "hostile_survivor_count_min": hostile_min,
-            "hostile_survivor_count_max": hostile_max,
-            "cult_limited": cult_limited_enabled,
-            "night_mode_enabled": night_mode_enabled,
-            "hardcore_zombies_enabled": hardcore_zombies_enabled,
-            "random_starting_costume": random_starting_costume,
-            "costume_chaos_mode": costume_chaos_mode,
-            "dlc_outfits_enabled": dlc_outfits_enabled,
-            "pp_bonus_locations": pp_bonus_locations_enabled,
-            "pp_bonus_trigger_data": pp_bonus_trigger_data,
+            "pp_bonus_trigger_ids": pp_bonus_trigger_ids,
             "hints": hints,
             "seed": self.multiworld.seed_name,
             "slot": self.multiworld.player_name[self.player],
             "base_id": self.base_id,
-            "locationsId": locations_id,
-            "locationsAddress": locations_address,
-            "locationsTarget": locations_target,
-            "itemsId": items_id,
-            "itemsAddress": items_address
+            "locations": self._encode_location_table(owned),
+            "items": received,
         }
+        if door_randomizer_enabled:
+            # [source_index, target_index, ...] into the drdr_shared.json
+            # door table; the Lua side looks the geometry up locally.
+            slot_data["door_redirects"] = encode_door_redirects(self.door_redirects)
+            # Per-scene {vanilla_dest: actual_dest} for the Lua door-prompt
+            # overlay.
+            slot_data["door_overlay_data"] = self._build_door_overlay_data()
+        if scoop_sanity_enabled and self.scoop_order:
+            slot_data["scoop_order"] = self.scoop_order
 
         return slot_data
 
@@ -1790,4 +1705,7 @@ class DRWorld(World):
 
     def generate_output(self, output_directory: str) -> None:
         # Door map HTML is now generated on-demand by the Lua-side DoorVisualizer
-        pass
+        if self.rule_profiler is not None:
+            file_name = f"{self.multiworld.get_out_file_name_base(self.player)}_rule_profile.txt"
+            with open(os.path.join(output_directory, file_name), "w", encoding="utf-8") as f:
+                f.write(self.rule_profiler.report())
@@ -1,6 +1,7 @@
 # apworld/drdr/shared_data.py
 # Single source of truth for static data shared between Python (AP generation)
-# and Lua (in-game enforcement): areas, time keys, items, survivors, stickers.
+# and Lua (in-game enforcement): areas, time keys, items, survivors, stickers,
+# trigger locations and door geometry.
 #
 # The canonical JSON lives at source/data/drdr_shared.json (shipped alongside
 # the Lua mod). A copy is committed here at apworld/drdr/drdr_shared.json so
@@ -74,6 +75,12 @@ SCHEMA_VERSION: int = _DATA.get("schema_version", 0)
 AREAS: List[Dict[str, Any]] = _DATA.get("areas", [])
 TIME_KEYS: List[Dict[str, Any]] = _DATA.get("time_keys", [])
 ITEMS: List[Dict[str, Any]] = _DATA.get("items", [])
+# Survivors with an AP "Rescue X" location carry its location_name and the
+# access-rule fields DRWorld.set_rules builds from: required_regions,
+# ep_shutter, scoop_items (ScoopSanity), time_keys (vanilla),
+# requires_locations, vanilla_requires_locations and
+# restricted_mode_items_any. Stickers carry the same as RequiredRegions,
+# EpShutter, TimeKeys and RequiresLocations.
 SURVIVORS: List[Dict[str, Any]] = _DATA.get("survivors", [])
 STICKERS: List[Dict[str, Any]] = _DATA.get("stickers", [])
 
@@ -87,6 +94,11 @@ SCOOP_SURVIVORS: Dict[str, List[str]] = _DATA.get("scoop_survivors", {})
 # "ap_trigger_locations" section of drdr_shared.json for the schema.
 AP_TRIGGER_LOCATIONS: List[Dict[str, Any]] = _DATA.get("ap_trigger_locations", [])
 
+# Door table: one row per door (id "SCN_<from>|<to>|door<n>", from/to area
+# codes, door_no, spawn position and angle). The row's position is the door
+# index slot_data's door_redirects refers to, so rows are only ever appended.
+DOORS: List[Dict[str, Any]] = _DATA.get("doors", [])
+
 
 def expand_trigger_location_names(entry: Dict[str, Any]) -> List[str]:
     """Generate the full list of location names produced by one trigger entry.
@@ -0,0 +1,5 @@
+from test.bases import WorldTestBase
+
+
+class DRTestBase(WorldTestBase):
+    game = "Dead Rising Deluxe Remaster"
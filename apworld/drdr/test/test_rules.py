@@ -0,0 +1,21 @@
+from . import DRTestBase
+from ..Rules import rule_reads_options
+
+
+class TestRulesDontReadOptions(DRTestBase):
+    """Every option branch in set_rules is taken at build time; a rule that
+    still reads self.options would re-run that branch on every evaluation."""
+
+    def test_no_rule_reads_options(self) -> None:
+        for region in self.multiworld.get_regions(self.player):
+            for spot in (*region.locations, *region.exits):
+                with self.subTest(spot.name):
+                    self.assertFalse(rule_reads_options(spot.access_rule))
+
+
+class TestScoopSanityRulesDontReadOptions(TestRulesDontReadOptions):
+    options = {"scoop_sanity": 1}
+
+
+class TestDoorRandomizerRulesDontReadOptions(TestRulesDontReadOptions):
+    options = {"door_randomizer": 1, "scoop_sanity": 1, "restricted_item_mode": 1}
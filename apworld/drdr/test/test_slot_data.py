@@ -0,0 +1,19 @@
+from . import DRTestBase
+from ..DoorRandomization import DOOR_TABLE, decode_door_redirects
+
+
+class TestChaosDoorSlotData(DRTestBase):
+    options = {"door_randomizer": 1, "door_randomizer_mode": 0}
+
+    def test_fill_slot_data(self) -> None:
+        slot_data = self.world.fill_slot_data()
+        pairs = slot_data["door_redirects"]
+        self.assertTrue(pairs)
+        self.assertEqual(len(pairs) % 2, 0)
+        self.assertTrue(all(0 <= index < len(DOOR_TABLE.doors) for index in pairs))
+        self.assertEqual(decode_door_redirects(pairs), self.world.door_redirects)
+        self.assertIn("door_overlay_data", slot_data)
+
+
+class TestPairedDoorSlotData(TestChaosDoorSlotData):
+    options = {"door_randomizer": 1, "door_randomizer_mode": 1}
@@ -49,6 +49,7 @@ AP.EventFlagExplorer = require("DRAP/debug/EventFlagExplorer")
 
 local Shared = require("DRAP/Shared")
 local SharedData = require("DRAP/SharedData")
+local SlotData = require("DRAP/SlotData")
 local log = Shared.create_logger("DRAP")
 
 ------------------------------------------------------------
@@ -334,7 +335,7 @@ local function run_slot_connect(slot_data)
 
     -- Apply door redirects if enabled
     if door_randomizer_enabled and AP.DoorRandomizer then
-        local door_redirects = slot_data.door_redirects
+        local door_redirects = SlotData.door_redirects(slot_data)
         if door_redirects then
             AP.DoorRandomizer.set_redirects(door_redirects)
             log("Door randomization activated with " .. tostring(AP.DoorRandomizer.get_redirect_config_count()) .. " redirects")
@@ -430,16 +431,20 @@ local function run_slot_connect(slot_data)
             tostring(starting), tostring(chaos), tostring(dlc)))
     end
 
-    -- PP-bonus AP location triggers. Slot data carries the per-entry mapping
-    -- (msg_no -> location_name(s)) so this Lua module just walks the list,
-    -- registers MsgEvents watchers, and fires AP_BRIDGE.check on each event.
-    -- Disabled cleanly if pp_bonus_locations is off (trigger_data is empty).
+    -- PP-bonus AP location triggers. Slot data names the live entries by id
+    -- (v4+; older slot data carries them pre-expanded) and the module
+    -- registers MsgEvents watchers that fire AP_BRIDGE.check on each event.
+    -- Disabled cleanly if pp_bonus_locations is off (no entries).
     if AP.effects.AP_LocationTriggers then
-        local trigger_data = (type(slot_data) == "table"
-                              and slot_data.pp_bonus_trigger_data) or {}
-        AP.effects.AP_LocationTriggers.setup(trigger_data, AP_BRIDGE)
-        log(string.format("PP-bonus location triggers: %d entries",
-            type(trigger_data) == "table" and #trigger_data or 0))
+        local registered
+        if SlotData.version(slot_data) >= 4 then
+            registered = AP.effects.AP_LocationTriggers.setup_from_ids(
+                slot_data.pp_bonus_trigger_ids or {}, AP_BRIDGE)
+        else
+            registered = AP.effects.AP_LocationTriggers.setup(
+                slot_data.pp_bonus_trigger_data or {}, AP_BRIDGE)
+        end
+        log(string.format("PP-bonus location triggers: %d entries", registered or 0))
     end
 
     -- Door-randomizer in-game overlay. Slot data carries a per-scene table
@@ -488,7 +493,8 @@ end
 --- stack immediately. The restore runs from re.on_frame below.
 AP_BRIDGE.AP_REF.on_slot_connected = function(slot_data)
     if prev_on_slot_connected then pcall(prev_on_slot_connected, slot_data) end
-    pending_slot_connect = slot_data or {}
+    -- Either slot_data layout reads the same from here on (DRAP/SlotData).
+    pending_slot_connect = SlotData.normalize(slot_data)
 end
 
 ------------------------------------------------------------
@@ -4,6 +4,9 @@
 -- DLL-load path below leaves a trace in the log file rather than only in a
 -- message box the player has already dismissed by the time they file a report.
 local Logger = require("DRAP/Logger")
+-- DRAP addition: slot_data v2 keeps options under `options`; normalize()
+-- hoists them so the death_link check below sees them in either layout.
+local SlotData = require("DRAP/SlotData")
 
 local AP = nil
 local load_err = nil
@@ -256,6 +259,7 @@ end
 local function set_slot_connected_handler(callback)
 	function slot_connected_handler(slot_data)
 		Logger.info("AP_REF", "slot connected: " .. tostring(AP_REF.APSlot))
+		slot_data = SlotData.normalize(slot_data)
 
         local tags = {"Lua-APClientPP"}
 
@@ -1,6 +1,7 @@
 -- DRAP/SharedData.lua
 -- Single source of truth for static data shared between Python (AP generation)
--- and Lua (in-game enforcement): areas, time keys, items, survivors, stickers.
+-- and Lua (in-game enforcement): areas, time keys, items, survivors, stickers,
+-- trigger locations and door geometry.
 --
 -- Data lives in drdr_shared.json (shipped under reframework/data/).
 -- The file is loaded lazily on first access and cached.
@@ -87,6 +88,21 @@ function M.scoop_survivors()
     return (data and data.scoop_survivors) or {}
 end
 
+-- PP-bonus / ToDo trigger entries. slot_data (v4+) names the ones live this
+-- seed by id; AP_LocationTriggers expands them into watchers and names.
+function M.ap_trigger_locations()
+    ensure_loaded()
+    return (data and data.ap_trigger_locations) or {}
+end
+
+-- Door table: { id, from_area_code, to_area_code, door_no, position, angle }
+-- per door. slot_data door_redirects (v3+) refer to doors by their 0-based
+-- position in this list.
+function M.doors()
+    ensure_loaded()
+    return (data and data.doors) or {}
+end
+
 function M.schema_version()
     ensure_loaded()
     return data and data.schema_version or nil
@@ -0,0 +1,87 @@
+-- DRAP/SlotData.lua
+-- Reads the slot_data the apworld sends on Connected, in either layout.
+--
+--   v1 (no slot_data_version): every option at the top level (and again
+--      under `options`), parallel locationsId/locationsAddress/
+--      locationsTarget and itemsId/itemsAddress arrays, scoop_order = {}
+--      when unused.
+--   v2: options only under `options`; `locations` is a flat
+--      {id_delta, address, target, ...} array in id order, each id stored
+--      as its distance from the previous one (the first from base_id);
+--      `items` holds dr_codes only (item id = base_id + dr_code); keys
+--      that don't apply to the seed are omitted.
+--   v3: as v2, but door_redirects is a flat {source_index, target_index, ...}
+--      array into the SharedData door table instead of per-door target
+--      areas and spawn positions.
+--   v4: as v3, but pp_bonus_trigger_ids (ids into drdr_shared.json's
+--      ap_trigger_locations) replaces the expanded pp_bonus_trigger_data.
+--
+-- normalize() hoists v2 options to the top level in place, so consumers
+-- keep reading slot_data.<option> regardless of version. The client reads
+-- nothing from the location and item tables, so they are left undecoded.
+
+local M = {}
+
+local Shared = require("DRAP/Shared")
+local SharedData = require("DRAP/SharedData")
+local log = Shared.create_logger("SlotData")
+
+--- @param slot_data table|nil
+--- @return integer 1 for the original layout, else slot_data_version
+function M.version(slot_data)
+    if type(slot_data) ~= "table" then return 1 end
+    return tonumber(slot_data.slot_data_version) or 1
+end
+
+--- Copies v2 `options` to the top level of slot_data (in place) without
+--- overwriting keys already there. v1 tables are returned untouched.
+--- @param slot_data table|nil
+--- @return table
+function M.normalize(slot_data)
+    if type(slot_data) ~= "table" then return {} end
+    local version = M.version(slot_data)
+    if version >= 2 and type(slot_data.options) == "table" then
+        for key, value in pairs(slot_data.options) do
+            if slot_data[key] == nil then
+                slot_data[key] = value
+            end
+        end
+    end
+    if version > 4 then
+        log.warn("slot_data_version " .. tostring(version)
+            .. " is newer than this client understands")
+    end
+    return slot_data
+end
+
+--- Door redirects as door_id -> { target_area, template_door_id, position,
+--- angle }, the table DoorRandomizer.set_redirects takes, whichever layout
+--- sent them. nil when slot_data has none.
+--- @param slot_data table
+--- @return table|nil
+function M.door_redirects(slot_data)
+    local redirects = slot_data.door_redirects
+    if type(redirects) ~= "table" or M.version(slot_data) < 3 then
+        return redirects
+    end
+    local doors = SharedData.doors()
+    local decoded = {}
+    for i = 1, #redirects - 1, 2 do
+        local source = doors[redirects[i] + 1]
+        local target = doors[redirects[i + 1] + 1]
+        if source and target then
+            decoded[source.id] = {
+                target_area = target.to_area_code,
+                template_door_id = target.id,
+                position = target.position,
+                angle = target.angle,
+            }
+        else
+            log.warn(string.format("door_redirects: unknown door index pair %s -> %s",
+                tostring(redirects[i]), tostring(redirects[i + 1])))
+        end
+    end
+    return decoded
+end
+
+return M
@@ -5,9 +5,14 @@
 -- Two trigger shapes: "single" (one location, one fire) and "counted"
 -- (count_names[1..N] + optional all_location_name on the all-X message,
 -- with starting counter bootstrapped from COMPLETED_CHECKS history).
+--
+-- slot_data v4+ sends only the ids of the live entries (setup_from_ids);
+-- the entries themselves are expanded here from drdr_shared.json's
+-- ap_trigger_locations. Older slot_data sends them pre-expanded (setup).
 
 local M = {}
 local MsgEvents = require("DRAP/MsgEvents")
+local SharedData = require("DRAP/SharedData")
 
 local Shared = require("DRAP/Shared")
 local log = Shared.create_logger("AP_LocTriggers")
@@ -152,6 +157,50 @@ local function _register_entry(entry)
     return false
 end
 
+-- Shared-data entry expanded into the shape setup() takes -- the same
+-- names Python's expand_trigger_location_names produces.
+local function _expand_entry(shared)
+    local entry = {
+        id     = shared.id,
+        list   = shared.list,
+        msg_no = shared.msg_no,
+        type   = shared.type,
+    }
+    if shared.type == "single" then
+        entry.location_name = shared.location_name
+    elseif shared.type == "counted" then
+        local names = {}
+        local sing = shared.location_template_singular or ""
+        local plur = shared.location_template_plural or ""
+        for n = 1, tonumber(shared.max_count) or 0 do
+            if n == 1 and sing ~= "" then
+                names[#names + 1] = sing
+            elseif plur ~= "" then
+                names[#names + 1] = (plur:gsub("{n}", tostring(n)))
+            end
+        end
+        entry.count_names = names
+        if shared.all_msg_no ~= nil then
+            entry.all_msg_no = shared.all_msg_no
+            entry.all_location_name = shared.all_location_name
+        end
+    end
+    return entry
+end
+
+-- Expanded entries by id, built once from shared data on first use.
+local _by_id = nil
+
+local function _ensure_index()
+    if _by_id then return end
+    _by_id = {}
+    for _, shared in ipairs(SharedData.ap_trigger_locations()) do
+        if shared.id then
+            _by_id[shared.id] = _expand_entry(shared)
+        end
+    end
+end
+
 -- Public API. Called from main slot-connect with (trigger_data, bridge).
 function M.setup(trigger_data, bridge)
     if _registered then
@@ -182,6 +231,21 @@ function M.setup(trigger_data, bridge)
     return count
 end
 
+-- Public API for slot_data v4+: trigger_ids lists the live entries by id.
+function M.setup_from_ids(trigger_ids, bridge)
+    _ensure_index()
+    local trigger_data = {}
+    for _, id in ipairs(type(trigger_ids) == "table" and trigger_ids or {}) do
+        local entry = _by_id[id]
+        if entry then
+            trigger_data[#trigger_data + 1] = entry
+        else
+            log("unknown trigger id from slot data: " .. tostring(id))
+        end
+    end
+    return M.setup(trigger_data, bridge)
+end
+
 -- Auto-re-register from cached TS state if a script reset left us without
 -- watchers (slot-connect won't refire on reload).
 local function _maybe_auto_reregister()
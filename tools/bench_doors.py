@@ -0,0 +1,168 @@
+"""Benchmark the door randomizer and report layout statistics.
+
+Builds a layout the way generate_door_randomization_for_ap does (same
+seed draw, same make_door_randomizer setup, same builder) over --seeds
+seeds for each door mode and each combination of
+randomize_rooftop_service_hallway and scoop_sanity, and reports per run:
+
+  * successes, failures (the builder raised) and vanilla fallbacks (a
+    layout with no redirects at all);
+  * attempts and reseeds per success, read from the DoorRandomizer and
+    counted over the successes only;
+  * p50/p99/max wall time per layout;
+  * per-door destination frequencies: for every door, how often it led to
+    each area (its vanilla area when it wasn't redirected).
+
+    python tools/bench_doors.py --seeds 100000 --out doors.json
+
+--legacy adds the rejection samplers the shipped builders replaced
+(randomize_with_validation and randomize_paired_with_retry), run with the
+same seeds, for comparison. Those are far slower; use fewer seeds with it.
+
+The JSON written by --out has sorted keys and one run per mode/option
+combination, so two runs can be diffed directly. Needs only the apworld
+sources, not an Archipelago checkout.
+"""
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HERE)
+APWORLD = os.path.join(REPO, "apworld", "drdr")
+
+sys.path.insert(0, APWORLD)
+from DoorRandomization import (  # noqa: E402
+    DOOR_MODE_CHAOS,
+    DOOR_MODE_PAIRED,
+    DOOR_TABLE,
+    make_door_randomizer,
+)
+
+# name: (door mode, DoorRandomizer method). The shipped ones are the
+# methods generate_door_layout calls for that mode.
+ALGORITHMS = {
+    "chaos": (DOOR_MODE_CHAOS, "randomize_incremental"),
+    "paired": (DOOR_MODE_PAIRED, "randomize_paired_constructive"),
+    "chaos-rejection": (DOOR_MODE_CHAOS, "randomize_with_validation"),
+    "paired-rejection": (DOOR_MODE_PAIRED, "randomize_paired_with_retry"),
+}
+SHIPPED = ("chaos", "paired")
+LEGACY = ("chaos-rejection", "paired-rejection")
+
+
+def layout_for(algorithm, seed, rooftop, scoop):
+    """One layout. Returns (redirects, attempts, reseeds)."""
+    _, method = ALGORITHMS[algorithm]
+    # Same seed draw as generate_door_randomization_for_ap.
+    randomizer = make_door_randomizer(
+        random.Random(seed).randint(0, 2 ** 31),
+        randomize_rooftop_service_hallway=rooftop, scoop_sanity=scoop)
+    getattr(randomizer, method)()
+    return randomizer.export_redirects_for_lua(), randomizer.attempts, randomizer.reseeds
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def bench(algorithm, rooftop, scoop, seeds):
+    times = []
+    attempts = []
+    reseeds = []
+    failures = 0
+    vanilla = 0
+    redirect_counts = []
+    destinations = {door.door_id: {} for door in DOOR_TABLE.doors}
+
+    # The randomizer prints a line per layout.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for seed in seeds:
+            t0 = time.perf_counter()
+            try:
+                redirects, tries, reseeded = layout_for(algorithm, seed, rooftop, scoop)
+            except RuntimeError:
+                failures += 1
+                continue
+            times.append(time.perf_counter() - t0)
+            redirect_counts.append(len(redirects))
+            if redirects:
+                attempts.append(tries)
+                reseeds.append(reseeded)
+            else:
+                vanilla += 1
+            for door in DOOR_TABLE.doors:
+                redirect = redirects.get(door.door_id)
+                area = redirect["target_area"] if redirect else door.to_area
+                counts = destinations[door.door_id]
+                counts[area] = counts.get(area, 0) + 1
+
+    times.sort()
+    successes = len(attempts)
+    return {
+        "algorithm": algorithm,
+        "randomize_rooftop_service_hallway": rooftop,
+        "scoop_sanity": scoop,
+        "seeds": len(seeds),
+        "successes": successes,
+        "failures": failures,
+        "vanilla_fallbacks": vanilla,
+        "vanilla_fallback_rate": vanilla / len(seeds) if seeds else 0.0,
+        "attempts_per_success": sum(attempts) / successes if successes else None,
+        "attempts_max": max(attempts, default=0),
+        "reseeds_per_success": sum(reseeds) / successes if successes else None,
+        "reseeds_max": max(reseeds, default=0),
+        "redirects_mean": statistics.fmean(redirect_counts) if redirect_counts else 0.0,
+        "wall_ms": {
+            "p50": percentile(times, 0.50) * 1e3,
+            "p99": percentile(times, 0.99) * 1e3,
+            "max": (times[-1] if times else 0.0) * 1e3,
+            "mean": statistics.fmean(times) * 1e3 if times else 0.0,
+        },
+        "destinations": destinations,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seeds", type=int, default=10000, help="seeds per run")
+    parser.add_argument("--first-seed", type=int, default=1)
+    parser.add_argument("--algorithm", action="append", choices=sorted(ALGORITHMS),
+                        help="algorithm to run (repeatable; default: the shipped ones)")
+    parser.add_argument("--legacy", action="store_true",
+                        help="also run the rejection samplers")
+    parser.add_argument("--out", help="also write the JSON report here")
+    args = parser.parse_args()
+
+    algorithms = list(args.algorithm or SHIPPED)
+    if args.legacy:
+        algorithms += [name for name in LEGACY if name not in algorithms]
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+
+    runs = []
+    for algorithm, rooftop, scoop in itertools.product(algorithms, (False, True), (False, True)):
+        run = bench(algorithm, rooftop, scoop, seeds)
+        runs.append(run)
+        print(f"{algorithm:<17} rooftop={int(rooftop)} scoop={int(scoop)}  "
+              f"ok={run['successes']} fail={run['failures']} vanilla={run['vanilla_fallbacks']}  "
+              f"attempts/ok={run['attempts_per_success'] or 0:.2f} "
+              f"reseeds/ok={run['reseeds_per_success'] or 0:.3f}  "
+              f"p50={run['wall_ms']['p50']:.3f}ms p99={run['wall_ms']['p99']:.3f}ms")
+
+    if args.out:
+        report = {"first_seed": args.first_seed, "seeds": args.seeds, "runs": runs}
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
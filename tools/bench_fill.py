@@ -0,0 +1,192 @@
+"""Time DRDR generation and fill against an Archipelago checkout.
+
+Builds a multiworld of --slots DRDR players (ScoopSanity by default), runs
+the generation steps and Fill.distribute_items_restrictive, and reports the
+wall time of each phase. With --baseline REF the same seeds are also run
+against `git archive REF apworld/drdr`, so a logic change can be measured
+against the tree it replaces:
+
+    python tools/bench_fill.py --archipelago ~/Archipelago --slots 8 \\
+        --seeds 5 --baseline HEAD~1
+
+The "sweep" phase isolates reachability cost from fill's placement work: it
+collects the progression pool one item at a time into a fresh state and
+recomputes every reachable location after each item, --sweeps times. Use it
+to compare region-graph changes, e.g. the door-randomizer hub:
+
+    python tools/bench_fill.py --archipelago ~/Archipelago --slots 4 \\
+        --option door_randomizer=1 --baseline HEAD~1
+
+Each tree runs in its own interpreter (both register the same game name).
+The Archipelago checkout must not have DRDR installed in worlds/ or
+custom_worlds/ -- the apworld under test is imported as worlds.drdr directly.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HERE)
+APWORLD = os.path.join(REPO, "apworld", "drdr")
+
+DEFAULT_OPTIONS = {"scoop_sanity": 1}
+
+GEN_STEPS = ("generate_early", "create_regions", "create_items", "set_rules",
+             "connect_entrances", "generate_basic", "pre_fill")
+
+
+def parse_option(text):
+    name, _, value = text.partition("=")
+    try:
+        return name, int(value)
+    except ValueError:
+        return name, value
+
+
+def sweep(multiworld, state_type):
+    """Collect the progression pool item by item, rechecking every location."""
+    locations = multiworld.get_locations()
+    state = state_type(multiworld)
+    reachable = 0
+    for item in [item for item in multiworld.itempool if item.advancement]:
+        state.collect(item, True)
+        reachable = sum(1 for location in locations if location.can_reach(state))
+    return reachable
+
+
+def run_one(archipelago, world_dir, slots, seed, options, sweeps):
+    """Runs inside the child interpreter. Returns {phase: seconds}."""
+    sys.path.insert(0, archipelago)
+    os.chdir(archipelago)
+    from argparse import Namespace
+    from BaseClasses import MultiWorld, CollectionState
+    from Fill import distribute_items_restrictive
+    import worlds  # noqa: F401 -- loads the host's world registry first
+    from worlds.AutoWorld import call_all
+
+    spec = importlib.util.spec_from_file_location(
+        "worlds.drdr", os.path.join(world_dir, "__init__.py"),
+        submodule_search_locations=[world_dir])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["worlds.drdr"] = module
+    spec.loader.exec_module(module)
+    world_type = module.DRWorld
+
+    multiworld = MultiWorld(slots)
+    multiworld.game = {p: world_type.game for p in multiworld.player_ids}
+    multiworld.player_name = {p: f"DRDR{p}" for p in multiworld.player_ids}
+    multiworld.set_seed(seed)
+    args = Namespace()
+    for name, option in world_type.options_dataclass.type_hints.items():
+        value = options.get(name, option.default)
+        setattr(args, name, {p: option.from_any(value) for p in multiworld.player_ids})
+    multiworld.set_options(args)
+    multiworld.state = CollectionState(multiworld)
+
+    phases = {}
+    start = time.perf_counter()
+    for step in GEN_STEPS:
+        t0 = time.perf_counter()
+        call_all(multiworld, step)
+        phases[step] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(sweeps):
+        sweep(multiworld, CollectionState)
+    phases["sweep"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    distribute_items_restrictive(multiworld)
+    phases["fill"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    if not multiworld.can_beat_game(CollectionState(multiworld)):
+        raise RuntimeError(f"seed {seed} is not beatable")
+    phases["can_beat_game"] = time.perf_counter() - t0
+    # The sweep phase is a measurement, not part of generation.
+    phases["total"] = time.perf_counter() - start - phases["sweep"]
+    return phases
+
+
+def extract_ref(ref, dest):
+    archive = subprocess.run(["git", "-C", REPO, "archive", ref, "apworld/drdr"],
+                             check=True, capture_output=True).stdout
+    path = os.path.join(dest, "ref.tar")
+    with open(path, "wb") as f:
+        f.write(archive)
+    with tarfile.open(path) as tar:
+        tar.extractall(dest)
+    return os.path.join(dest, "apworld", "drdr")
+
+
+def bench_tree(args, world_dir, options):
+    runs = []
+    for seed in range(args.first_seed, args.first_seed + args.seeds):
+        child = subprocess.run(
+            [sys.executable, __file__, "--child", "--archipelago", args.archipelago,
+             "--world-dir", world_dir, "--slots", str(args.slots),
+             "--first-seed", str(seed), "--sweeps", str(args.sweeps),
+             "--options-json", json.dumps(options)],
+            capture_output=True, text=True)
+        if child.returncode:
+            sys.stderr.write(child.stderr)
+            raise SystemExit(f"seed {seed} failed in {world_dir}")
+        runs.append(json.loads(child.stdout.strip().splitlines()[-1]))
+    return runs
+
+
+def summarize(label, runs):
+    phases = [p for p in runs[0] if p in ("set_rules", "sweep", "fill", "can_beat_game", "total")]
+    return {label: {p: statistics.median(r[p] for r in runs) for p in phases}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--archipelago", required=True, help="path to an Archipelago checkout")
+    parser.add_argument("--slots", type=int, default=4)
+    parser.add_argument("--seeds", type=int, default=3)
+    parser.add_argument("--first-seed", type=int, default=1)
+    parser.add_argument("--sweeps", type=int, default=3,
+                        help="reachability sweeps per seed (0 to skip)")
+    parser.add_argument("--option", action="append", default=[],
+                        help="DRDR option override, e.g. door_randomizer=1")
+    parser.add_argument("--baseline", help="git ref to compare against")
+    parser.add_argument("--out", help="also write the JSON summary here")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--world-dir", default=APWORLD, help=argparse.SUPPRESS)
+    parser.add_argument("--options-json", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        phases = run_one(os.path.abspath(args.archipelago), args.world_dir,
+                         args.slots, args.first_seed, json.loads(args.options_json), args.sweeps)
+        print(json.dumps(phases))
+        return
+
+    options = dict(DEFAULT_OPTIONS)
+    options.update(parse_option(o) for o in args.option)
+    summary = {"slots": args.slots, "seeds": args.seeds, "options": options}
+    summary.update(summarize("current", bench_tree(args, APWORLD, options)))
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as tmp:
+            base_dir = extract_ref(args.baseline, tmp)
+            summary.update(summarize(args.baseline, bench_tree(args, base_dir, options)))
+
+    print(f"{args.slots} DRDR slots, {args.seeds} seeds, options {options} (median seconds)")
+    labels = [k for k in summary if isinstance(summary[k], dict) and k != "options"]
+    for phase in summary["current"]:
+        row = "  ".join(f"{label}={summary[label][phase]:.3f}" for label in labels)
+        if args.baseline and summary["current"][phase]:
+            row += f"  speedup={summary[args.baseline][phase] / summary['current'][phase]:.2f}x"
+        print(f"  {phase:<14} {row}")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()